@@ -6,19 +6,32 @@ Uses Groq (Llama 3.3 70B) for fast, free inference.
 
 import os
 import json
+import asyncio
 import logging
+import pandas as pd
 from datetime import datetime, date
 from typing import Optional
 from dotenv import load_dotenv
 
 from groq import Groq
 
-from monday_client import MondayClient, MondayAPIError
+from monday_client import AsyncMondayClient, MondayAPIError
+from snapshot_store import DEFAULT_SNAPSHOT_PATH, load_snapshot, save_snapshot
 from data_cleaner import (
-    clean_deals_df,
-    clean_workorders_df,
+    DealsCleaner,
+    WorkOrdersCleaner,
+    clear_normalizer_caches,
+    column_plan,
+    compact_frame,
     compute_caveats,
     format_caveats_text,
+    normalizer_cache_stats,
+    required_column_ids,
+    typed_column_ids,
+    DEAL_DTYPES,
+    DEAL_FIELD_KEYWORDS,
+    WORKORDER_DTYPES,
+    WORKORDER_FIELD_KEYWORDS,
 )
 from analytics import (
     revenue_analytics,
@@ -40,6 +53,25 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Board kind → (cleaner class, field keyword hints, label for logs).
+# The kind also names the agent attribute (`<kind>_df`) and result keys.
+_BOARD_KINDS = {
+    "deals": (DealsCleaner, DEAL_FIELD_KEYWORDS, "deals"),
+    "workorders": (WorkOrdersCleaner, WORKORDER_FIELD_KEYWORDS, "work orders"),
+}
+_BOARD_ENV_VARS = {"deals": "DEALS_BOARD_ID", "workorders": "WORKORDERS_BOARD_ID"}
+_FRAME_DTYPES = {"deals": DEAL_DTYPES, "workorders": WORKORDER_DTYPES}
+
+
+def _parse_board_ids(value: str) -> list:
+    """Comma-separated board ids → ordered list without blanks or duplicates."""
+    ids = []
+    for part in (value or "").split(","):
+        part = part.strip()
+        if part and part not in ids:
+            ids.append(part)
+    return ids
+
 
 def _get_current_quarter_label() -> str:
     """Return readable quarter label like 'Q1 FY2026 (Apr–Jun 2026)'."""
@@ -79,9 +111,27 @@ class SkylarkAgent:
             logger.info("✅ LLM: Groq (llama-3.3-70b-versatile)")
 
         # Initialize Monday.com client
-        self.monday = MondayClient()
-        self.deals_board_id = os.getenv("DEALS_BOARD_ID", "")
-        self.wo_board_id = os.getenv("WORKORDERS_BOARD_ID", "")
+        self.monday = AsyncMondayClient()
+        # kind → board ids; several (e.g. regional Deals boards) are merged
+        self.board_ids = {kind: _parse_board_ids(os.getenv(var, "")) for kind, var in _BOARD_ENV_VARS.items()}
+        self.delta_sync = os.getenv("MONDAY_DELTA_SYNC", "true").lower() in ("1", "true", "yes")
+        self.snapshot_path = os.getenv("MONDAY_SNAPSHOT_PATH", DEFAULT_SNAPSHOT_PATH)
+        self.change_probe = os.getenv("MONDAY_CHANGE_PROBE", "true").lower() in ("1", "true", "yes")
+
+        # board_id → column ids the cleaners read; learned from the last schema
+        # seen so later refreshes download only those column_values.
+        self._column_allowlists = {}
+        self._schema_fingerprints = {}
+
+        # board_id → that board's cleaned frame; `<kind>_df` concatenates them
+        self._board_frames = {}
+        # board_id → change probe taken before the last successful fetch
+        self._board_probes = {}
+        # kind → {rows, bytes_before, bytes_after} of the last compacted frame
+        self._frame_memory = {}
+        # Serialises refreshes (startup task vs /refresh) and webhook patches,
+        # which all rewrite the frames and the delta-sync cache
+        self._refresh_lock = asyncio.Lock()
 
         # Data cache
         self.deals_df = None
@@ -93,50 +143,348 @@ class SkylarkAgent:
         # Pre-compute analytics context string
         self._analytics_context_str = ""
 
-    def refresh_data(self) -> dict:
+    def _configured_boards(self, result: dict) -> list:
+        """[(kind, board_id)] for configured boards; notes missing ones in result."""
+        boards = []
+        for kind, env_var in _BOARD_ENV_VARS.items():
+            if self.board_ids[kind]:
+                boards.extend((kind, board_id) for board_id in self.board_ids[kind])
+            else:
+                result[f"{kind}_error"] = f"{env_var} not configured."
+        return boards
+
+    def _board_kind(self, board_id: str) -> Optional[str]:
+        for kind, board_ids in self.board_ids.items():
+            if board_id in board_ids:
+                return kind
+        return None
+
+    def _learn_schema(self, kind: str, board_id: str, schema: dict) -> bool:
+        """
+        Rebuild schema-derived state (column allowlist, typed columns) when
+        the board's column layout changed or is seen for the first time, and
+        drop the columns outside the allowlist from the board's sync cache.
+        Returns True when a previously known layout changed: items fetched
+        under the old allowlist may then lack the columns the cleaner reads.
+        """
+        cleaner_cls, field_keywords, _ = _BOARD_KINDS[kind]
+        # Decode by column type only what the cleaner parses as amounts or dates
+        self.monday.typed_columns[board_id] = typed_column_ids(schema, field_keywords, cleaner_cls.TYPED_FIELDS)
+        fingerprint = schema.get("fingerprint")
+        known = self._schema_fingerprints.get(board_id)
+        if fingerprint is not None and known == fingerprint:
+            return False
+        allowlist = self._column_allowlists[board_id] = required_column_ids(schema, field_keywords)
+        self._schema_fingerprints[board_id] = fingerprint
+        self.monday.restrict_sync_columns(board_id, allowlist)
+        unmatched = [f for f, match in column_plan(schema, field_keywords).items() if match["column_id"] is None]
+        if unmatched:
+            logger.warning(f"Board {board_id} ({kind}): no column matches {', '.join(unmatched)}")
+        return known is not None and fingerprint is not None
+
+    def _store_board(self, kind: str, board_id: str, schema: dict, cleaner=None):
+        """Finish cleaning one board and keep its frame, tagged with source_board."""
+        self._learn_schema(kind, board_id, schema)
+        df = (cleaner or _BOARD_KINDS[kind][0](schema)).to_frame()
+        return self._set_board_frame(board_id, df)
+
+    def _set_board_frame(self, board_id: str, df: pd.DataFrame) -> pd.DataFrame:
+        if not df.empty:
+            df = df.assign(source_board=board_id)
+        self._board_frames[board_id] = df
+        return df
+
+    def _publish(self, kind: str, measure: bool = False):
+        """
+        Concatenate the frames of every loaded board of this kind into
+        `<kind>_df`, with compact dtypes (per-board frames keep plain ones so
+        rows can be patched and concatenated freely). measure=True records
+        the frame's memory before and after compaction.
+        """
+        frames = [self._board_frames[bid] for bid in self.board_ids[kind] if bid in self._board_frames]
+        if not frames:
+            return
+        non_empty = [df for df in frames if not df.empty]
+        if len(non_empty) > 1:
+            df = pd.concat(non_empty, ignore_index=True)
+        else:
+            df = non_empty[0] if non_empty else frames[0]
+        df, report = compact_frame(df, _FRAME_DTYPES[kind], measure)
+        if report is not None:
+            self._frame_memory[kind] = report
+        setattr(self, f"{kind}_df", df)
+
+    async def _probe_boards(self, board_ids: list) -> dict:
+        """Change probe for every board, or {} if it could not be taken."""
+        if not self.change_probe or not board_ids:
+            return {}
+        try:
+            return await self.monday.probe_boards(board_ids)
+        except MondayAPIError as e:
+            logger.info(f"Change probe failed, refreshing anyway: {e}")
+            return {}
+
+    def _unchanged(self, board_ids: list, probes: dict) -> bool:
+        """True when every board is loaded and its probe matches the last fetched state."""
+        return bool(probes) and all(
+            board_id in self._board_frames
+            and isinstance(probes.get(board_id), dict)
+            and self._board_probes.get(board_id) == probes[board_id]
+            for board_id in board_ids
+        )
+
+    def _fetch_diagnostics(self, board_ids: list) -> dict:
+        return {
+            "connections": self.monday.connection_stats(),
+            "fetch": self.monday.fetch_stats(),
+            "pagination": self.monday.pagination_stats(),
+            "complexity_budget": self.monday.budget.snapshot(),
+            "circuit": self.monday.breaker.snapshot(),
+            "page_sizes": {bid: self.monday.page_tuner.limit(bid) for bid in board_ids},
+            "normalizers": normalizer_cache_stats(),
+        }
+
+    async def _fetch_boards(self, board_ids: list, full: bool, on_page, result: dict, on_schema=None) -> list:
+        """
+        Download boards with delta sync (full=True discards the sync cache)
+        or as a page stream, handing items to on_page(board_id, schema, items)
+        and each schema, before its items are decoded, to on_schema.
+        Delta sync hands over item dicts (its cache is per item); only the
+        plain stream decodes pages columnar.
+        Returns a list of schema dicts or exceptions, in board_ids order.
+        """
+        if self.delta_sync:
+            schemas = await self.monday.stream_sync_boards_data(
+                board_ids, on_page, full=full, columns=self._column_allowlists, on_schema=on_schema
+            )
+            result.setdefault("sync", {}).update({bid: self.monday.last_sync_changes.get(bid) for bid in board_ids})
+            return schemas
+
+        # Pages are cleaned as they arrive and dropped straight after
+        return await self.monday.stream_boards_data(
+            board_ids, on_page, columns=self._column_allowlists, columnar=True, on_schema=on_schema
+        )
+
+    def _rebuild_analytics(self):
+        if self.deals_df is not None and self.workorders_df is not None:
+            self.caveats = compute_caveats(self.deals_df, self.workorders_df)
+            self._build_analytics_context()
+
+    async def refresh_data(self, full: bool = False) -> dict:
         """
-        Fetch and clean data from both Monday.com boards.
+        Fetch and clean data from every configured Monday.com board.
+        All boards are fetched concurrently, so latency tracks the largest one;
+        boards of the same kind are cleaned with their own schema, then merged.
+        With delta sync enabled only items changed since the previous refresh
+        are downloaded; full=True forces a complete re-download.
+        A one-request change probe runs first: when no board moved since the
+        last refresh, cached frames and analytics are kept and nothing else is
+        fetched (result["unchanged"] is True).
+        Overlapping calls run one after the other.
         Returns summary of records loaded.
         """
+        async with self._refresh_lock:
+            return await self._refresh(full)
+
+    async def _refresh(self, full: bool) -> dict:
         logger.info("Refreshing data from Monday.com...")
         result = {}
 
-        # Fetch Deals board
-        if self.deals_board_id:
-            try:
-                deals_schema, deals_raw = self.monday.get_board_data(self.deals_board_id)
-                self.deals_df = clean_deals_df(deals_raw, deals_schema)
-                result["deals_loaded"] = len(self.deals_df)
-                logger.info(f"Loaded {len(self.deals_df)} deals")
-            except MondayAPIError as e:
-                logger.error(f"Failed to load deals: {e}")
-                result["deals_error"] = str(e)
-                self.deals_df = None
-        else:
-            result["deals_error"] = "DEALS_BOARD_ID not configured."
+        boards = self._configured_boards(result)
+        board_ids = [bid for _, bid in boards]
+        kinds = dict((bid, kind) for kind, bid in boards)
+        cleaners = {}
+        self.monday.reset_fetch_stats()
+        clear_normalizer_caches()
+
+        probes = await self._probe_boards(board_ids)
+        if not full and self._unchanged(board_ids, probes):
+            logger.info("Monday.com boards unchanged since last refresh — keeping cached data")
+            result["unchanged"] = True
+            for kind in _BOARD_KINDS:
+                df = getattr(self, f"{kind}_df")
+                if df is not None:
+                    result[f"{kind}_loaded"] = len(df)
+            result.update(self._fetch_diagnostics(board_ids))
+            self.last_refresh = datetime.now()
+            return result
+
+        def _on_page(board_id, schema, items):
+            if board_id not in cleaners:
+                cleaners[board_id] = _BOARD_KINDS[kinds[board_id]][0](schema)
+            cleaners[board_id].add_page(items)
+
+        relaid = []
+
+        def _on_schema(board_id, schema):
+            # Runs before the board's follow-up pages are requested, so even
+            # a first download only fetches the allowlisted columns
+            if self._learn_schema(kinds[board_id], board_id, schema) and board_id not in relaid:
+                relaid.append(board_id)
+
+        schemas = await self._fetch_boards(board_ids, full, _on_page, result, _on_schema)
+
+        if relaid:
+            # Fetched (and, with delta sync, cached) under the old column
+            # allowlist — download these boards again with the new one
+            logger.info(f"Column layout changed on {relaid}, re-fetching with the new column allowlist")
+            for board_id in relaid:
+                cleaners.pop(board_id, None)
+            refetched = dict(zip(relaid, await self._fetch_boards(relaid, True, _on_page, result, _on_schema)))
+            schemas = [refetched.get(bid, outcome) for bid, outcome in zip(board_ids, schemas)]
+
+        loaded = {}
+        result["boards"] = {}
+        for (kind, board_id), outcome in zip(boards, schemas):
+            if isinstance(outcome, BaseException) and not isinstance(outcome, MondayAPIError):
+                raise outcome
+            label = f"{_BOARD_KINDS[kind][2]} (board {board_id})"
+            if isinstance(outcome, MondayAPIError):
+                errors = [e for e in (result.get(f"{kind}_error"), str(outcome)) if e]
+                result[f"{kind}_error"] = "; ".join(dict.fromkeys(errors))
+                stale = board_id in self._board_frames
+                result["boards"][board_id] = {"kind": kind, "error": str(outcome), "stale": stale}
+                if stale:
+                    # Monday.com degraded: keep answering from the last good data
+                    logger.warning(f"Failed to refresh {label}, serving cached data: {outcome}")
+                    result[f"{kind}_stale"] = True
+                else:
+                    logger.error(f"Failed to load {label}: {outcome}")
+                continue
+            df = await asyncio.to_thread(self._store_board, kind, board_id, outcome, cleaners.get(board_id))
+            loaded[board_id] = outcome
+            if isinstance(probes.get(board_id), dict):
+                self._board_probes[board_id] = probes[board_id]
+            else:
+                self._board_probes.pop(board_id, None)
+            result["boards"][board_id] = {"kind": kind, "loaded": len(df)}
+            logger.info(f"Loaded {len(df)} {label}")
+
+        for kind in _BOARD_KINDS:
+            self._publish(kind, measure=True)
+            df = getattr(self, f"{kind}_df")
+            if df is not None and any(kinds[bid] == kind for bid in loaded):
+                result[f"{kind}_loaded"] = len(df)
+
+        changed = [bid for bid in loaded if bid in relaid or self.monday.schema_changed.get(str(bid))]
+        if changed:
+            logger.info(f"Board schema changed: {changed}")
+            result["schema_changed"] = changed
+
+        # Compute caveats + analytics cache
+        self._rebuild_analytics()
 
-        # Fetch Work Orders board
-        if self.wo_board_id:
+        if self.snapshot_path and loaded:
             try:
-                wo_schema, wo_raw = self.monday.get_board_data(self.wo_board_id)
-                self.workorders_df = clean_workorders_df(wo_raw, wo_schema)
-                result["workorders_loaded"] = len(self.workorders_df)
-                logger.info(f"Loaded {len(self.workorders_df)} work orders")
-            except MondayAPIError as e:
-                logger.error(f"Failed to load work orders: {e}")
-                result["workorders_error"] = str(e)
-                self.workorders_df = None
+                snapshot = await asyncio.to_thread(self._snapshot_boards, board_ids, loaded, cleaners)
+                meta = {"page_sizes": self.monday.page_tuner.export()}
+                await asyncio.to_thread(save_snapshot, snapshot, self.snapshot_path, meta)
+            except OSError as e:
+                logger.warning(f"Could not write snapshot {self.snapshot_path}: {e}")
+
+        result.update(self._fetch_diagnostics(board_ids))
+        result["frame_memory"] = dict(self._frame_memory)
+        if loaded:
+            self.last_refresh = datetime.now()
+        return result
+
+    def _snapshot_boards(self, board_ids: list, loaded: dict, cleaners: dict) -> dict:
+        """
+        Snapshot entries for every board the agent holds data for: boards
+        loaded this refresh, and boards served stale, so a failed board keeps
+        its warm start (from the sync cache, else its previous entry).
+        """
+        if self.delta_sync:
+            state = self.monday.export_sync_state()
+            snapshot = {bid: state[bid] for bid in loaded if bid in state}
         else:
-            result["workorders_error"] = "WORKORDERS_BOARD_ID not configured."
+            # Only the raw values the cleaners kept: enough to rebuild the frames
+            snapshot = {
+                bid: {"schema": schema, "items": cleaners[bid].to_columns() if bid in cleaners else {}}
+                for bid, schema in loaded.items()
+            }
+        stale = [bid for bid in board_ids if bid in self._board_frames and bid not in loaded]
+        if self.delta_sync:
+            snapshot.update((bid, state[bid]) for bid in stale if bid in state)
+        missing = [bid for bid in stale if bid not in snapshot]
+        if missing:
+            previous = (load_snapshot(self.snapshot_path) or {}).get("boards", {})
+            snapshot.update((bid, previous[bid]) for bid in missing if bid in previous)
+        return snapshot
+
+    def load_snapshot(self) -> dict:
+        """
+        Populate the data cache from the on-disk snapshot without touching
+        the network, so the app is useful milliseconds after start. With delta
+        sync the snapshot also seeds the sync state, making the follow-up
+        reconcile refresh an incremental one.
+        Returns summary of records loaded ({} when there is no snapshot).
+        """
+        snapshot = load_snapshot(self.snapshot_path) if self.snapshot_path else None
+        if not snapshot:
+            return {}
 
-        # Compute caveats + analytics cache
-        if self.deals_df is not None and self.workorders_df is not None:
-            self.caveats = compute_caveats(self.deals_df, self.workorders_df)
-            self._build_analytics_context()
+        if self.delta_sync:
+            self.monday.restore_sync_state(snapshot["boards"])
+        self.monday.page_tuner.restore(snapshot["meta"].get("page_sizes"))
 
-        self.last_refresh = datetime.now()
+        result = {}
+        for kind, board_id in self._configured_boards({}):
+            board = snapshot["boards"].get(board_id)
+            if not board:
+                continue
+            cleaner = _BOARD_KINDS[kind][0](board["schema"]).add_page(board["items"])
+            self._store_board(kind, board_id, board["schema"], cleaner)
+            self._publish(kind)
+            result[f"{kind}_loaded"] = len(getattr(self, f"{kind}_df"))
+
+        self.last_refresh = datetime.fromtimestamp(snapshot["saved_at"]) if snapshot.get("saved_at") else None
+        self._rebuild_analytics()
+        result["snapshot_saved_at"] = self.last_refresh.isoformat() if self.last_refresh else None
         return result
 
+    async def apply_webhook_event(self, event: dict) -> dict:
+        """
+        Apply one Monday.com webhook event (item created, updated, deleted or
+        moved) without a board scan: only the affected item is re-read and
+        re-cleaned, its row is spliced into the cached frame and analytics are
+        rebuilt. An item no longer found on the event's board (deleted, or
+        moved to another board) is dropped from it.
+        Waits for a running refresh, so the patch is never overwritten by it.
+        Returns {status, board_id, item_id, action}.
+        """
+        async with self._refresh_lock:
+            return await self._apply_webhook_event(event)
+
+    async def _apply_webhook_event(self, event: dict) -> dict:
+        board_id = str(event.get("boardId", ""))
+        item_id = str(event.get("pulseId") or event.get("itemId") or "")
+        event_type = str(event.get("type", ""))
+        kind = self._board_kind(board_id)
+        if not kind or not item_id:
+            return {"status": "ignored", "reason": "event is not about an item on a tracked board"}
+
+        schema = self.monday.cached_schema(board_id)
+        if schema is None or board_id not in self._board_frames:
+            return {"status": "ignored", "reason": "board not loaded yet"}
+
+        if "delete" in event_type or "archive" in event_type:
+            item = None
+        else:
+            items = await self.monday.get_items([item_id], self._column_allowlists.get(board_id), board_id=board_id)
+            item = items[0] if items else None
+        action = "upsert" if item is not None else "delete"
+
+        self.monday.apply_item_change(board_id, item_id, item)
+        cleaner = _BOARD_KINDS[kind][0](schema)
+        self._set_board_frame(board_id, cleaner.patch_frame(self._board_frames[board_id], item_id, item))
+        self._publish(kind)
+        self.last_refresh = datetime.now()
+        self._rebuild_analytics()
+
+        logger.info(f"Webhook {event_type or 'event'}: {action} item {item_id} on {_BOARD_KINDS[kind][2]}")
+        return {"status": "applied", "board_id": board_id, "item_id": item_id, "action": action}
+
     def _build_analytics_context(self):
         """Pre-compute all analytics and serialize to a context string for injecting into LLM."""
         if self.deals_df is None or self.workorders_df is None:
@@ -440,5 +788,8 @@ class SkylarkAgent:
             "deals_count": len(self.deals_df) if self.deals_df is not None else 0,
             "workorders_count": len(self.workorders_df) if self.workorders_df is not None else 0,
             "last_refresh": self.last_refresh.isoformat() if self.last_refresh else None,
-            "monday_configured": bool(self.deals_board_id and self.wo_board_id),
+            "monday_configured": all(self.board_ids.values()),
+            "boards": self.board_ids,
+            "monday_circuit": self.monday.breaker.snapshot(),
+            "frame_memory": dict(self._frame_memory),
         }
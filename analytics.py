@@ -98,7 +98,7 @@ def revenue_analytics(deals_df: pd.DataFrame, period: Optional[str] = None) -> d
 
     # By sector
     by_sector = (
-        won.groupby("sector")["deal_value"]
+        won.groupby("sector", observed=True)["deal_value"]
         .sum()
         .sort_values(ascending=False)
         .to_dict()
@@ -165,7 +165,7 @@ def pipeline_health(deals_df: pd.DataFrame, period: Optional[str] = None) -> dic
 
     # By sector
     by_sector = (
-        open_deals.groupby("sector")["deal_value"]
+        open_deals.groupby("sector", observed=True)["deal_value"]
         .sum()
         .sort_values(ascending=False)
         .to_dict()
@@ -216,11 +216,12 @@ def operational_metrics(workorders_df: pd.DataFrame) -> dict:
     completed = workorders_df[workorders_df["exec_status"] == "Completed"]
 
     # By execution status
-    by_status = workorders_df["exec_status"].value_counts().to_dict()
+    by_status = workorders_df["exec_status"].value_counts()
+    by_status = by_status[by_status > 0].to_dict()  # categoricals count unused labels too
 
     # By sector
     by_sector = (
-        active.groupby("sector")["amount_excl_gst"]
+        active.groupby("sector", observed=True)["amount_excl_gst"]
         .sum()
         .sort_values(ascending=False)
         .to_dict()
@@ -297,8 +298,8 @@ def cross_board_analysis(deals_df: pd.DataFrame, workorders_df: pd.DataFrame) ->
     total_wo_value = workorders_df["amount_excl_gst"].sum()
 
     # Sector performance cross-board
-    won_by_sector = won.groupby("sector")["deal_value"].sum().rename("won_value")
-    wo_by_sector = workorders_df.groupby("sector")["amount_excl_gst"].sum().rename("wo_value")
+    won_by_sector = won.groupby("sector", observed=True)["deal_value"].sum().rename("won_value")
+    wo_by_sector = workorders_df.groupby("sector", observed=True)["amount_excl_gst"].sum().rename("wo_value")
     sector_perf = pd.concat([won_by_sector, wo_by_sector], axis=1).fillna(0)
     sector_perf["realization_rate"] = (
         sector_perf["wo_value"] / sector_perf["won_value"] * 100
@@ -1,4 +1,6 @@
 import os
+import hmac
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -49,24 +51,41 @@ class RefreshResponse(BaseModel):
 agent: SkylarkAgent = None
 
 
+async def _initial_refresh():
+    """Initial data load (non-blocking on error — API might not be configured yet)."""
+    try:
+        result = await agent.refresh_data()
+        logger.info(f"📊 Data loaded: {result}")
+    except MondayAPIError as e:
+        logger.warning(f"⚠️ Monday.com data not loaded on startup: {e}")
+    except Exception as e:
+        logger.warning(f"⚠️ Data load skipped: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize the agent on startup and load Monday.com data."""
     global agent
     logger.info("🚀 Starting Skylark BI Agent...")
+    reconcile_task = None
 
     try:
         agent = SkylarkAgent()
         logger.info("✅ Agent initialized with Gemini")
 
-        # Initial data load (non-blocking on error — API might not be configured yet)
+        # Warm start from the on-disk snapshot, then reconcile with live data
+        # in the background so startup does not wait on Monday.com.
+        snapshot = {}
         try:
-            result = agent.refresh_data()
-            logger.info(f"📊 Data loaded: {result}")
-        except MondayAPIError as e:
-            logger.warning(f"⚠️ Monday.com data not loaded on startup: {e}")
+            snapshot = agent.load_snapshot()
         except Exception as e:
-            logger.warning(f"⚠️ Data load skipped: {e}")
+            logger.warning(f"⚠️ Snapshot load skipped: {e}")
+
+        if snapshot:
+            logger.info(f"📦 Data loaded from snapshot: {snapshot}")
+            reconcile_task = asyncio.create_task(_initial_refresh())
+        else:
+            await _initial_refresh()
 
     except ValueError as e:
         logger.error(f"❌ Agent init failed: {e}")
@@ -74,6 +93,10 @@ async def lifespan(app: FastAPI):
         agent = None
 
     yield
+    if reconcile_task is not None and not reconcile_task.done():
+        reconcile_task.cancel()
+    if agent is not None:
+        await agent.monday.aclose()
     logger.info("👋 Skylark BI Agent shutting down.")
 
 
@@ -177,26 +200,67 @@ async def leadership_update():
 
 
 @app.post("/refresh", response_model=RefreshResponse)
-async def refresh_data():
+async def refresh_data(full: bool = False):
     """
     Manually trigger a Monday.com data refresh.
     Call this when you know data has been updated.
+    Pass ?full=true to bypass delta sync and re-download every item.
     """
     if agent is None:
         raise HTTPException(status_code=503, detail="Agent not initialized.")
 
     try:
-        result = agent.refresh_data()
-        return RefreshResponse(
-            message="✅ Data refreshed successfully from Monday.com",
-            details=result,
-        )
+        result = await agent.refresh_data(full=full)
+        if any(key.endswith("_stale") for key in result):
+            message = "⚠️ Monday.com is unavailable — serving previously loaded data"
+        else:
+            message = "✅ Data refreshed successfully from Monday.com"
+        return RefreshResponse(message=message, details=result)
     except MondayAPIError as e:
         raise HTTPException(status_code=502, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/webhooks/monday")
+async def monday_webhook(request: Request, secret: Optional[str] = None):
+    """
+    Monday.com webhook receiver (create / update / delete item events).
+    Register it as `/webhooks/monday?secret=<MONDAY_WEBHOOK_SECRET>`; events
+    are refused while no secret is configured.
+    Answers the subscription challenge, then patches only the affected row
+    of the cached data instead of re-downloading the board.
+    """
+    expected = os.getenv("MONDAY_WEBHOOK_SECRET", "")
+    if not expected:
+        raise HTTPException(status_code=403, detail="Webhook disabled: MONDAY_WEBHOOK_SECRET not configured.")
+    if not hmac.compare_digest((secret or "").encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="Invalid webhook secret.")
+
+    try:
+        payload = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Webhook body must be JSON.")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Webhook body must be a JSON object.")
+
+    # Monday.com verifies a new webhook URL by expecting its challenge echoed back
+    if "challenge" in payload:
+        return {"challenge": payload["challenge"]}
+
+    event = payload.get("event") or {}
+    if not isinstance(event, dict):
+        raise HTTPException(status_code=400, detail="Webhook event must be a JSON object.")
+
+    if agent is None:
+        raise HTTPException(status_code=503, detail="Agent not initialized.")
+
+    try:
+        return await agent.apply_webhook_event(event)
+    except MondayAPIError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+
 def _fallback_ui() -> str:
     """Minimal fallback HTML if frontend folder not found."""
     return """
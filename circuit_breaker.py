@@ -0,0 +1,122 @@
+"""
+circuit_breaker.py
+Circuit breaker for the Monday.com API.
+After a run of transient failures (timeouts, 5xx) the breaker opens and
+requests fail fast instead of stalling on a degraded API; the agent keeps
+serving its cached data meanwhile. After a cool-down one probe request is
+let through — success closes the breaker, failure re-opens it.
+"""
+
+import os
+import time
+import logging
+import threading
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = int(os.getenv("MONDAY_BREAKER_FAILURES", "5"))
+DEFAULT_RESET_TIMEOUT = float(os.getenv("MONDAY_BREAKER_RESET_S", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    Call allow() before a request, then record_success() or
+    record_failure() with its outcome, or release() if it has none (a
+    half-open probe that was cancelled, rate-limited or rejected as a bad
+    request). State changes are logged and counted for
+    snapshot().
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        name: str = "monday",
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        # metrics
+        self.transitions = {}
+        self.rejected = 0
+        self.last_change = None
+
+    def _move(self, state: str):
+        if state == self.state:
+            return
+        key = f"{self.state}->{state}"
+        self.transitions[key] = self.transitions.get(key, 0) + 1
+        self.last_change = datetime.now().isoformat()
+        log = logger.warning if state == OPEN else logger.info
+        log(f"Circuit '{self.name}' {key} after {self.consecutive_failures} consecutive failure(s)")
+        self.state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+
+    # ── public API ───────────────────────────────
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now. In half-open state only one probe is allowed."""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._move(HALF_OPEN)
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self.rejected += 1
+            return False
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets a probe through (0 when not open)."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self):
+        with self._lock:
+            self.consecutive_failures = 0
+            self._probe_in_flight = False
+            self._move(CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self.consecutive_failures += 1
+            self._probe_in_flight = False
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                self._move(OPEN)
+                self._opened_at = time.monotonic()
+
+    def release(self):
+        """
+        Hand back the half-open probe slot of a request that ended without
+        an outcome (e.g. cancelled), so the next request can probe instead.
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        """Current state and state-change metrics, for status/diagnostics."""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "rejected": self.rejected,
+                "transitions": dict(self.transitions),
+                "last_change": self.last_change,
+            }
@@ -0,0 +1,36 @@
+"""
+conftest.py — shared pytest fixtures: Monday.com clients wired to the
+in-process mock API (mock_monday_server) over ASGI.
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from mock_monday_server import create_app
+
+
+@pytest.fixture
+def mock_monday():
+    """
+    connect(client, fixture, **options) points an AsyncMondayClient at
+    create_app(fixture, **options) over ASGI and returns the mock's state
+    (request counters). The client's own httpx client and the ASGI one are
+    both closed on teardown.
+    """
+    opened = []
+
+    def connect(client, fixture, **options):
+        app = create_app(fixture, **options)
+        opened.append(client.client)
+        client.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), headers=client.headers)
+        opened.append(client.client)
+        return app.state.mock
+
+    yield connect
+
+    async def _close():
+        for http in opened:
+            await http.aclose()
+
+    asyncio.run(_close())
@@ -4,18 +4,59 @@ Data normalization and cleaning layer for Skylark Drones BI Agent.
 Handles messy real-world data from Monday.com boards.
 """
 
+import os
 import re
 import json
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import compress, repeat
 import pandas as pd
 import numpy as np
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 
+# ──────────────────────────────────────────────
+# Memoization
+# ──────────────────────────────────────────────
+
+# Distinct raw values remembered per normalizer; board columns repeat a small
+# set of values (stages, sectors, dates) across thousands of rows.
+NORMALIZER_CACHE_SIZE = int(os.getenv("CLEANER_CACHE_SIZE", "8192"))
+
+_MEMOIZED = {}
+
+
+def memoized(fn):
+    """
+    Cache fn's result per distinct arguments: a bounded LRU, with int, float
+    and str keys kept apart. Arguments must be hashable (raw cell values are).
+    """
+    cached = lru_cache(maxsize=NORMALIZER_CACHE_SIZE, typed=True)(fn)
+    _MEMOIZED[fn.__name__] = cached
+    return cached
+
+
+def normalizer_cache_stats() -> dict:
+    """{normalizer: {hits, misses, size}} since the last clear_normalizer_caches()."""
+    stats = {}
+    for name, cached in _MEMOIZED.items():
+        info = cached.cache_info()
+        stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+    return stats
+
+
+def clear_normalizer_caches():
+    """Forget memoized results and reset counters (once per refresh)."""
+    for cached in _MEMOIZED.values():
+        cached.cache_clear()
+
+
 # ──────────────────────────────────────────────
 # Primitive normalizers
 # ──────────────────────────────────────────────
 
+@memoized
 def normalize_revenue(value) -> float:
     """
     Converts messy revenue strings to float.
@@ -62,6 +103,95 @@ def normalize_revenue(value) -> float:
         return 0.0
 
 
+# The column is normalised as one "\0"-joined string, so each step below is a
+# single C-level pass instead of a Python call per cell. Same rules as
+# normalize_revenue: currency words, then symbols, commas and whitespace
+# (str.split() and re's \s agree on what whitespace is), then k / L / Cr.
+_CURRENCY_WORD_RE = re.compile(r"(?i)rs\.?|inr|usd|eur")
+_CURRENCY_SYMBOLS = "£€$₹,"
+_AMOUNT_LINE_RE = re.compile(r"(?im)^(?:([+-]?(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?)(cr|l|k)?|.*)$")
+_REVENUE_MULTIPLIERS = {"": 1.0, "cr": 1e7, "l": 1e5, "k": 1e3}
+_NUMBER, _STRING = 1, 2
+_VALUE_KINDS = {float: _NUMBER, int: _NUMBER, str: _STRING}
+
+
+def _normalize_revenue_strings(texts: np.ndarray) -> np.ndarray:
+    """normalize_revenue for an array of distinct strings."""
+    result = np.zeros(len(texts))
+    batch = np.fromiter(("\0" not in t for t in texts), dtype=bool, count=len(texts))
+    positions = np.flatnonzero(batch)
+
+    joined = _CURRENCY_WORD_RE.sub("", "\0".join(texts[batch]))
+    for symbol in _CURRENCY_SYMBOLS:
+        if symbol in joined:
+            joined = joined.replace(symbol, "")
+    joined = "".join(joined.split()).replace("\0", "\n")
+    amounts = _AMOUNT_LINE_RE.findall(joined)
+
+    fallback = ~batch
+    if len(amounts) == len(positions):
+        numbers = np.array([number for number, _ in amounts], dtype=object)
+        parsed = numbers != ""
+        multiplier = np.array([_REVENUE_MULTIPLIERS[suffix.lower()] for _, suffix in amounts])
+        result[positions[parsed]] = numbers[parsed].astype(float) * multiplier[parsed]
+        fallback[positions[~parsed]] = True
+    else:
+        fallback[:] = True
+
+    # Empty and JSON strings, and leftovers float() may still accept ("nan", "1_000", ...)
+    for pos in np.flatnonzero(fallback):
+        result[pos] = normalize_revenue(texts[pos])
+    return result
+
+
+def _factorize_strings(cells: np.ndarray) -> tuple:
+    """
+    (codes, uniques) for an array of strings, like pd.factorize, which
+    compares strings only up to the first "\0" and so would merge e.g.
+    "100\0x" into "100".
+    """
+    index = {}
+    codes = np.fromiter((index.setdefault(v, len(index)) for v in cells), dtype=np.intp, count=len(cells))
+    return codes, np.array(list(index), dtype=object)
+
+
+def normalize_revenue_series(values) -> pd.Series:
+    """
+    normalize_revenue over a whole column, returning a float Series with the
+    same index. Numbers (e.g. from typed numbers columns) convert in bulk,
+    strings are normalised once per distinct value in bulk string passes,
+    anything else goes through normalize_revenue. Every cell matches the
+    scalar function exactly.
+    """
+    values = pd.Series(values, dtype=object)
+    cells = values.to_numpy()
+    result = np.zeros(len(cells))
+    kinds = np.fromiter((_VALUE_KINDS.get(type(v), 0) for v in cells), dtype=np.int8, count=len(cells))
+
+    numbers = kinds == _NUMBER
+    if numbers.any():
+        converted = cells[numbers].astype(float)
+        converted[np.isnan(converted)] = 0.0
+        result[numbers] = converted
+
+    strings = kinds == _STRING
+    if strings.any():
+        codes, uniques = _factorize_strings(cells[strings])
+        result[strings] = _normalize_revenue_strings(uniques)[codes]
+
+    for pos in np.flatnonzero(kinds == 0):
+        result[pos] = normalize_revenue(cells[pos])
+    return pd.Series(result, index=values.index)
+
+
+DATE_FORMATS = [
+    "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y",
+    "%d-%m-%Y", "%d %b %Y", "%B %d, %Y",
+    "%d %B %Y", "%Y/%m/%d",
+]
+
+
+@memoized
 def normalize_date(value) -> Optional[str]:
     """
     Parses various date formats and returns ISO date string (YYYY-MM-DD) or None.
@@ -72,6 +202,13 @@ def normalize_date(value) -> Optional[str]:
 
     text = str(value).strip()
 
+    # Typed date columns arrive already in ISO form (see column_decoders)
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        try:
+            return date.fromisoformat(text).isoformat()
+        except ValueError:
+            pass
+
     # Monday.com date column returns JSON like {"date":"2025-12-31"}
     if text.startswith("{"):
         try:
@@ -82,12 +219,7 @@ def normalize_date(value) -> Optional[str]:
         except Exception:
             pass
 
-    FORMATS = [
-        "%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y",
-        "%d-%m-%Y", "%d %b %Y", "%B %d, %Y",
-        "%d %B %Y", "%Y/%m/%d",
-    ]
-    for fmt in FORMATS:
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
         except ValueError:
@@ -95,6 +227,74 @@ def normalize_date(value) -> Optional[str]:
     return None
 
 
+# Unique values sampled to find a column's dominant format
+_DATE_SAMPLE_SIZE = 200
+# What pd.to_datetime gives for parsed date strings, so frames keep their dtype
+_DATE_DTYPE = pd.to_datetime(pd.Series(["2000-01-01"])).dtype
+
+
+def _to_datetime64(iso: Optional[str]):
+    """An ISO date from normalize_date as datetime64, NaT for None or out-of-range dates."""
+    stamp = pd.to_datetime(iso, errors="coerce") if iso else pd.NaT
+    return np.datetime64("NaT") if stamp is pd.NaT else stamp.to_datetime64()
+
+
+def _dominant_date_format(texts: np.ndarray) -> int:
+    """Index in DATE_FORMATS of the format that parses most of a sample (earliest on ties)."""
+    sample = texts[:_DATE_SAMPLE_SIZE]
+    counts = [pd.to_datetime(sample, format=fmt, errors="coerce").notna().sum() for fmt in DATE_FORMATS]
+    return int(np.argmax(counts))
+
+
+def _parse_date_strings(texts: np.ndarray) -> np.ndarray:
+    """normalize_date for an array of distinct strings, as datetime64 (NaT when unparseable)."""
+    result = np.full(len(texts), np.datetime64("NaT"), dtype=_DATE_DTYPE)
+    stripped = pd.Series(texts, dtype=object).str.strip()
+    json_like = stripped.str.startswith("{").to_numpy(dtype=bool)
+    pending = (stripped != "").to_numpy(dtype=bool) & ~json_like
+    stripped = stripped.to_numpy(dtype=object)
+
+    if pending.any():
+        # Formats are tried in normalize_date's order up to the dominant one,
+        # so a value that several formats accept still gets the same date
+        dominant = _dominant_date_format(stripped[pending])
+        for fmt in DATE_FORMATS[:dominant + 1]:
+            positions = np.flatnonzero(pending)
+            if not len(positions):
+                break
+            parsed = pd.to_datetime(stripped[positions], format=fmt, errors="coerce")
+            ok = parsed.notna()
+            result[positions[ok]] = parsed[ok].to_numpy().astype(_DATE_DTYPE)
+            pending[positions[ok]] = False
+
+    # Outliers (other formats, JSON values) go through normalize_date itself
+    for pos in np.flatnonzero(pending | json_like):
+        result[pos] = _to_datetime64(normalize_date(texts[pos]))
+    return result
+
+
+def normalize_date_series(values) -> pd.Series:
+    """
+    normalize_date over a whole column, straight to a datetime64 Series with
+    the same index (NaT where normalize_date gives None). Each distinct string
+    is parsed once, in vectorized passes with the column's dominant format;
+    only values that format does not fit are parsed one by one.
+    """
+    values = pd.Series(values, dtype=object)
+    cells = values.to_numpy()
+    result = np.full(len(cells), np.datetime64("NaT"), dtype=_DATE_DTYPE)
+    is_str = np.fromiter((type(v) is str for v in cells), dtype=bool, count=len(cells))
+
+    if is_str.any():
+        codes, uniques = _factorize_strings(cells[is_str])
+        result[is_str] = _parse_date_strings(uniques)[codes]
+
+    for pos in np.flatnonzero(~is_str):
+        result[pos] = _to_datetime64(normalize_date(cells[pos]))
+    return pd.Series(result, index=values.index)
+
+
+@memoized
 def normalize_text(value) -> str:
     """Lowercase + strip whitespace for consistent text comparison."""
     if not value:
@@ -116,6 +316,7 @@ OPEN_STAGES = {
 PROBABILITY_MAP = {"high": 0.80, "medium": 0.50, "low": 0.25, "": 0.0}
 
 
+@memoized
 def map_deal_status(status: str, stage: str) -> str:
     """Determine canonical deal status from status + stage fields."""
     s = normalize_text(status)
@@ -136,87 +337,417 @@ def map_deal_status(status: str, stage: str) -> str:
     return "Open"  # default
 
 
+@memoized
+def map_exec_status(exec_status: str) -> str:
+    """Normalize a work order execution status to clean categories."""
+    exec_status = normalize_text(exec_status)
+    if "completed" in exec_status:
+        return "Completed"
+    if "ongoing" in exec_status or "executed until" in exec_status:
+        return "Ongoing"
+    if "not started" in exec_status:
+        return "Not Started"
+    if "pause" in exec_status or "struck" in exec_status:
+        return "Paused"
+    if "partial" in exec_status:
+        return "Partially Completed"
+    if "pending" in exec_status or "details pending" in exec_status:
+        return "Pending"
+    return "Unknown"
+
+
 # ──────────────────────────────────────────────
 # Schema-aware column resolution
 # ──────────────────────────────────────────────
 
+# Field → column-title keyword hints used by the cleaning pipelines.
+# Also drive which column_values are requested from Monday.com.
+DEAL_FIELD_KEYWORDS = {
+    "status": ["status", "deal status"],
+    "stage": ["stage", "deal stage"],
+    "sector": ["sector", "service"],
+    "value": ["value", "deal value", "masked"],
+    "close_date": ["close date", "actual close", "close date (a)"],
+    "tentative_date": ["tentative", "expected close"],
+    "probability": ["probability", "closure"],
+    "owner": ["owner", "personnel"],
+    "client": ["client", "company"],
+    "product": ["product"],
+    "created": ["created", "creation"],
+}
+
+WORKORDER_FIELD_KEYWORDS = {
+    "deal_name": ["deal name", "deal"],
+    "exec_status": ["execution status", "exec status", "status"],
+    "sector": ["sector"],
+    "amount_excl": ["amount in rupees (excl", "excl of gst", "excl. of gst"],
+    "amount_incl": ["amount in rupees (incl", "incl of gst"],
+    "billed_excl": ["billed value in rupees (excl", "billed value"],
+    "wo_status": ["wo status", "billing status", "collection status"],
+    "start_date": ["probable start", "start date", "date of po"],
+    "end_date": ["probable end", "end date", "delivery date"],
+    "nature": ["nature of work", "nature"],
+    "owner": ["bd/kam", "owner", "personnel"],
+    "invoice": ["invoice", "billed"],
+}
+
+# Fields the pipelines parse as amounts or dates. Only their columns are
+# decoded by Monday column type (see column_decoders); every other field is
+# read as text, so a numbers-typed code column stays "1042", not 1042.0.
+DEAL_TYPED_FIELDS = ("value", "close_date", "tentative_date", "created")
+WORKORDER_TYPED_FIELDS = ("amount_excl", "amount_incl", "billed_excl", "start_date", "end_date")
+
+
+# (schema fingerprint, field keywords) → compiled plan; schemas change rarely
+_PLAN_CACHE = {}
+_PLAN_CACHE_SIZE = 64
+
+
+def _schema_key(schema_columns: dict):
+    """Identity of a column layout: ids and titles, in order (first match wins)."""
+    return tuple((col_id, col_meta["title"]) for col_id, col_meta in schema_columns.items())
+
+
+def _match_column(schema_columns: dict, keywords: list) -> tuple:
+    """(column id, matched keyword) of the first column whose title contains any keyword, else (None, None)."""
+    kw_lower = [k.lower() for k in keywords]
+    for col_id, col_meta in schema_columns.items():
+        title = col_meta["title"].lower()
+        for kw in kw_lower:
+            if kw in title:
+                return col_id, kw
+    return None, None
+
+
+def _match_column_id(schema_columns: dict, keywords: list) -> Optional[str]:
+    """Id of the first column whose title contains any keyword, else None."""
+    return _match_column(schema_columns, keywords)[0]
+
+
+def column_plan(schema: dict, field_keywords: dict) -> dict:
+    """
+    Resolve every field to a column once per schema:
+    {field: {"column_id", "title", "keyword"}} (all None when no column
+    title contains any of the field's keywords).
+    Plans are cached by the schema fingerprint (see MondayClient), or by the
+    column ids + titles for schemas without one, and shared by all callers.
+    """
+    cols = schema.get("columns", {})
+    key = (
+        schema.get("fingerprint") or _schema_key(cols),
+        tuple((field, tuple(keywords)) for field, keywords in field_keywords.items()),
+    )
+    plan = _PLAN_CACHE.get(key)
+    if plan is None:
+        plan = {}
+        for field, keywords in field_keywords.items():
+            col_id, keyword = _match_column(cols, keywords)
+            plan[field] = {
+                "column_id": col_id,
+                "title": cols[col_id]["title"] if col_id is not None else None,
+                "keyword": keyword,
+            }
+        if len(_PLAN_CACHE) >= _PLAN_CACHE_SIZE:
+            _PLAN_CACHE.clear()
+        _PLAN_CACHE[key] = plan
+    return plan
+
+
 def find_column(item: dict, schema_columns: dict, keywords: list) -> str:
     """
     Find the best matching column value from an item using keyword hints.
     Searches column titles (case-insensitive) for any of the given keywords.
     Returns empty string if not found.
     """
-    kw_lower = [k.lower() for k in keywords]
-    for col_id, col_meta in schema_columns.items():
-        title = col_meta["title"].lower()
-        if any(kw in title for kw in kw_lower):
-            return item.get(col_id, "")
-    return ""
+    col_id = column_plan({"columns": schema_columns}, {"_": keywords})["_"]["column_id"]
+    if col_id is None:
+        return ""
+    return item.get(col_id, "")
+
+
+def required_column_ids(schema: dict, field_keywords: dict) -> list:
+    """
+    Column ids a cleaning pipeline will read, resolved from the board schema
+    with the same keyword rules as find_column. Pass as the column allowlist
+    to MondayClient so only these column_values are downloaded.
+    """
+    ids = []
+    for match in column_plan(schema, field_keywords).values():
+        col_id = match["column_id"]
+        if col_id is not None and col_id not in ids:
+            ids.append(col_id)
+    return ids
+
+
+def typed_column_ids(schema: dict, field_keywords: dict, typed_fields) -> list:
+    """
+    Column ids of the typed_fields (amounts, dates), resolved like
+    required_column_ids. A column some other field also reads as text is
+    left out. Pass as MondayClient.typed_columns so only these are decoded
+    by column type.
+    """
+    plan = column_plan(schema, field_keywords)
+    text_ids = {match["column_id"] for field, match in plan.items() if field not in typed_fields}
+    ids = []
+    for field in typed_fields:
+        col_id = plan[field]["column_id"] if field in plan else None
+        if col_id is not None and col_id not in text_ids and col_id not in ids:
+            ids.append(col_id)
+    return ids
 
 
 # ──────────────────────────────────────────────
 # Board-specific cleaning pipelines
 # ──────────────────────────────────────────────
 
-def clean_deals_df(raw_items: list, schema: dict) -> pd.DataFrame:
+class BoardCleaner(ABC):
     """
-    Clean and normalize raw Deals board items into a structured DataFrame.
-    Uses schema for dynamic column detection.
+    Incremental cleaner: feed raw items page by page as they arrive from
+    Monday.com, then build the DataFrame once. Raw pages can be dropped as
+    soon as they are added: only the raw values of the fields the pipeline
+    reads are kept, one list per field, and cleaned column by column into
+    the final frame (no per-item record dicts).
+
+    Pages are either lists of flat item dicts or columnar dicts
+    ({"_item_id": [...], "_item_name": [...], column_id: [...]}, see
+    MondayClient columnar=True). Field → column resolution comes from the
+    cached column_plan for the schema, not from scanning titles per item.
     """
-    if not raw_items:
-        return pd.DataFrame()
 
-    cols = schema.get("columns", {})
-    records = []
-
-    for item in raw_items:
-        name = str(item.get("_item_name", "")).strip()
-        if not name or name.lower() in ("deal name", ""):
-            continue  # skip header-like rows
-
-        status_raw = find_column(item, cols, ["status", "deal status"])
-        stage_raw = find_column(item, cols, ["stage", "deal stage"])
-        sector_raw = find_column(item, cols, ["sector", "service"])
-        value_raw = find_column(item, cols, ["value", "deal value", "masked"])
-        close_date_raw = find_column(item, cols, ["close date", "actual close", "close date (a)"])
-        tentative_date_raw = find_column(item, cols, ["tentative", "expected close"])
-        probability_raw = find_column(item, cols, ["probability", "closure"])
-        owner_raw = find_column(item, cols, ["owner", "personnel"])
-        client_raw = find_column(item, cols, ["client", "company"])
-        product_raw = find_column(item, cols, ["product"])
-        created_raw = find_column(item, cols, ["created", "creation"])
-
-        canonical_status = map_deal_status(status_raw, stage_raw)
-        revenue = normalize_revenue(value_raw)
-        probability = PROBABILITY_MAP.get(normalize_text(probability_raw), 0.0)
-        sector = normalize_text(sector_raw) or "unknown"
-        close_date = normalize_date(close_date_raw) or normalize_date(tentative_date_raw)
-        created_date = normalize_date(created_raw)
-
-        records.append({
-            "deal_name": name,
-            "owner_code": str(owner_raw).strip(),
-            "client_code": str(client_raw).strip(),
-            "status": canonical_status,
-            "stage": normalize_text(stage_raw),
-            "sector": sector,
-            "deal_value": revenue,
+    FIELD_KEYWORDS = {}
+    TYPED_FIELDS = ()
+
+    def __init__(self, schema: dict):
+        self.schema = schema
+        self.cols = schema.get("columns", {})
+        self.plan = column_plan(schema, self.FIELD_KEYWORDS)
+        self.field_columns = {field: match["column_id"] for field, match in self.plan.items()}
+        self.names = []
+        self.item_ids = []
+        self.raw = {field: [] for field in self.field_columns}
+
+    def keep_item(self, name: str) -> bool:
+        """Whether an item with this (stripped) name becomes a row."""
+        return bool(name)
+
+    @abstractmethod
+    def clean_columns(self, names: list, item_ids: list, raw: dict) -> dict:
+        """
+        Return the cleaned frame's columns, in order, from the kept items'
+        names, ids and raw field values ({field: [value, ...]}, "" where the
+        board has no such column). Every column has len(names) entries.
+        """
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add_page(self, items) -> "BoardCleaner":
+        if isinstance(items, dict):
+            return self.add_columns(items)
+        names = [str(item.get("_item_name", "")).strip() for item in items]
+        keep = [self.keep_item(name) for name in names]
+        kept = [item for item, k in zip(items, keep) if k]
+        self.names.extend(name for name, k in zip(names, keep) if k)
+        self.item_ids.extend(item.get("_item_id", "") for item in kept)
+        for field, col_id in self.field_columns.items():
+            if col_id is None:
+                self.raw[field].extend(repeat("", len(kept)))
+            else:
+                self.raw[field].extend(item.get(col_id, "") for item in kept)
+        return self
+
+    def add_columns(self, columns: dict) -> "BoardCleaner":
+        """Add a columnar page without materialising per-item dicts."""
+        item_ids = columns.get("_item_id", [])
+        n = len(item_ids)
+        names = [str(name).strip() for name in columns.get("_item_name") or repeat("", n)]
+        keep = [self.keep_item(name) for name in names]
+        kept = sum(keep)
+
+        def _kept(values):
+            return values if kept == n else compress(values, keep)
+
+        self.names.extend(_kept(names))
+        self.item_ids.extend(_kept(item_ids))
+        for field, col_id in self.field_columns.items():
+            values = columns.get(col_id) if col_id is not None else None
+            self.raw[field].extend(repeat("", kept) if values is None else _kept(values))
+        return self
+
+    def to_columns(self) -> dict:
+        """
+        The kept items as a columnar page (see add_columns), holding only
+        the columns the pipeline reads: a cleaner fed this page builds the
+        same frame.
+        """
+        columns = {"_item_id": self.item_ids, "_item_name": self.names}
+        for field, col_id in self.field_columns.items():
+            if col_id is not None:
+                columns[col_id] = self.raw[field]
+        return columns
+
+    def to_frame(self) -> pd.DataFrame:
+        if not self.names:
+            return pd.DataFrame()
+        return pd.DataFrame(self.clean_columns(self.names, self.item_ids, self.raw))
+
+    def patch_frame(self, df: Optional[pd.DataFrame], item_id: str, item: Optional[dict]) -> pd.DataFrame:
+        """
+        Re-clean a single item and splice it into an already-cleaned frame:
+        the row with this item_id is replaced, or dropped when item is None
+        (deleted) or cleans to nothing. Other rows are left untouched.
+        """
+        item_id = str(item_id)
+        if df is not None and not df.empty and "item_id" in df.columns:
+            df = df[df["item_id"] != item_id]
+        row = type(self)(self.schema).add_page([item]).to_frame() if item is not None else pd.DataFrame()
+        if row.empty:
+            return df if df is not None else pd.DataFrame()
+        if df is None or df.empty:
+            return row
+        return pd.concat([df, row], ignore_index=True)
+
+
+def _stripped(values: list) -> list:
+    return [str(v).strip() for v in values]
+
+
+class DealsCleaner(BoardCleaner):
+    """Cleaning pipeline for the Deals board."""
+
+    FIELD_KEYWORDS = DEAL_FIELD_KEYWORDS
+    TYPED_FIELDS = DEAL_TYPED_FIELDS
+
+    def keep_item(self, name: str) -> bool:
+        return bool(name) and name.lower() != "deal name"  # skip header-like rows
+
+    def clean_columns(self, names: list, item_ids: list, raw: dict) -> dict:
+        deal_value = normalize_revenue_series(raw["value"]).to_numpy()
+        probability = np.array([PROBABILITY_MAP.get(normalize_text(p), 0.0) for p in raw["probability"]])
+        with np.errstate(invalid="ignore"):  # inf * 0 → nan, as with scalars
+            weighted_value = deal_value * probability
+
+        # Close date, falling back to the tentative close date where it is empty
+        # or unparseable; one that parses but is out of datetime64 range stays NaT
+        closes = pd.Series(raw["close_date"], dtype=object)
+        close_date = normalize_date_series(closes)
+        unset = close_date.isna().to_numpy()
+        unset[unset] = np.array([normalize_date(v) is None for v in closes[unset]], dtype=bool)
+        close_date = close_date.where(~unset, normalize_date_series(raw["tentative_date"]))
+
+        return {
+            "deal_name": names,
+            "owner_code": _stripped(raw["owner"]),
+            "client_code": _stripped(raw["client"]),
+            "status": [map_deal_status(s, st) for s, st in zip(raw["status"], raw["stage"])],
+            "stage": [normalize_text(st) for st in raw["stage"]],
+            "sector": [normalize_text(s) or "unknown" for s in raw["sector"]],
+            "deal_value": deal_value,
             "probability": probability,
-            "weighted_value": revenue * probability,
-            "close_date": close_date,
-            "created_date": created_date,
-            "product": str(product_raw).strip(),
-        })
+            "weighted_value": weighted_value,
+            "close_date": close_date.to_numpy(),
+            "created_date": normalize_date_series(raw["created"]).to_numpy(),
+            "product": _stripped(raw["product"]),
+            "item_id": [str(i) for i in item_ids],
+        }
+
+
+_ACTIVE_EXEC_STATUSES = {"Ongoing", "Not Started", "Paused", "Partially Completed", "Pending"}
+
+
+class WorkOrdersCleaner(BoardCleaner):
+    """Cleaning pipeline for the Work Orders board."""
+
+    FIELD_KEYWORDS = WORKORDER_FIELD_KEYWORDS
+    TYPED_FIELDS = WORKORDER_TYPED_FIELDS
 
-    df = pd.DataFrame(records)
-    if df.empty:
-        return df
+    def clean_columns(self, names: list, item_ids: list, raw: dict) -> dict:
+        exec_status = [map_exec_status(s) for s in raw["exec_status"]]
 
-    # Parse date columns as datetime
-    for dc in ["close_date", "created_date"]:
-        df[dc] = pd.to_datetime(df[dc], errors="coerce")
+        # Excl. GST amount, falling back to incl. GST when missing or zero
+        amount = normalize_revenue_series(raw["amount_excl"]).to_numpy()
+        amount = np.where(amount != 0, amount, normalize_revenue_series(raw["amount_incl"]).to_numpy())
+        billed = normalize_revenue_series(raw["billed_excl"]).to_numpy()
+        with np.errstate(invalid="ignore"):  # inf - inf → nan, as with scalars
+            unbilled = amount - billed
+
+        return {
+            "wo_name": names,
+            "deal_name_linked": [
+                str(deal).strip() if deal else name for deal, name in zip(raw["deal_name"], names)
+            ],
+            "sector": [normalize_text(s) or "unknown" for s in raw["sector"]],
+            "exec_status": exec_status,
+            "is_active": np.array([s in _ACTIVE_EXEC_STATUSES for s in exec_status], dtype=bool),
+            "amount_excl_gst": amount,
+            "billed_excl_gst": billed,
+            "unbilled_amount": np.where(unbilled > 0.0, unbilled, 0.0),
+            "wo_status": [normalize_text(s) for s in raw["wo_status"]],
+            "nature_of_work": _stripped(raw["nature"]),
+            "owner_code": _stripped(raw["owner"]),
+            "start_date": normalize_date_series(raw["start_date"]).to_numpy(),
+            "end_date": normalize_date_series(raw["end_date"]).to_numpy(),
+            "item_id": [str(i) for i in item_ids],
+        }
+
+
+# ──────────────────────────────────────────────
+# Compact dtypes
+# ──────────────────────────────────────────────
+
+DEAL_STATUSES = ["Open", "Won", "Dead", "On Hold"]
+EXEC_STATUSES = ["Completed", "Ongoing", "Not Started", "Paused", "Partially Completed", "Pending", "Unknown"]
+
+# Column → dtype for the published frames. Fixed category sets where the
+# cleaners produce a closed set of labels; low-cardinality free labels get
+# their categories from the data. Money and probability stay float64:
+# float32 would change crore-scale totals.
+DEAL_DTYPES = {
+    "status": pd.CategoricalDtype(DEAL_STATUSES),
+    "stage": "category",
+    "sector": "category",
+    "owner_code": "category",
+    "client_code": "category",
+    "source_board": "category",
+}
+WORKORDER_DTYPES = {
+    "exec_status": pd.CategoricalDtype(EXEC_STATUSES),
+    "is_active": "bool",
+    "sector": "category",
+    "wo_status": "category",
+    "owner_code": "category",
+    "source_board": "category",
+}
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """Bytes held by a frame, strings included."""
+    return int(df.memory_usage(deep=True).sum())
 
-    return df
+
+def compact_frame(df: pd.DataFrame, dtypes: dict, measure: bool = True) -> tuple:
+    """
+    Convert a cleaned frame's columns to the given dtypes (columns it lacks
+    are skipped). Returns (frame, {rows, bytes_before, bytes_after}), the
+    report None with measure=False (measuring walks every string).
+    """
+    before = frame_memory(df) if measure else None
+    converted = {col: dtype for col, dtype in dtypes.items() if col in df.columns and df[col].dtype != dtype}
+    if converted:
+        df = df.astype(converted)
+    if not measure:
+        return df, None
+    return df, {"rows": len(df), "bytes_before": before, "bytes_after": frame_memory(df)}
+
+
+def clean_deals_df(raw_items: list, schema: dict) -> pd.DataFrame:
+    """
+    Clean and normalize raw Deals board items into a structured DataFrame.
+    Uses schema for dynamic column detection.
+    """
+    if not raw_items:
+        return pd.DataFrame()
+    return DealsCleaner(schema).add_page(raw_items).to_frame()
 
 
 def clean_workorders_df(raw_items: list, schema: dict) -> pd.DataFrame:
@@ -225,75 +756,27 @@ def clean_workorders_df(raw_items: list, schema: dict) -> pd.DataFrame:
     """
     if not raw_items:
         return pd.DataFrame()
+    return WorkOrdersCleaner(schema).add_page(raw_items).to_frame()
 
-    cols = schema.get("columns", {})
-    records = []
-
-    for item in raw_items:
-        name = str(item.get("_item_name", "")).strip()
-        if not name:
-            continue
 
-        deal_name_raw = find_column(item, cols, ["deal name", "deal"])
-        exec_status_raw = find_column(item, cols, ["execution status", "exec status", "status"])
-        sector_raw = find_column(item, cols, ["sector"])
-        amount_excl_raw = find_column(item, cols, ["amount in rupees (excl", "excl of gst", "excl. of gst"])
-        amount_incl_raw = find_column(item, cols, ["amount in rupees (incl", "incl of gst"])
-        billed_excl_raw = find_column(item, cols, ["billed value in rupees (excl", "billed value"])
-        wo_status_raw = find_column(item, cols, ["wo status", "billing status", "collection status"])
-        start_date_raw = find_column(item, cols, ["probable start", "start date", "date of po"])
-        end_date_raw = find_column(item, cols, ["probable end", "end date", "delivery date"])
-        nature_raw = find_column(item, cols, ["nature of work", "nature"])
-        owner_raw = find_column(item, cols, ["bd/kam", "owner", "personnel"])
-        invoice_raw = find_column(item, cols, ["invoice", "billed"])
-
-        amount = normalize_revenue(amount_excl_raw) or normalize_revenue(amount_incl_raw)
-        billed = normalize_revenue(billed_excl_raw)
-        exec_status = normalize_text(exec_status_raw)
-        sector = normalize_text(sector_raw) or "unknown"
-
-        # Normalize execution status to clean categories
-        if "completed" in exec_status:
-            exec_status_clean = "Completed"
-        elif "ongoing" in exec_status or "executed until" in exec_status:
-            exec_status_clean = "Ongoing"
-        elif "not started" in exec_status:
-            exec_status_clean = "Not Started"
-        elif "pause" in exec_status or "struck" in exec_status:
-            exec_status_clean = "Paused"
-        elif "partial" in exec_status:
-            exec_status_clean = "Partially Completed"
-        elif "pending" in exec_status or "details pending" in exec_status:
-            exec_status_clean = "Pending"
-        else:
-            exec_status_clean = "Unknown"
-
-        is_active = exec_status_clean in ("Ongoing", "Not Started", "Paused", "Partially Completed", "Pending")
-
-        records.append({
-            "wo_name": name,
-            "deal_name_linked": str(deal_name_raw).strip() if deal_name_raw else name,
-            "sector": sector,
-            "exec_status": exec_status_clean,
-            "is_active": is_active,
-            "amount_excl_gst": amount,
-            "billed_excl_gst": billed,
-            "unbilled_amount": max(0.0, amount - billed),
-            "wo_status": normalize_text(wo_status_raw),
-            "nature_of_work": str(nature_raw).strip(),
-            "owner_code": str(owner_raw).strip(),
-            "start_date": normalize_date(start_date_raw),
-            "end_date": normalize_date(end_date_raw),
-        })
-
-    df = pd.DataFrame(records)
-    if df.empty:
-        return df
-
-    for dc in ["start_date", "end_date"]:
-        df[dc] = pd.to_datetime(df[dc], errors="coerce")
-
-    return df
+def clean_deals_pages(pages, schema: dict) -> pd.DataFrame:
+    """
+    Clean-as-you-go variant of clean_deals_df for an iterable of item pages
+    (e.g. MondayClient.iter_board_item_pages); each page is cleaned and
+    released before the next one is fetched.
+    """
+    cleaner = DealsCleaner(schema)
+    for page in pages:
+        cleaner.add_page(page)
+    return cleaner.to_frame()
+
+
+def clean_workorders_pages(pages, schema: dict) -> pd.DataFrame:
+    """Clean-as-you-go variant of clean_workorders_df; see clean_deals_pages."""
+    cleaner = WorkOrdersCleaner(schema)
+    for page in pages:
+        cleaner.add_page(page)
+    return cleaner.to_frame()
 
 
 # ──────────────────────────────────────────────
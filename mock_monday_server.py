@@ -0,0 +1,498 @@
+"""
+mock_monday_server.py
+Local stand-in for the Monday.com GraphQL API, for offline development and
+fetch-path benchmarks (pagination, retries, parsing) without a live token.
+
+Serves the documents AsyncMondayClient sends — `boards` with
+columns and `items_page` (first page, cursor, query_params, column_values
+allowlist, ids-only, last-updated ordering), board `items_count` /
+`updated_at`, top-level `items(ids:)` (with `board { id }`), batched aliases, `complexity` and
+`me` — from a JSON fixture that is either recorded from a real account or
+generated.
+
+Run standalone and point the clients at it:
+    python mock_monday_server.py --synthetic 5000 --latency-ms 120 --port 8765
+    MONDAY_API_URL=http://127.0.0.1:8765/v2 MONDAY_API_TOKEN=mock python app.py
+
+Or in-process, without sockets:
+    app = create_app(synthetic_fixture(5000))
+    client.client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+"""
+
+import re
+import json
+import time
+import base64
+import random
+import asyncio
+import argparse
+from datetime import date, timedelta
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+# ──────────────────────────────────────────────
+# Fixtures
+# ──────────────────────────────────────────────
+
+# Fixture format:
+# {"boards": {board_id: {"name": str,
+#                        "columns": [{"id", "title", "type"}],
+#                        "items": [{"id", "name", "updated_at": "YYYY-MM-DD",
+#                                   "column_values": [{"id", "text", "value"}]}]}}}
+
+DEALS_COLUMNS = [
+    ("deal_status", "Deal Status", "status"),
+    ("deal_stage", "Deal Stage", "status"),
+    ("sector", "Sector/service", "dropdown"),
+    ("deal_value", "Masked Deal value", "numbers"),
+    ("close_date", "Close Date (A)", "date"),
+    ("tentative_close", "Tentative Close Date", "date"),
+    ("probability", "Closure Probability", "status"),
+    ("owner", "Owner code", "text"),
+    ("client", "Client Code", "text"),
+    ("product", "Product deal", "text"),
+    ("created", "Created Date", "date"),
+]
+
+WORKORDER_COLUMNS = [
+    ("deal_name", "Deal name masked", "text"),
+    ("exec_status", "Execution Status", "status"),
+    ("sector", "Sector", "dropdown"),
+    ("amount_excl", "Amount in Rupees (Excl of GST) (Masked)", "numbers"),
+    ("amount_incl", "Amount in Rupees (Incl of GST) (Masked)", "numbers"),
+    ("billed_excl", "Billed Value in Rupees (Excl of GST.) (Masked)", "numbers"),
+    ("wo_status", "WO Status (billed)", "status"),
+    ("start_date", "Probable Start Date", "date"),
+    ("end_date", "Probable End Date", "date"),
+    ("nature", "Nature of Work", "text"),
+    ("owner", "BD/KAM Personnel code", "text"),
+]
+
+_STATUS_LABELS = {
+    "deal_status": ["Open", "Won", "Dead", "On Hold"],
+    "deal_stage": [
+        "A. Lead Generated", "B. Sales Qualified Leads", "C. Demo Done", "D. Feasibility",
+        "E. Proposal/Commercials Sent", "F. Negotiations", "G. Project Won",
+        "H. Work Order Received", "L. Project Lost", "M. Projects On Hold",
+    ],
+    "probability": ["High", "Medium", "Low"],
+    "exec_status": ["Completed", "Ongoing", "Not Started", "Pause / struck", "Partial Completed", "Details pending from Client"],
+    "wo_status": ["Billed", "Partially Billed", "Not Billed"],
+}
+_SECTORS = ["Mining", "Renewables", "Railways", "Powerline", "Construction", "DSP", "Tender", "Aviation"]
+
+
+def _cell(col_id: str, col_type: str, rng: random.Random, today: date) -> dict:
+    """One column_values entry with Monday-style text and JSON value."""
+    if rng.random() < 0.08:
+        return {"id": col_id, "text": "", "value": None}
+    if col_type == "status":
+        labels = _STATUS_LABELS.get(col_id, ["Open"])
+        index = rng.randrange(len(labels))
+        return {"id": col_id, "text": labels[index], "value": json.dumps({"index": index})}
+    if col_type == "dropdown":
+        label = rng.choice(_SECTORS)
+        return {"id": col_id, "text": label, "value": json.dumps({"ids": [_SECTORS.index(label) + 1]})}
+    if col_type == "numbers":
+        number = str(rng.randrange(10_000, 50_000_000))
+        return {"id": col_id, "text": number, "value": json.dumps(number)}
+    if col_type == "date":
+        day = (today - timedelta(days=rng.randrange(-180, 720))).isoformat()
+        return {"id": col_id, "text": day, "value": json.dumps({"date": day})}
+    text = f"{col_id.upper()}_{rng.randrange(1, 60)}"
+    return {"id": col_id, "text": text, "value": json.dumps(text)}
+
+
+def _synthetic_board(name: str, columns: list, n_items: int, prefix: str, rng: random.Random) -> dict:
+    today = date.today()
+    items = []
+    for i in range(n_items):
+        items.append({
+            "id": str(10_000_000 + i),
+            "name": f"{prefix} {i:05d}",
+            "updated_at": (today - timedelta(days=rng.randrange(0, 365))).isoformat(),
+            "column_values": [_cell(cid, ctype, rng, today) for cid, _, ctype in columns],
+        })
+    return {
+        "name": name,
+        "columns": [{"id": cid, "title": title, "type": ctype} for cid, title, ctype in columns],
+        "items": items,
+    }
+
+
+def synthetic_fixture(
+    n_deals: int = 2000,
+    n_workorders: int = 1000,
+    deals_board_id: str = "1001",
+    workorders_board_id: str = "1002",
+    seed: int = 42,
+) -> dict:
+    """Generate a Deals + Work Orders fixture shaped like the real boards."""
+    rng = random.Random(seed)
+    return {
+        "boards": {
+            deals_board_id: _synthetic_board("Deals", DEALS_COLUMNS, n_deals, "Deal", rng),
+            workorders_board_id: _synthetic_board("Work Orders", WORKORDER_COLUMNS, n_workorders, "WO", rng),
+        }
+    }
+
+
+def load_fixture(path: str) -> dict:
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save_fixture(fixture: dict, path: str):
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(fixture, fh)
+
+
+RECORD_PAGE_QUERY = """
+query ($boardId: [ID!], $limit: Int, $cursor: String) {
+  boards(ids: $boardId) {
+    name
+    columns { id title type }
+    items_page(limit: $limit, cursor: $cursor) {
+      cursor
+      items { id name updated_at column_values { id text value } }
+    }
+  }
+}
+"""
+
+
+def record_fixture(board_ids: list, path: str, token: str = None, limit: int = 500) -> dict:
+    """
+    Record live boards into a fixture file (raw column_values, not flattened).
+    Needs a real MONDAY_API_TOKEN; the result replays offline with create_app.
+    """
+    from monday_client import MondayClient
+
+    client = MondayClient(token)
+    fixture = {"boards": {}}
+    try:
+        for board_id in board_ids:
+            board, cursor = None, None
+            while True:
+                data = client._execute(RECORD_PAGE_QUERY, {"boardId": [str(board_id)], "limit": limit, "cursor": cursor})
+                raw = data["boards"][0]
+                if board is None:
+                    board = {"name": raw["name"], "columns": raw["columns"], "items": []}
+                page = raw["items_page"]
+                for item in page["items"]:
+                    item["updated_at"] = (item.get("updated_at") or "")[:10]
+                board["items"].extend(page["items"])
+                cursor = page.get("cursor")
+                if not cursor or not page["items"]:
+                    break
+            fixture["boards"][str(board_id)] = board
+    finally:
+        client.close()
+    save_fixture(fixture, path)
+    return fixture
+
+
+# ──────────────────────────────────────────────
+# Query interpretation
+# ──────────────────────────────────────────────
+
+_BOARDS_RE = re.compile(r"(?:(\w+)\s*:\s*)?boards\s*\(\s*ids\s*:\s*\$(\w+)\s*\)")
+_ITEMS_RE = re.compile(r"(?<![\w_])items\s*\(\s*ids\s*:\s*\$(\w+)\s*\)")
+_ARG_RE = re.compile(r"(\w+)\s*:\s*\$(\w+)")
+
+
+def _block(text: str, start: int) -> str:
+    """Text between the brace at/after `start` and its matching close brace."""
+    open_at = text.index("{", start)
+    depth = 0
+    for i in range(open_at, len(text)):
+        if text[i] == "{":
+            depth += 1
+        elif text[i] == "}":
+            depth -= 1
+            if depth == 0:
+                return text[open_at + 1:i]
+    raise ValueError("Unbalanced braces in query")
+
+
+def _encode_cursor(board_id: str, offset: int, since: Optional[str]) -> str:
+    raw = json.dumps([board_id, offset, since])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    board_id, offset, since = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    return board_id, offset, since
+
+
+def _since_from_params(query_params: dict) -> Optional[str]:
+    for rule in (query_params or {}).get("rules", []):
+        if rule.get("column_id") == "__last_updated__":
+            values = rule.get("compare_value") or []
+            return values[-1] if values else None
+    return None
+
+
+def _orders_by_last_updated(query_params: dict) -> bool:
+    return any(
+        order.get("column_id") == "__last_updated__" and str(order.get("direction", "")).lower() == "desc"
+        for order in (query_params or {}).get("order_by", [])
+    )
+
+
+class MockMondayState:
+    """Fixture data plus fault-injection knobs and a per-minute complexity budget."""
+
+    def __init__(
+        self,
+        fixture: dict,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_every: int = 0,
+        budget_per_minute: int = 10_000_000,
+        seed: int = 0,
+    ):
+        self.boards = fixture.get("boards", {})
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rate_limit_every = rate_limit_every
+        self.budget_per_minute = budget_per_minute
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self._budget_used = 0
+        self._budget_window = time.time()
+
+    # ── complexity ───────────────────────────────
+
+    def _charge(self, cost: int) -> tuple:
+        """Returns (before, after, reset_in) or raises _BudgetExhausted."""
+        now = time.time()
+        if now - self._budget_window >= 60:
+            self._budget_window, self._budget_used = now, 0
+        reset_in = max(1, int(60 - (now - self._budget_window)))
+        before = self.budget_per_minute - self._budget_used
+        if cost > before:
+            raise _BudgetExhausted(cost, before, reset_in)
+        self._budget_used += cost
+        return before, before - cost, reset_in
+
+    # ── resolvers ────────────────────────────────
+
+    def _items_page(self, board_id: str, block: str, variables: dict) -> tuple:
+        """Resolve an items_page selection. Returns (payload, complexity cost)."""
+        args_match = re.search(r"items_page\s*\(([^)]*)\)", block)
+        args = dict(_ARG_RE.findall(args_match.group(1))) if args_match else {}
+        literal_limit = re.search(r"limit\s*:\s*(\d+)", args_match.group(1)) if args_match else None
+        if literal_limit:
+            limit = int(literal_limit.group(1))
+        else:
+            limit = int(variables.get(args.get("limit", ""), 25) or 25)
+        cursor = variables.get(args.get("cursor", ""))
+        query_params = variables.get(args.get("query_params", ""))
+
+        if cursor:
+            board_id, offset, since = _decode_cursor(cursor)
+        else:
+            offset, since = 0, _since_from_params(query_params)
+
+        items = self.boards[board_id]["items"]
+        if since:
+            items = [item for item in items if item.get("updated_at", "") >= since]
+        if _orders_by_last_updated(query_params):
+            items = sorted(items, key=lambda item: item.get("updated_at", ""), reverse=True)
+        page = items[offset:offset + limit]
+        next_cursor = _encode_cursor(board_id, offset + limit, since) if offset + limit < len(items) else None
+
+        page_block = _block(block, args_match.end()) if args_match else ""
+        items_block = _block(page_block, page_block.index("items")) if "items" in page_block else ""
+        out_items, n_values = self._render_items(page, items_block, variables)
+
+        # Roughly Monday-like: pay for the page size requested plus every cell returned
+        cost = 10 + limit + n_values
+        return {"cursor": next_cursor, "items": out_items}, cost
+
+    def _items_by_id(self, item_ids: list, block: str, variables: dict) -> tuple:
+        """Resolve a top-level `items(ids: ...)` selection across all boards."""
+        wanted = {str(i) for i in item_ids}
+        found = [
+            (board_id, item) for board_id, board in self.boards.items() for item in board["items"]
+            if item["id"] in wanted
+        ]
+        out_items, n_values = self._render_items([item for _, item in found], block, variables)
+        if re.search(r"\bboard\s*\{", block):
+            for out, (board_id, _) in zip(out_items, found):
+                out["board"] = {"id": board_id}
+        return out_items, 1 + len(wanted) + n_values
+
+    @staticmethod
+    def _render_items(items: list, items_block: str, variables: dict) -> tuple:
+        """Project fixture items onto the requested fields. Returns (items, cells returned)."""
+        want_name = re.search(r"\bname\b", items_block) is not None
+        cv_match = re.search(r"column_values\s*(\(\s*ids\s*:\s*\$(\w+)\s*\))?\s*\{", items_block)
+        allow = None
+        if cv_match and cv_match.group(2):
+            allow = set(variables.get(cv_match.group(2)) or [])
+
+        out_items = []
+        n_values = 0
+        for item in items:
+            out = {"id": item["id"]}
+            if want_name:
+                out["name"] = item["name"]
+            if "updated_at" in items_block:
+                out["updated_at"] = item.get("updated_at")
+            if cv_match:
+                values = [cv for cv in item["column_values"] if allow is None or cv["id"] in allow]
+                out["column_values"] = values
+                n_values += len(values)
+            out_items.append(out)
+        return out_items, n_values
+
+    def _board(self, board_id: str, block: str, variables: dict) -> tuple:
+        board = self.boards.get(str(board_id))
+        if board is None:
+            return [], 1
+        out = {}
+        cost = 1
+        if re.search(r"(^|\s)id(\s|$)", block.split("items_page")[0]):
+            out["id"] = str(board_id)
+        if re.search(r"(^|\s)name(\s|$)", block.split("items_page")[0]):
+            out["name"] = board["name"]
+        if "items_count" in block.split("items_page")[0]:
+            out["items_count"] = len(board["items"])
+        if re.search(r"(^|\s)updated_at(\s|$)", block.split("items_page")[0]):
+            out["updated_at"] = max((item.get("updated_at", "") for item in board["items"]), default="")
+        if "columns" in block.split("items_page")[0]:
+            out["columns"] = board["columns"]
+            cost += len(board["columns"])
+        if "items_page" in block:
+            out["items_page"], page_cost = self._items_page(str(board_id), block, variables)
+            cost += page_cost
+        return [out], cost
+
+    def execute(self, query: str, variables: dict) -> tuple:
+        """Resolve one GraphQL document. Returns (status_code, body, headers)."""
+        self.requests += 1
+        if self.error_rate and self.rng.random() < self.error_rate:
+            return 503, {"error_message": "Injected server error"}, {}
+        if self.rate_limit_every and self.requests % self.rate_limit_every == 0:
+            return 200, _budget_error(30001, 0, 5), {"Retry-After": "5"}
+
+        body = _block(query, 0)
+        data, cost = {}, 1
+        for match in _BOARDS_RE.finditer(body):
+            alias = match.group(1) or "boards"
+            ids = variables.get(match.group(2)) or []
+            block = _block(body, match.end())
+            data[alias] = []
+            for board_id in ids:
+                rows, board_cost = self._board(str(board_id), block, variables)
+                data[alias].extend(rows)
+                cost += board_cost
+        for match in _ITEMS_RE.finditer(body):
+            data["items"], items_cost = self._items_by_id(
+                variables.get(match.group(1)) or [], _block(body, match.end()), variables
+            )
+            cost += items_cost
+        if re.search(r"\bme\s*\{", body):
+            data["me"] = {"id": "1", "name": "Mock User", "email": "mock@example.com"}
+
+        try:
+            before, after, reset_in = self._charge(cost)
+        except _BudgetExhausted as e:
+            return 200, _budget_error(e.cost, e.remaining, e.reset_in), {}
+        if "complexity" in body:
+            data["complexity"] = {"query": cost, "before": before, "after": after, "reset_in_x_seconds": reset_in}
+        return 200, {"data": data}, {}
+
+
+class _BudgetExhausted(Exception):
+    def __init__(self, cost: int, remaining: int, reset_in: int):
+        self.cost, self.remaining, self.reset_in = cost, remaining, reset_in
+
+
+def _budget_error(cost: int, remaining: int, reset_in: int) -> dict:
+    return {
+        "errors": [{
+            "message": (
+                f"Complexity budget exhausted, query cost {cost} budget remaining "
+                f"{remaining} out of 10000000 reset in {reset_in} seconds"
+            ),
+            "extensions": {"code": "ComplexityException"},
+        }]
+    }
+
+
+# ──────────────────────────────────────────────
+# HTTP app
+# ──────────────────────────────────────────────
+
+def create_app(fixture: dict, **options) -> FastAPI:
+    """
+    FastAPI app serving POST /v2 from `fixture`.
+    options: latency_ms, jitter_ms, error_rate, rate_limit_every,
+    budget_per_minute, seed (see MockMondayState).
+    """
+    state = MockMondayState(fixture, **options)
+    app = FastAPI(title="Mock Monday.com API")
+    app.state.mock = state
+
+    @app.post("/v2")
+    async def graphql(request: Request):
+        if not request.headers.get("Authorization"):
+            return JSONResponse({"errors": [{"message": "Not Authenticated"}]}, status_code=401)
+        payload = await request.json()
+        delay = state.latency_ms + (state.rng.uniform(-state.jitter_ms, state.jitter_ms) if state.jitter_ms else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000.0)
+        status, body, headers = state.execute(payload.get("query", ""), payload.get("variables") or {})
+        return JSONResponse(body, status_code=status, headers=headers)
+
+    @app.get("/stats")
+    async def stats():
+        return {"requests": state.requests, "budget_used": state._budget_used}
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve a mock Monday.com GraphQL API.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--fixture", help="Fixture JSON to replay")
+    source.add_argument("--synthetic", type=int, metavar="N", help="Generate N deals (and N/2 work orders)")
+    source.add_argument("--record", nargs="+", metavar="BOARD_ID", help="Record live boards to --out and exit")
+    parser.add_argument("--out", default="monday_fixture.json", help="Output path for --record")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 503")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="Every Nth request hits a complexity-budget error")
+    parser.add_argument("--budget", type=int, default=10_000_000, help="Complexity budget per minute")
+    args = parser.parse_args()
+
+    if args.record:
+        record_fixture(args.record, args.out)
+        print(f"Recorded {len(args.record)} board(s) to {args.out}")
+        raise SystemExit(0)
+
+    fixture = load_fixture(args.fixture) if args.fixture else synthetic_fixture(args.synthetic or 2000, (args.synthetic or 2000) // 2)
+    print(f"Mock boards: { {bid: len(b['items']) for bid, b in fixture['boards'].items()} }")
+    uvicorn.run(
+        create_app(
+            fixture,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            rate_limit_every=args.rate_limit_every,
+            budget_per_minute=args.budget,
+        ),
+        host="127.0.0.1",
+        port=args.port,
+    )
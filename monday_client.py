@@ -2,17 +2,226 @@
 monday_client.py
 Monday.com GraphQL API wrapper for Skylark Drones BI Agent.
 Handles schema detection, paginated item fetching, and retry logic.
+Provides an asyncio client (httpx) and a blocking wrapper around it.
 """
 
 import os
+import re
+import json
 import time
-import requests
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import hashlib
+import asyncio
+import threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+import httpx
+from email.utils import parsedate_to_datetime
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+    wait_none,
+)
+from typing import Optional
 from dotenv import load_dotenv
 
+from circuit_breaker import CircuitBreaker, HALF_OPEN
+from column_decoders import decoders_for
+from page_tuner import PageSizeTuner
+from rate_limiter import ComplexityBudget
+
 load_dotenv()
 
-MONDAY_API_URL = "https://api.monday.com/v2"
+# Override to point the clients at mock_monday_server.py for offline runs.
+MONDAY_API_URL = os.getenv("MONDAY_API_URL", "https://api.monday.com/v2")
+
+# Connection pool sizing — one host, so pool_maxsize bounds concurrent sockets.
+DEFAULT_POOL_MAXSIZE = int(os.getenv("MONDAY_POOL_MAXSIZE", "10"))
+
+# How many times a query is re-sent after Monday.com reports the complexity
+# budget exhausted or answers 429. Each attempt first waits out the reset hint
+# (Monday's complexity budget resets per minute) as long as it is at most
+# MAX_RATE_LIMIT_WAIT_S and the query's total wait stays within
+# RATE_LIMIT_DEADLINE_S; longer hints are raised straight away.
+RATE_LIMIT_RETRIES = int(os.getenv("MONDAY_RATE_LIMIT_RETRIES", "3"))
+MAX_RATE_LIMIT_WAIT_S = float(os.getenv("MONDAY_MAX_RATE_LIMIT_WAIT_S", "90"))
+RATE_LIMIT_DEADLINE_S = float(os.getenv("MONDAY_RATE_LIMIT_DEADLINE_S", "180"))
+
+# Transient failures (timeouts, connection errors, 5xx) are retried with
+# backoff, or after the server's Retry-After, but never past the deadline and
+# never when the server asks for a longer wait than MAX_RETRY_AFTER_S.
+REQUEST_TIMEOUT_S = float(os.getenv("MONDAY_TIMEOUT_S", "30"))
+TRANSIENT_RETRIES = int(os.getenv("MONDAY_TRANSIENT_RETRIES", "2"))
+RETRY_DEADLINE_S = float(os.getenv("MONDAY_RETRY_DEADLINE_S", "20"))
+MAX_RETRY_AFTER_S = float(os.getenv("MONDAY_MAX_RETRY_AFTER_S", "10"))
+
+# Per-page fetch/processing timings kept for pagination_stats(), and
+# per-request metrics kept for fetch_stats()
+PAGE_TIMING_HISTORY = 500
+REQUEST_LOG_SIZE = 1000
+
+
+# ──────────────────────────────────────────────
+# GraphQL documents
+# ──────────────────────────────────────────────
+
+SCHEMA_QUERY = """
+query ($boardId: [ID!]) {
+  boards(ids: $boardId) {
+    id
+    name
+    columns {
+      id
+      title
+      type
+    }
+  }
+}
+"""
+
+# Selection set shared by every items_page request.
+ITEMS_PAGE_FIELDS = """
+      cursor
+      items {
+        id
+        name
+        column_values {
+          id
+          text
+          value
+        }
+      }
+"""
+
+FIRST_PAGE_QUERY = """
+query ($boardId: [ID!], $limit: Int) {
+  boards(ids: $boardId) {
+    items_page(limit: $limit) {%s    }
+  }
+}
+""" % ITEMS_PAGE_FIELDS
+
+NEXT_PAGE_QUERY = """
+query ($boardId: [ID!], $limit: Int, $cursor: String!) {
+  boards(ids: $boardId) {
+    items_page(limit: $limit, cursor: $cursor) {%s    }
+  }
+}
+""" % ITEMS_PAGE_FIELDS
+
+# First page filtered by query_params (e.g. the __last_updated__ rule used
+# for delta sync); follow-up pages use NEXT_PAGE_QUERY, the cursor keeps the filter.
+# Columns ride along so schema changes are noticed without an extra request,
+# and items_count so deletions are, without an ids scan.
+FILTERED_PAGE_QUERY = """
+query ($boardId: [ID!], $limit: Int, $queryParams: ItemsQuery) {
+  boards(ids: $boardId) {
+    id
+    name
+    items_count
+    columns {
+      id
+      title
+      type
+    }
+    items_page(limit: $limit, query_params: $queryParams) {%s    }
+  }
+}
+""" % ITEMS_PAGE_FIELDS
+
+# Ids-only scan used to detect deleted items without downloading column values.
+ITEM_IDS_QUERY = """
+query ($boardId: [ID!], $limit: Int, $cursor: String) {
+  boards(ids: $boardId) {
+    items_page(limit: $limit, cursor: $cursor) {
+      cursor
+      items {
+        id
+      }
+    }
+  }
+}
+"""
+
+# Single items by id — used to re-read items named in webhook events.
+ITEMS_BY_ID_QUERY = """
+query ($itemIds: [ID!]) {
+  items(ids: $itemIds) {
+    id
+    name
+    board {
+      id
+    }
+    column_values {
+      id
+      text
+      value
+    }
+  }
+}
+"""
+
+# Change probe: item count plus the most recently updated item of every
+# board, in one tiny request — if none of it moved, nothing needs fetching.
+PROBE_QUERY = """
+query ($boardIds: [ID!], $order: ItemsQuery) {
+  boards(ids: $boardIds) {
+    id
+    items_count
+    updated_at
+    items_page(limit: 1, query_params: $order) {
+      items {
+        id
+        updated_at
+      }
+    }
+  }
+}
+"""
+PROBE_ORDER = {"order_by": [{"column_id": "__last_updated__", "direction": "desc"}]}
+
+ME_QUERY = "{ me { id name email } }"
+
+
+# Requested alongside every query so the budget tracks real costs.
+COMPLEXITY_FIELDS = """
+  complexity {
+    query
+    before
+    after
+    reset_in_x_seconds
+  }"""
+
+_RESET_HINT_RE = re.compile(r"reset in (\d+) seconds?", re.IGNORECASE)
+
+
+def page_size(items) -> int:
+    """Number of items in a page, flat (list) or columnar (dict of lists)."""
+    if isinstance(items, dict):
+        return len(items.get("_item_id", ()))
+    return len(items)
+
+
+def project_item(item: dict, column_ids: list = None) -> dict:
+    """Copy of a flat item holding only column_ids (plus _item_id / _item_name); None keeps every column."""
+    if column_ids is None:
+        return item
+    keep = {"_item_id", "_item_name", *column_ids}
+    return {key: value for key, value in item.items() if key in keep}
+
+
+def extend_columns(target: dict, page: dict) -> dict:
+    """Append a columnar page to `target` in place, padding columns either side lacks with ""."""
+    before = page_size(target)
+    total = before + page_size(page)
+    for key, values in page.items():
+        target.setdefault(key, [""] * before).extend(values)
+    for values in target.values():
+        if len(values) < total:
+            values.extend([""] * (total - len(values)))
+    return target
 
 
 class MondayAPIError(Exception):
@@ -20,10 +229,98 @@ class MondayAPIError(Exception):
     pass
 
 
-class MondayClient:
-    """Read-only Monday.com GraphQL API client with retry and pagination."""
+class MondayRateLimitError(MondayAPIError):
+    """
+    Raised when the complexity budget is exhausted or Monday.com answers
+    HTTP 429; retry_after is in seconds.
+    """
 
-    def __init__(self, token: str = None):
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class MondayTransientError(MondayAPIError):
+    """Timeout, connection failure or 5xx — worth retrying; retry_after from the server, if any."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class MondayCircuitOpenError(MondayAPIError):
+    """Raised without sending while the circuit breaker is open; retry_after is in seconds."""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+_transient_backoff = wait_exponential(multiplier=0.5, min=0.5, max=8)
+
+
+def _wait_transient(retry_state) -> float:
+    """Honour the server's Retry-After when given, else back off exponentially."""
+    hint = getattr(retry_state.outcome.exception(), "retry_after", None)
+    if hint is not None:
+        return hint
+    return _transient_backoff(retry_state)
+
+
+def _retry_hint(error: BaseException) -> float:
+    return getattr(error, "retry_after", None) or 0.0
+
+
+def _is_retryable(error: BaseException) -> bool:
+    return isinstance(error, MondayTransientError) and _retry_hint(error) <= MAX_RETRY_AFTER_S
+
+
+def _is_rate_limit_retryable(error: BaseException) -> bool:
+    return isinstance(error, MondayRateLimitError) and _retry_hint(error) <= MAX_RATE_LIMIT_WAIT_S
+
+
+def _past_deadline(retry_state) -> bool:
+    """Stop once waiting out the last error's retry hint would overrun RETRY_DEADLINE_S."""
+    hint = _retry_hint(retry_state.outcome.exception())
+    return retry_state.seconds_since_start + hint > RETRY_DEADLINE_S
+
+
+def _past_rate_limit_deadline(retry_state) -> bool:
+    """Stop once waiting out the last reset hint would overrun RATE_LIMIT_DEADLINE_S."""
+    hint = _retry_hint(retry_state.outcome.exception())
+    return retry_state.seconds_since_start + hint > RATE_LIMIT_DEADLINE_S
+
+
+# Applied to AsyncMondayClient._send(): the outer layer re-sends after budget
+# exhaustion or a 429 (no tenacity wait needed — _pace() sleeps until the
+# reset hint recorded by block_for() has elapsed), waiting out hints up to
+# MAX_RATE_LIMIT_WAIT_S within RATE_LIMIT_DEADLINE_S; the inner one retries
+# transient errors, giving up straight away on hints above MAX_RETRY_AFTER_S
+# and never waiting past RETRY_DEADLINE_S in total.
+_retry_rate_limited = retry(
+    stop=stop_after_attempt(RATE_LIMIT_RETRIES + 1) | _past_rate_limit_deadline,
+    wait=wait_none(),
+    retry=retry_if_exception(_is_rate_limit_retryable),
+    reraise=True,
+)
+_retry_transient = retry(
+    stop=stop_after_attempt(TRANSIENT_RETRIES + 1) | _past_deadline,
+    wait=_wait_transient,
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+
+
+class _MondayClientBase:
+    """Transport-independent pieces of the client: query building, parsing, metrics."""
+
+    def __init__(
+        self,
+        token: str = None,
+        budget: ComplexityBudget = None,
+        breaker: CircuitBreaker = None,
+        page_tuner: PageSizeTuner = None,
+    ):
         self.token = token or os.getenv("MONDAY_API_TOKEN", "")
         if not self.token:
             raise ValueError(
@@ -35,65 +332,219 @@ class MondayClient:
             "Content-Type": "application/json",
             "API-Version": "2023-10",
         }
+        self.budget = budget or ComplexityBudget()
+        self.breaker = breaker or CircuitBreaker()
+        # items_page sizes per board; limit=None everywhere means "tuned"
+        self.page_tuner = page_tuner or PageSizeTuner()
+
+        # board_id → last schema seen; identical schemas are reused as-is
+        self._schemas = {}
+        self.schema_changed = {}
+        # board_id → ids of the columns to decode by type (see
+        # data_cleaner.typed_column_ids); boards without an entry decode
+        # every column of a registered type
+        self.typed_columns = {}
+        # board_id → (schema fingerprint, typed ids, typed column decoders)
+        self._decoders = {}
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((requests.ConnectionError, requests.Timeout)),
-        reraise=True,
-    )
-    def _execute(self, query: str, variables: dict = None) -> dict:
-        """Execute a GraphQL query against Monday.com API."""
-        payload = {"query": query}
+        self.page_timings = deque(maxlen=PAGE_TIMING_HISTORY)
+        self.request_log = deque(maxlen=REQUEST_LOG_SIZE)
+
+    @staticmethod
+    def _payload(query: str, variables: dict = None) -> dict:
+        # Ask for the query's complexity cost as a top-level field
+        brace = query.index("{") + 1
+        payload = {"query": query[:brace] + COMPLEXITY_FIELDS + query[brace:]}
         if variables:
             payload["variables"] = variables
+        return payload
 
-        try:
-            resp = requests.post(
-                MONDAY_API_URL,
-                json=payload,
-                headers=self.headers,
-                timeout=30,
+    def _pace(self, query: str) -> float:
+        """
+        Reserve the query's expected cost; returns seconds to wait before
+        sending. Raises MondayRateLimitError instead when the budget would
+        hold the query for longer than MAX_RATE_LIMIT_WAIT_S.
+        """
+        delay = self.budget.acquire(self.budget.estimate(query), MAX_RATE_LIMIT_WAIT_S)
+        if delay > MAX_RATE_LIMIT_WAIT_S:
+            raise MondayRateLimitError(
+                f"Monday.com complexity budget exhausted, next request possible in {delay:.0f}s.", delay
             )
-            resp.raise_for_status()
-        except requests.HTTPError as e:
-            if resp.status_code == 401:
-                raise MondayAPIError(
-                    "Invalid Monday.com API token. "
-                    "Please check MONDAY_API_TOKEN in your .env file."
-                )
-            raise MondayAPIError(f"Monday.com API HTTP error: {e}")
-        except requests.Timeout:
-            raise MondayAPIError("Monday.com API request timed out. Please try again.")
-        except requests.ConnectionError:
-            raise MondayAPIError("Cannot reach Monday.com API. Check your internet connection.")
+        return delay
 
-        data = resp.json()
+    def _unwrap(self, query: str, data: dict, metrics: dict = None) -> dict:
+        """Raise on GraphQL errors, else record complexity and return the `data` member."""
         if "errors" in data and data["errors"]:
-            err_msg = data["errors"][0].get("message", "Unknown error")
+            error = data["errors"][0]
+            err_msg = error.get("message", "Unknown error")
+            code = (error.get("extensions") or {}).get("code", "")
+            if "complexity" in code.lower() or "complexity budget" in err_msg.lower():
+                hint = _RESET_HINT_RE.search(err_msg)
+                retry_after = float(hint.group(1)) if hint else 60.0
+                self.budget.block_for(retry_after)
+                raise MondayRateLimitError(f"Monday.com GraphQL error: {err_msg}", retry_after)
             raise MondayAPIError(f"Monday.com GraphQL error: {err_msg}")
+        result = data.get("data") or {}
+        complexity = result.pop("complexity", None)
+        self.budget.observe(query, complexity)
+        if metrics is not None:
+            metrics["complexity"] = complexity
+        return result
 
-        return data.get("data", {})
+    # ── fetch instrumentation ────────────────────
 
-    def get_board_schema(self, board_id: str) -> dict:
+    @staticmethod
+    def _request_metrics() -> dict:
+        """Per-call accumulator filled in by every attempt of _send()."""
+        return {"attempts": 0, "bytes": 0, "parse_s": 0.0, "paced_s": 0.0, "complexity": None}
+
+    @staticmethod
+    def _count_items(data: dict) -> int:
+        """Items in a response: items_page of every (aliased) board, or top-level items."""
+        count = 0
+        for key, value in data.items():
+            if not isinstance(value, list):
+                continue
+            if key == "items":
+                count += len(value)
+                continue
+            for board in value:
+                if isinstance(board, dict):
+                    count += len((board.get("items_page") or {}).get("items") or [])
+        return count
+
+    def _record_request(self, metrics: dict, started: float, result: dict = None, error: Exception = None):
+        complexity = metrics["complexity"] or {}
+        self.request_log.append({
+            "wall_s": round(time.perf_counter() - started, 4),
+            "bytes": metrics["bytes"],
+            "parse_s": round(metrics["parse_s"], 4),
+            "items": self._count_items(result) if result else 0,
+            "retries": max(0, metrics["attempts"] - 1),
+            "complexity": complexity.get("query"),
+            "error": type(error).__name__ if error is not None else None,
+        })
+
+    def fetch_stats(self) -> dict:
         """
-        Fetch the board's column definitions to dynamically detect schema.
-        Returns a dict: {column_id: {title, type}}
+        Aggregate the per-request log since the last reset_fetch_stats():
+        wall time (request_s is summed, so concurrent requests overlap),
+        response bytes, JSON parse time, items returned, retries and the
+        complexity points spent.
         """
-        query = """
-        query ($boardId: [ID!]) {
-          boards(ids: $boardId) {
-            id
-            name
-            columns {
-              id
-              title
-              type
-            }
-          }
+        log = list(self.request_log)
+        walls = sorted(r["wall_s"] for r in log)
+
+        def _percentile_ms(p):
+            if not walls:
+                return 0.0
+            return round(1000 * walls[min(len(walls) - 1, int(p * len(walls)))], 1)
+
+        return {
+            "requests": len(log),
+            "errors": sum(1 for r in log if r["error"]),
+            "retries": sum(r["retries"] for r in log),
+            "request_s": round(sum(walls), 3),
+            "p50_ms": _percentile_ms(0.50),
+            "p95_ms": _percentile_ms(0.95),
+            "max_ms": round(1000 * walls[-1], 1) if walls else 0.0,
+            "parse_s": round(sum(r["parse_s"] for r in log), 3),
+            "bytes": sum(r["bytes"] for r in log),
+            "items": sum(r["items"] for r in log),
+            "complexity_used": sum(r["complexity"] or 0 for r in log),
         }
+
+    def reset_fetch_stats(self):
+        """Start a new measurement window (e.g. per refresh) for fetch_stats / pagination_stats."""
+        self.request_log.clear()
+        self.page_timings.clear()
+
+    @staticmethod
+    def _retry_after(headers) -> Optional[float]:
+        """Seconds from a Retry-After header (delta-seconds or HTTP date), else None."""
+        value = headers.get("Retry-After") if headers is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    def _http_error(self, status_code: int, err: Exception, retry_after: Optional[float] = None) -> MondayAPIError:
+        if status_code == 401:
+            return MondayAPIError(
+                "Invalid Monday.com API token. "
+                "Please check MONDAY_API_TOKEN in your .env file."
+            )
+        if status_code == 429:
+            retry_after = 60.0 if retry_after is None else retry_after
+            self.budget.block_for(retry_after)
+            return MondayRateLimitError(f"Monday.com API rate limit hit: {err}", retry_after)
+        if status_code >= 500 or status_code == 408:
+            return MondayTransientError(f"Monday.com API is unavailable: {err}", retry_after)
+        return MondayAPIError(f"Monday.com API HTTP error: {err}")
+
+    def _check_circuit(self):
+        """Fail fast, without sending, while the API is known to be degraded."""
+        if not self.breaker.allow():
+            retry_after = self.breaker.retry_after()
+            raise MondayCircuitOpenError(
+                f"Monday.com API is temporarily unavailable (circuit open, next attempt in {retry_after:.0f}s).",
+                retry_after,
+            )
+
+    @contextmanager
+    def _circuit_attempt(self):
+        """
+        Wrap one attempt: _check_circuit, then make sure the breaker always
+        hears how it ended. API errors are fed in by _failed; any other
+        exception counts as a failure (re-opening a half-open breaker), and
+        a half-open probe that ends without a verdict (cancelled, refused by
+        _pace, rate-limited or rejected by the API) hands its slot back, so
+        the breaker can never stay stuck in half_open.
+        """
+        self._check_circuit()
+        probe = self.breaker.state == HALF_OPEN
+        try:
+            yield
+        except Exception as e:
+            if not isinstance(e, MondayAPIError):
+                self.breaker.record_failure()
+            raise
+        finally:
+            if probe:
+                self.breaker.release()
+
+    def _failed(self, error: MondayAPIError) -> MondayAPIError:
+        """
+        Feed an attempt's error to the breaker: transient errors count as API
+        failures. Rate limits and request errors (4xx) say nothing about the
+        API's health, so they leave the breaker as it is.
+        """
+        if isinstance(error, MondayTransientError):
+            self.breaker.record_failure()
+        return error
+
+    @staticmethod
+    def schema_fingerprint(raw_columns: list) -> str:
+        """
+        Stable hash of a board's column layout (ids, titles, types, in order —
+        order matters because keyword resolution takes the first match).
+        """
+        layout = [(col["id"], col["title"], col["type"]) for col in raw_columns]
+        return hashlib.sha1(json.dumps(layout).encode("utf-8")).hexdigest()[:16]
+
+    def _parse_schema(self, board_id: str, data: dict) -> dict:
+        """
+        Turn a `boards { columns }` response into
+        {board_id, board_name, columns, fingerprint}.
+        If the fingerprint matches the cached schema for the board, the cached
+        dict is returned unchanged so everything derived from it stays valid.
         """
-        data = self._execute(query, {"boardId": [str(board_id)]})
         boards = data.get("boards", [])
         if not boards:
             raise MondayAPIError(
@@ -101,94 +552,921 @@ class MondayClient:
                 "Check DEALS_BOARD_ID / WORKORDERS_BOARD_ID in your .env file."
             )
         board = boards[0]
+        fingerprint = self.schema_fingerprint(board["columns"])
+        cached = self._schemas.get(str(board_id))
+        if cached is not None and cached["fingerprint"] == fingerprint and cached["board_name"] == board["name"]:
+            self.schema_changed[str(board_id)] = False
+            return cached
+
         schema = {
             "board_id": board["id"],
             "board_name": board["name"],
             "columns": {col["id"]: {"title": col["title"], "type": col["type"]} for col in board["columns"]},
+            "fingerprint": fingerprint,
         }
+        self._schemas[str(board_id)] = schema
+        self.schema_changed[str(board_id)] = cached is not None
         return schema
 
-    def get_board_items(self, board_id: str, limit: int = 500) -> list:
+    def column_decoders(self, board_id: str) -> Optional[dict]:
         """
-        Fetch all items from a board with cursor-based pagination.
-        Returns a flat list of item dicts with column_values unpacked.
+        column_id → typed decoder (see column_decoders) for a board whose
+        schema has been seen, limited to typed_columns[board_id] when set;
+        rebuilt only when the schema fingerprint or typed_columns change.
+        None before the schema is known: values stay raw text.
         """
-        all_items = []
-        cursor = None
+        schema = self._schemas.get(str(board_id))
+        if schema is None:
+            return None
+        typed = self.typed_columns.get(str(board_id))
+        typed = tuple(typed) if typed is not None else None
+        cached = self._decoders.get(str(board_id))
+        if cached is None or cached[:2] != (schema["fingerprint"], typed):
+            decoders = decoders_for(schema["columns"])
+            if typed is not None:
+                decoders = {col_id: decode for col_id, decode in decoders.items() if col_id in typed}
+            cached = self._decoders[str(board_id)] = (schema["fingerprint"], typed, decoders)
+        return cached[2]
 
-        while True:
-            if cursor:
-                query = """
-                query ($boardId: [ID!], $limit: Int, $cursor: String!) {
-                  boards(ids: $boardId) {
-                    items_page(limit: $limit, cursor: $cursor) {
-                      cursor
-                      items {
-                        id
-                        name
-                        column_values {
-                          id
-                          text
-                          value
-                        }
-                      }
-                    }
-                  }
-                }
-                """
-                variables = {"boardId": [str(board_id)], "limit": limit, "cursor": cursor}
-            else:
-                query = """
-                query ($boardId: [ID!], $limit: Int) {
-                  boards(ids: $boardId) {
-                    items_page(limit: $limit) {
-                      cursor
-                      items {
-                        id
-                        name
-                        column_values {
-                          id
-                          text
-                          value
-                        }
-                      }
-                    }
-                  }
-                }
-                """
-                variables = {"boardId": [str(board_id)], "limit": limit}
-
-            data = self._execute(query, variables)
-            boards = data.get("boards", [])
-            if not boards:
-                break
-
-            page = boards[0].get("items_page", {})
-            items = page.get("items", [])
-
-            for item in items:
-                flat = {"_item_id": item["id"], "_item_name": item["name"]}
-                for cv in item.get("column_values", []):
-                    flat[cv["id"]] = cv.get("text") or cv.get("value") or ""
-                all_items.append(flat)
-
-            cursor = page.get("cursor")
-            if not cursor or not items:
-                break
+    def cached_schema(self, board_id: str) -> Optional[dict]:
+        """Last schema seen for a board, or None."""
+        return self._schemas.get(str(board_id))
+
+    def remember_schema(self, schema: dict):
+        """Seed the schema cache (e.g. from a snapshot)."""
+        if schema.get("fingerprint"):
+            self._schemas[str(schema["board_id"])] = schema
+
+    @staticmethod
+    def _with_column_ids(query: str, variables: dict, column_ids: list = None) -> tuple:
+        """
+        Restrict every column_values selection in `query` to `column_ids`.
+        None means all columns; returns (query, variables) unchanged.
+        """
+        if column_ids is None:
+            return query, variables
+        query = query.replace("query (", "query ($columnIds: [String!], ", 1)
+        query = query.replace("column_values {", "column_values(ids: $columnIds) {")
+        return query, {**variables, "columnIds": list(column_ids)}
+
+    @classmethod
+    def _page_request(
+        cls,
+        board_id: str,
+        limit: int,
+        cursor: str = None,
+        query_params: dict = None,
+        column_ids: list = None,
+    ) -> tuple:
+        """Return (query, variables) for the first or a follow-up items page."""
+        if cursor:
+            query, variables = NEXT_PAGE_QUERY, {"boardId": [str(board_id)], "limit": limit, "cursor": cursor}
+        elif query_params:
+            query, variables = FILTERED_PAGE_QUERY, {"boardId": [str(board_id)], "limit": limit, "queryParams": query_params}
+        else:
+            query, variables = FIRST_PAGE_QUERY, {"boardId": [str(board_id)], "limit": limit}
+        return cls._with_column_ids(query, variables, column_ids)
+
+    @staticmethod
+    def _updated_since_params(since: str) -> dict:
+        """items_page query_params selecting items updated on or after `since` (YYYY-MM-DD)."""
+        return {
+            "rules": [{
+                "column_id": "__last_updated__",
+                "compare_value": ["EXACT", since],
+                "compare_attribute": "UPDATED_AT",
+                "operator": "greater_than_or_equals",
+            }]
+        }
+
+    @staticmethod
+    def _parse_ids(data: dict) -> tuple:
+        """Returns (item_ids, next_cursor) from an ids-only items_page response."""
+        boards = data.get("boards", [])
+        if not boards:
+            return [], None
+        page = boards[0].get("items_page", {})
+        ids = [item["id"] for item in page.get("items", [])]
+        return ids, (page.get("cursor") if ids else None) or None
+
+    @staticmethod
+    def _parse_probe(board_ids: list, data: dict) -> dict:
+        """
+        Split a PROBE_QUERY response per board.
+        Returns {board_id: {items_count, updated_at, last_item_id,
+        last_item_updated_at}} with a MondayAPIError for boards not found.
+        """
+        found = {str(board["id"]): board for board in data.get("boards") or []}
+        probes = {}
+        for board_id in board_ids:
+            board = found.get(str(board_id))
+            if board is None:
+                probes[board_id] = MondayAPIError(f"Board {board_id} not found or no access.")
+                continue
+            latest = ((board.get("items_page") or {}).get("items") or [{}])[0]
+            probes[board_id] = {
+                "items_count": board.get("items_count"),
+                "updated_at": board.get("updated_at"),
+                "last_item_id": latest.get("id"),
+                "last_item_updated_at": latest.get("updated_at"),
+            }
+        return probes
+
+    @staticmethod
+    def _sync_point() -> str:
+        """
+        Sync point recorded before a fetch starts. Monday filters
+        __last_updated__ by calendar day, so a one-day margin covers timezone
+        skew; re-fetching a few unchanged items is harmless because patching
+        is idempotent.
+        """
+        return (datetime.now(timezone.utc) - timedelta(days=1)).date().isoformat()
+
+    def _page_limit(self, board_id: str, limit: int = None) -> int:
+        """Explicit page size, or the tuned one for this board when limit is None."""
+        return limit or self.page_tuner.limit(board_id)
+
+    def _tune_page_size(self, board_id: str, limit: int, items, seconds: float, metrics: dict):
+        complexity = (metrics["complexity"] or {}).get("query")
+        self.page_tuner.observe(
+            board_id, limit, page_size(items), seconds - metrics["paced_s"], metrics["bytes"], complexity
+        )
+
+    @staticmethod
+    def _batch_request(board_ids: list, limits: dict, columns: dict = None) -> tuple:
+        """
+        Build one aliased document returning columns + first items page for
+        every board, so a refresh needs a single round trip before pagination.
+        limits maps board_id → first page size; columns optionally maps
+        board_id → column-id allowlist for that board.
+        Returns (query, variables).
+        """
+        columns = columns or {}
+        var_decls = []
+        selections = []
+        variables = {}
+        for i, board_id in enumerate(board_ids):
+            var_decls.append(f"$b{i}: [ID!]")
+            variables[f"b{i}"] = [str(board_id)]
+            var_decls.append(f"$l{i}: Int")
+            variables[f"l{i}"] = limits[board_id]
+            page_fields = ITEMS_PAGE_FIELDS
+            if columns.get(board_id) is not None:
+                var_decls.append(f"$c{i}: [String!]")
+                variables[f"c{i}"] = list(columns[board_id])
+                page_fields = page_fields.replace("column_values {", f"column_values(ids: $c{i}) {{")
+            selections.append(
+                f"""
+  b{i}: boards(ids: $b{i}) {{
+    id
+    name
+    columns {{
+      id
+      title
+      type
+    }}
+    items_page(limit: $l{i}) {{{page_fields}    }}
+  }}"""
+            )
+        query = "query (%s) {%s\n}" % (", ".join(var_decls), "".join(selections))
+        return query, variables
+
+    def _parse_batch(self, board_ids: list, data: dict, columnar: bool = False, on_schema=None) -> list:
+        """
+        Split a batched response per board; on_schema(board_id, schema) is
+        called for each board before its first page is decoded.
+        Returns a list of (schema, first_page_items, cursor) tuples, or a
+        MondayAPIError for boards that were not found, in board_ids order.
+        """
+        results = []
+        for i, board_id in enumerate(board_ids):
+            boards = data.get(f"b{i}") or []
+            try:
+                schema = self._parse_schema(board_id, {"boards": boards})
+            except MondayAPIError as e:
+                results.append(e)
+                continue
+            if on_schema is not None:
+                on_schema(board_id, schema)
+            items, cursor = self._parse_page({"boards": boards}, columnar, self.column_decoders(board_id))
+            results.append((schema, items, cursor))
+        return results
+
+    def _record_page(self, board_id: str, page_no: int, items, fetch_s: float, wait_s: float, process_s: float):
+        self.page_timings.append({
+            "board_id": str(board_id),
+            "page": page_no,
+            "items": page_size(items),
+            "fetch_s": round(fetch_s, 4),
+            "wait_s": round(wait_s, 4),
+            "process_s": round(process_s, 4),
+        })
+
+    def pagination_stats(self) -> dict:
+        """
+        Summarise recent page timings. fetch_s is time spent downloading
+        pages, wait_s the part of it the consumer actually blocked on; the
+        difference (overlap_s) is network time hidden behind page processing.
+        Returns: {pages, items, fetch_s, wait_s, process_s, overlap_s, overlap_ratio}
+        """
+        timings = list(self.page_timings)
+        fetch_s = sum(t["fetch_s"] for t in timings)
+        wait_s = sum(t["wait_s"] for t in timings)
+        overlap_s = max(0.0, fetch_s - wait_s)
+        return {
+            "pages": len(timings),
+            "items": sum(t["items"] for t in timings),
+            "fetch_s": round(fetch_s, 3),
+            "wait_s": round(wait_s, 3),
+            "process_s": round(sum(t["process_s"] for t in timings), 3),
+            "overlap_s": round(overlap_s, 3),
+            "overlap_ratio": round(overlap_s / fetch_s, 3) if fetch_s else 0.0,
+        }
+
+    @staticmethod
+    def _cell_value(cv: dict, decoders: Optional[dict]):
+        decode = decoders.get(cv["id"]) if decoders else None
+        if decode is not None:
+            return decode(cv.get("text"), cv.get("value"))
+        return cv.get("text") or cv.get("value") or ""
 
+    @classmethod
+    def _flatten_items(cls, items: list, decoders: dict = None) -> list:
+        """
+        Unpack column_values into flat {_item_id, _item_name, column_id: value}
+        dicts. Columns with a typed decoder get floats / ISO dates, the rest
+        their text.
+        """
+        cell = cls._cell_value
+        flat_items = []
+        for item in items:
+            flat = {"_item_id": item["id"], "_item_name": item["name"]}
+            for cv in item.get("column_values", []):
+                flat[cv["id"]] = cell(cv, decoders)
+            flat_items.append(flat)
+        return flat_items
+
+    @classmethod
+    def _columnar_items(cls, items: list, decoders: dict = None) -> dict:
+        """
+        Columnar form of _flatten_items: {"_item_id": [...], "_item_name": [...],
+        column_id: [...]}, one entry per item in every list ("" where an item
+        has no value). Skips building a dict per item.
+        """
+        cell = cls._cell_value
+        item_ids, names = [], []
+        columns = {"_item_id": item_ids, "_item_name": names}
+        for n, item in enumerate(items):
+            item_ids.append(item["id"])
+            names.append(item["name"])
+            values = item.get("column_values", [])
+            for cv in values:
+                column = columns.get(cv["id"])
+                if column is None:
+                    column = columns[cv["id"]] = [""] * n
+                column.append(cell(cv, decoders))
+            if len(values) != len(columns) - 2:
+                for column in columns.values():
+                    if len(column) <= n:
+                        column.append("")
+        return columns
+
+    @classmethod
+    def _parse_page(cls, data: dict, columnar: bool = False, decoders: dict = None) -> tuple:
+        """
+        Flatten one items_page response, into a list of flat item dicts or,
+        with columnar=True, into per-column lists (see _columnar_items).
+        decoders are the board's column_decoders().
+        Returns (items, next_cursor); next_cursor is None on the last page.
+        """
+        decode = cls._columnar_items if columnar else cls._flatten_items
+        boards = data.get("boards", [])
+        if not boards:
+            return decode([], decoders), None
+
+        page = boards[0].get("items_page", {})
+        items = page.get("items", [])
+        flat_items = decode(items, decoders)
+
+        cursor = page.get("cursor")
+        if not items:
+            cursor = None
+        return flat_items, cursor or None
+
+
+class AsyncMondayClient(_MondayClientBase):
+    """
+    Read-only Monday.com GraphQL API client (asyncio, httpx) with retry,
+    pacing, a circuit breaker and prefetching pagination. Independent
+    requests (cursor chains of several boards) run concurrently over one
+    pooled keep-alive connection set.
+    """
+
+    def __init__(
+        self,
+        token: str = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        budget: ComplexityBudget = None,
+        breaker: CircuitBreaker = None,
+        page_tuner: PageSizeTuner = None,
+    ):
+        super().__init__(token, budget, breaker, page_tuner)
+        self.client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=REQUEST_TIMEOUT_S,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize,
+            ),
+        )
+        self._requests = 0
+        self._connections_opened = 0
+
+        # Delta sync: board_id → {schema, items (item_id → flat item), since}
+        self._sync_state = {}
+        self.last_sync_changes = {}
+
+    async def _trace(self, event_name: str, info: dict):
+        """httpcore trace hook — only fires connect_tcp for new connections."""
+        if event_name == "connection.connect_tcp.complete":
+            self._connections_opened += 1
+
+    def connection_stats(self) -> dict:
+        """
+        Report connection reuse for the Monday.com host.
+        Returns: {requests, connections_opened, connections_reused}
+        """
+        return {
+            "requests": self._requests,
+            "connections_opened": self._connections_opened,
+            "connections_reused": max(0, self._requests - self._connections_opened),
+        }
+
+    async def aclose(self):
+        """Close all pooled connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    @_retry_rate_limited
+    @_retry_transient
+    async def _send(self, query: str, variables: dict, metrics: dict) -> dict:
+        """One attempt at a GraphQL query; retried by the decorators above."""
+        metrics["attempts"] += 1
+        with self._circuit_attempt():
+            delay = self._pace(query)
+            if delay > 0:
+                metrics["paced_s"] += delay
+                await asyncio.sleep(delay)
+            self._requests += 1
+            try:
+                resp = await self.client.post(
+                    MONDAY_API_URL,
+                    json=self._payload(query, variables),
+                    extensions={"trace": self._trace},
+                )
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise self._failed(
+                    self._http_error(e.response.status_code, e, self._retry_after(e.response.headers))
+                )
+            except httpx.TimeoutException:
+                raise self._failed(MondayTransientError("Monday.com API request timed out. Please try again."))
+            except httpx.TransportError:
+                raise self._failed(MondayTransientError("Cannot reach Monday.com API. Check your internet connection."))
+            self.breaker.record_success()
+
+        metrics["bytes"] += len(resp.content)
+        parse_started = time.perf_counter()
+        body = resp.json()
+        metrics["parse_s"] += time.perf_counter() - parse_started
+        return self._unwrap(query, body, metrics)
+
+    async def _execute(self, query: str, variables: dict = None, metrics: dict = None) -> dict:
+        """
+        Execute a GraphQL query against Monday.com API, recording its fetch
+        metrics (into `metrics` too, when the caller passes a dict to read).
+        """
+        metrics, started = metrics or self._request_metrics(), time.perf_counter()
+        try:
+            result = await self._send(query, variables, metrics)
+        except MondayAPIError as e:
+            self._record_request(metrics, started, error=e)
+            raise
+        self._record_request(metrics, started, result)
+        return result
+
+    async def get_board_schema(self, board_id: str) -> dict:
+        """
+        Fetch the board's column definitions to dynamically detect schema.
+        Returns a dict: {column_id: {title, type}}
+        """
+        data = await self._execute(SCHEMA_QUERY, {"boardId": [str(board_id)]})
+        return self._parse_schema(board_id, data)
+
+    async def _timed_page(
+        self,
+        board_id: str,
+        limit: int,
+        cursor: str = None,
+        column_ids: list = None,
+        columnar: bool = False,
+    ) -> tuple:
+        """
+        Fetch one page. limit=None requests the board's tuned size and feeds
+        the page's cost back to the tuner.
+        Returns (items, next_cursor, seconds taken).
+        """
+        page_limit, metrics = self._page_limit(board_id, limit), self._request_metrics()
+        started = time.perf_counter()
+        query, variables = self._page_request(board_id, page_limit, cursor, column_ids=column_ids)
+        data = await self._execute(query, variables, metrics)
+        items, cursor = self._parse_page(data, columnar, self.column_decoders(board_id))
+        elapsed = time.perf_counter() - started
+        if limit is None:
+            self._tune_page_size(board_id, page_limit, items, elapsed, metrics)
+        return items, cursor, elapsed
+
+    async def _aiter_pages(
+        self,
+        board_id: str,
+        limit: int,
+        column_ids: list = None,
+        first: tuple = None,
+        columnar: bool = False,
+    ):
+        """
+        Prefetching paginator. `first` is an already fetched
+        (items, cursor, seconds) page to start from; otherwise the first page
+        is requested here; per-page timings go to self.page_timings. Pages of
+        one board are inherently sequential, but page N+1 is requested as a task as soon as
+        page N's cursor is parsed. Callers doing CPU work per page should run
+        it off the event loop (see stream_boards_data) for the download to
+        actually progress meanwhile.
+        """
+        pending = None if first else asyncio.create_task(
+            self._timed_page(board_id, limit, None, column_ids, columnar)
+        )
+        page_no = 0
+        try:
+            while first or pending:
+                waited = time.perf_counter()
+                items, cursor, fetch_s = first or await pending
+                wait_s = fetch_s if first else time.perf_counter() - waited
+                first = None
+                pending = (
+                    asyncio.create_task(self._timed_page(board_id, limit, cursor, column_ids, columnar))
+                    if cursor else None
+                )
+
+                handed_over = time.perf_counter()
+                yield items
+                self._record_page(board_id, page_no, items, fetch_s, wait_s, time.perf_counter() - handed_over)
+                page_no += 1
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+    async def aiter_board_item_pages(
+        self,
+        board_id: str,
+        limit: int = None,
+        column_ids: list = None,
+        columnar: bool = False,
+    ):
+        """
+        Async generator over a board's items, one flattened page (list of
+        item dicts, or per-column lists with columnar=True) at a time. Page
+        N+1 is requested as soon as page N's cursor is known; at most one
+        page is held ahead, so memory stays bounded by page size.
+        """
+        async for page in self._aiter_pages(board_id, limit, column_ids, columnar=columnar):
+            yield page
+
+    async def get_board_items(
+        self,
+        board_id: str,
+        limit: int = None,
+        column_ids: list = None,
+        columnar: bool = False,
+    ):
+        """
+        Fetch all items from a board with cursor-based pagination.
+        limit=None sizes every page from the board's observed per-item cost
+        (see page_tuner.PageSizeTuner); an int fixes the page size.
+        column_ids optionally restricts column_values to an allowlist
+        (see data_cleaner.required_column_ids); None fetches every column.
+        Returns a flat list of item dicts with column_values unpacked, or
+        with columnar=True a dict of per-column lists (column id → values),
+        which the data_cleaner cleaners accept directly.
+        """
+        all_items = {} if columnar else []
+        async for page in self.aiter_board_item_pages(board_id, limit, column_ids, columnar):
+            if columnar:
+                extend_columns(all_items, page)
+            else:
+                all_items.extend(page)
         return all_items
 
-    def get_board_data(self, board_id: str) -> tuple:
+    async def get_board_data(self, board_id: str, limit: int = None, column_ids: list = None) -> tuple:
         """
-        Convenience: fetch schema + items together.
+        Fetch schema + items; schema and first page share one request.
         Returns (schema_dict, items_list)
         """
-        schema = self.get_board_schema(board_id)
-        items = self.get_board_items(board_id)
-        return schema, items
+        outcome = (await self.get_boards_data([board_id], limit, {board_id: column_ids}))[0]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
 
-    def validate_connection(self) -> dict:
+    async def get_boards_data(self, board_ids: list, limit: int = None, columns: dict = None) -> list:
+        """
+        Fetch several boards at once. Schemas and first pages of all boards
+        come back in one batched request; remaining cursors are then followed
+        concurrently per board, so latency tracks the slowest board.
+        columns optionally maps board_id → column-id allowlist.
+        Returns a list of (schema, items) tuples or MondayAPIError instances,
+        in the same order as board_ids.
+        """
+        collected = {bid: [] for bid in board_ids}
+        schemas = await self.stream_boards_data(
+            board_ids,
+            lambda board_id, schema, items: collected[board_id].extend(items),
+            limit,
+            columns,
+        )
+        return [
+            outcome if isinstance(outcome, BaseException) else (outcome, collected[bid])
+            for bid, outcome in zip(board_ids, schemas)
+        ]
+
+    async def stream_boards_data(
+        self,
+        board_ids: list,
+        on_page,
+        limit: int = None,
+        columns: dict = None,
+        columnar: bool = False,
+        on_schema=None,
+    ) -> list:
+        """
+        Streaming form of get_boards_data: on_page(board_id, schema, items) is
+        called for every page as soon as it arrives, so callers can clean
+        pages while other boards are still downloading and drop them after.
+        on_page runs in a worker thread, one page per board at a time, while
+        the board's next page is prefetched on the event loop. With
+        columnar=True pages arrive as per-column lists (see get_board_items).
+        on_schema(board_id, schema), if given, runs on the event loop as soon
+        as a board's schema is known, before any of its items are decoded
+        (e.g. to set typed_columns) and before its follow-up pages are
+        requested: an allowlist it adds to `columns` already applies to them.
+        Returns a list of schema dicts or MondayAPIError instances, in the
+        same order as board_ids.
+        """
+        if not board_ids:
+            return []
+        columns = {} if columns is None else columns
+        limits = {bid: self._page_limit(bid, limit) for bid in board_ids}
+        query, variables = self._batch_request(board_ids, limits, columns)
+        started = time.perf_counter()
+        try:
+            first = self._parse_batch(board_ids, await self._execute(query, variables), columnar, on_schema)
+        except MondayAPIError as e:
+            return [e] * len(board_ids)
+        batch_s = time.perf_counter() - started
+
+        async def _follow(board_id, outcome):
+            if isinstance(outcome, MondayAPIError):
+                return outcome
+            schema, items, cursor = outcome
+            first_page = (items, cursor, batch_s)
+            async for page in self._aiter_pages(board_id, limit, columns.get(board_id), first_page, columnar):
+                await asyncio.to_thread(on_page, board_id, schema, page)
+            return schema
+
+        return await asyncio.gather(
+            *(_follow(bid, outcome) for bid, outcome in zip(board_ids, first)),
+            return_exceptions=True,
+        )
+
+    async def _get_item_ids(self, board_id: str, limit: int = None) -> set:
+        """Ids of every item currently on the board (no column values)."""
+        ids, cursor = set(), None
+        limit = limit or self.page_tuner.max_size  # ids-only pages stay small
+        while True:
+            page, cursor = self._parse_ids(await self._execute(
+                ITEM_IDS_QUERY, {"boardId": [str(board_id)], "limit": limit, "cursor": cursor}
+            ))
+            ids.update(page)
+            if not cursor:
+                return ids
+
+    async def _delta_sync_board(self, board_id: str, limit: int, column_ids: list = None, on_schema=None) -> tuple:
+        """
+        Patch the cached item set of an already-synced board in place:
+        fetch items updated since the last sync point, then drop items whose
+        ids are no longer on the board. Added items are among the updated
+        ones, so when the board's items_count equals the patched cache size
+        nothing was deleted and the ids scan is skipped.
+        """
+        state = self._sync_state[board_id]
+        sync_point = self._sync_point()
+        query_params = self._updated_since_params(state["since"])
+
+        query, variables = self._page_request(
+            board_id, self._page_limit(board_id, limit), query_params=query_params, column_ids=column_ids
+        )
+        started = time.perf_counter()
+        data = await self._execute(query, variables)
+        schema = self._parse_schema(board_id, data)
+        if on_schema is not None:
+            on_schema(board_id, schema)
+        items_count = (data.get("boards") or [{}])[0].get("items_count")
+        items, cursor = self._parse_page(data, decoders=self.column_decoders(board_id))
+        changed = []
+        async for page in self._aiter_pages(board_id, limit, column_ids, (items, cursor, time.perf_counter() - started)):
+            changed.extend(page)
+
+        cached = state["items"]
+        patched = len(cached) + sum(1 for item in changed if item["_item_id"] not in cached)
+        scanned = items_count is None or items_count != patched
+        live_ids = await self._get_item_ids(board_id, limit) if scanned else None
+
+        state["schema"] = schema
+        for item in changed:
+            cached[item["_item_id"]] = item
+        deleted = [item_id for item_id in cached if item_id not in live_ids] if scanned else []
+        for item_id in deleted:
+            del cached[item_id]
+
+        state["since"] = sync_point
+        self.last_sync_changes[board_id] = {
+            "mode": "delta", "updated": len(changed), "deleted": len(deleted), "ids_scanned": scanned,
+        }
+        return state["schema"], list(cached.values())
+
+    async def sync_boards_data(
+        self,
+        board_ids: list,
+        limit: int = None,
+        full: bool = False,
+        columns: dict = None,
+    ) -> list:
+        """
+        Like get_boards_data, but keeps the item set of each board cached and,
+        after the first full download, only fetches items changed since the
+        last sync (plus an ids-only scan to detect deletions, when the
+        board's item count shows some).
+        Pass full=True to discard the cache and re-download everything.
+        columns optionally maps board_id → column-id allowlist. Cached items
+        only hold the allowlisted columns, so a caller whose allowlist
+        changes with the column layout must re-sync that board with
+        full=True (see schema_changed).
+        Returns a list of (schema, items) tuples or MondayAPIError instances,
+        in the same order as board_ids.
+        """
+        collected = {bid: [] for bid in board_ids}
+        schemas = await self.stream_sync_boards_data(
+            board_ids,
+            lambda board_id, schema, items: collected[board_id].extend(items),
+            limit,
+            full,
+            columns,
+        )
+        return [
+            outcome if isinstance(outcome, BaseException) else (outcome, collected[bid])
+            for bid, outcome in zip(board_ids, schemas)
+        ]
+
+    async def stream_sync_boards_data(
+        self,
+        board_ids: list,
+        on_page,
+        limit: int = None,
+        full: bool = False,
+        columns: dict = None,
+        on_schema=None,
+    ) -> list:
+        """
+        Streaming form of sync_boards_data: on_page(board_id, schema, items)
+        receives each board's current item set page by page, in a worker
+        thread, and on_schema(board_id, schema) sees every schema before its
+        items are decoded, as with stream_boards_data. Full downloads are
+        handed over as they arrive (with the next page prefetched
+        meanwhile); synced boards are patched first, then their cached items
+        are handed over in page-sized slices. Returns a list of schema dicts or MondayAPIError
+        instances, in the same order as board_ids.
+        """
+        columns = {} if columns is None else columns
+        fresh = [bid for bid in board_ids if full or bid not in self._sync_state]
+        known = [bid for bid in board_ids if bid not in fresh]
+        sync_point = self._sync_point()
+        fresh_items = {bid: {} for bid in fresh}
+
+        def _on_fresh_page(board_id, schema, items):
+            # The first page is requested before the schema (and so the
+            # allowlist) is known; only the allowlisted columns are cached
+            column_ids = columns.get(board_id)
+            fresh_items[board_id].update((item["_item_id"], project_item(item, column_ids)) for item in items)
+            on_page(board_id, schema, items)
+
+        async def _delta(board_id):
+            schema, items = await self._delta_sync_board(board_id, limit, columns.get(board_id), on_schema)
+            size = self._page_limit(board_id, limit)
+            for start in range(0, len(items), size):
+                await asyncio.to_thread(on_page, board_id, schema, items[start:start + size])
+            return schema
+
+        full_results, delta_results = await asyncio.gather(
+            self.stream_boards_data(fresh, _on_fresh_page, limit, columns, on_schema=on_schema),
+            asyncio.gather(*(_delta(bid) for bid in known), return_exceptions=True),
+        )
+
+        outcomes = dict(zip(known, delta_results))
+        for board_id, outcome in zip(fresh, full_results):
+            outcomes[board_id] = outcome
+            items = fresh_items.pop(board_id)
+            if isinstance(outcome, BaseException):
+                self._sync_state.pop(board_id, None)
+                continue
+            self._sync_state[board_id] = {"schema": outcome, "items": items, "since": sync_point}
+            self.last_sync_changes[board_id] = {"mode": "full", "updated": len(items), "deleted": 0}
+
+        return [outcomes[bid] for bid in board_ids]
+
+    async def get_items(self, item_ids: list, column_ids: list = None, board_id: str = None) -> list:
+        """
+        Fetch specific items by id, flattened like get_board_items (decoded
+        with board_id's column types when given).
+        Deleted or inaccessible items are simply absent from the result, as
+        are items that now live on another board than board_id.
+        """
+        if not item_ids:
+            return []
+        query, variables = self._with_column_ids(
+            ITEMS_BY_ID_QUERY, {"itemIds": [str(i) for i in item_ids]}, column_ids
+        )
+        data = await self._execute(query, variables)
+        items = data.get("items") or []
+        if board_id:
+            items = [item for item in items if str((item.get("board") or {}).get("id")) == str(board_id)]
+        return self._flatten_items(items, self.column_decoders(board_id) if board_id else None)
+
+    def apply_item_change(self, board_id: str, item_id: str, item: Optional[dict]):
+        """
+        Patch the delta-sync cache for one item: replace it with `item`, or
+        drop it when item is None. No-op for boards that are not synced yet.
+        """
+        state = self._sync_state.get(board_id)
+        if state is None:
+            return
+        if item is None:
+            state["items"].pop(str(item_id), None)
+        else:
+            state["items"][str(item_id)] = item
+
+    def restrict_sync_columns(self, board_id: str, column_ids: list):
+        """
+        Drop the columns outside column_ids from a synced board's cached
+        items, e.g. once its allowlist is known (items cached before carry
+        every column until they change). No-op for unsynced boards.
+        """
+        state = self._sync_state.get(board_id)
+        if state is None or column_ids is None:
+            return
+        keep = {"_item_id", "_item_name", *column_ids}
+        items = state["items"]
+        for item_id, item in items.items():
+            if not item.keys() <= keep:
+                items[item_id] = project_item(item, column_ids)
+
+    def export_sync_state(self) -> dict:
+        """Delta-sync state as {board_id: {schema, items (list), since}} for snapshots."""
+        return {
+            board_id: {"schema": state["schema"], "items": list(state["items"].values()), "since": state["since"]}
+            for board_id, state in self._sync_state.items()
+        }
+
+    def restore_sync_state(self, boards: dict):
+        """
+        Seed delta sync from a snapshot so the next sync_boards_data call only
+        fetches what changed since the snapshot was taken.
+        """
+        for board_id, board in boards.items():
+            if not board.get("since"):
+                continue
+            self._sync_state[board_id] = {
+                "schema": board["schema"],
+                "items": {item["_item_id"]: item for item in board["items"]},
+                "since": board["since"],
+            }
+            self.remember_schema(board["schema"])
+
+    async def probe_boards(self, board_ids: list) -> dict:
+        """
+        Cheap change check for several boards in one request (see PROBE_QUERY).
+        Compare with the previous result: equal probes mean no item was
+        added, edited or removed in between.
+        """
+        if not board_ids:
+            return {}
+        data = await self._execute(PROBE_QUERY, {"boardIds": [str(b) for b in board_ids], "order": PROBE_ORDER})
+        return self._parse_probe(board_ids, data)
+
+    async def validate_connection(self) -> dict:
         """Test API token validity by fetching the current user."""
-        query = "{ me { id name email } }"
-        data = self._execute(query)
+        data = await self._execute(ME_QUERY)
         return data.get("me", {})
+
+
+class MondayClient:
+    """
+    Blocking wrapper around AsyncMondayClient for scripts and tools (e.g.
+    mock_monday_server.record_fixture). Calls run on a private event loop
+    in a background thread, so retries, pacing, the circuit breaker and
+    page prefetching are the async client's; other attributes (stats,
+    budget, breaker, ...) are read straight from it.
+    """
+
+    def __init__(
+        self,
+        token: str = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        budget: ComplexityBudget = None,
+        breaker: CircuitBreaker = None,
+        page_tuner: PageSizeTuner = None,
+    ):
+        self.client = AsyncMondayClient(token, pool_maxsize, budget, breaker, page_tuner)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="monday-client", daemon=True)
+        self._thread.start()
+
+    def __getattr__(self, name: str):
+        if name == "client":  # not set yet (failed __init__)
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    def _run(self, coro):
+        """Run a coroutine on the client's loop and wait for its result."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close(self):
+        """Close all pooled connections and stop the event loop."""
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self.client.aclose())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _execute(self, query: str, variables: dict = None, metrics: dict = None) -> dict:
+        return self._run(self.client._execute(query, variables, metrics))
+
+    def get_board_schema(self, board_id: str) -> dict:
+        return self._run(self.client.get_board_schema(board_id))
+
+    def get_board_items(self, board_id: str, limit: int = None, column_ids: list = None, columnar: bool = False):
+        return self._run(self.client.get_board_items(board_id, limit, column_ids, columnar))
+
+    def iter_board_item_pages(self, board_id: str, limit: int = None, column_ids: list = None, columnar: bool = False):
+        """
+        Generator form of AsyncMondayClient.aiter_board_item_pages; the next
+        page keeps downloading on the loop while the caller handles this one.
+        """
+        pages = self.client.aiter_board_item_pages(board_id, limit, column_ids, columnar)
+        try:
+            while True:
+                try:
+                    yield self._run(pages.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            self._run(pages.aclose())
+
+    def get_board_data(self, board_id: str, limit: int = None, column_ids: list = None) -> tuple:
+        return self._run(self.client.get_board_data(board_id, limit, column_ids))
+
+    def get_boards_data(self, board_ids: list, limit: int = None, columns: dict = None) -> list:
+        return self._run(self.client.get_boards_data(board_ids, limit, columns))
+
+    def probe_boards(self, board_ids: list) -> dict:
+        return self._run(self.client.probe_boards(board_ids))
+
+    def validate_connection(self) -> dict:
+        return self._run(self.client.validate_connection())
@@ -0,0 +1,99 @@
+"""
+page_tuner.py
+Per-board items_page size tuning for Monday.com pagination.
+A fixed page size is wrong both ways: narrow boards waste round trips on
+small pages, wide boards return huge, slow, complexity-heavy ones. The tuner
+learns each board's per-item cost (response time, bytes, complexity) from
+full pages and sizes the next page to stay within the configured targets.
+"""
+
+import os
+import threading
+from typing import Optional
+
+# Monday.com caps items_page at 500 items
+DEFAULT_MIN_PAGE_SIZE = int(os.getenv("MONDAY_PAGE_SIZE_MIN", "50"))
+DEFAULT_MAX_PAGE_SIZE = int(os.getenv("MONDAY_PAGE_SIZE_MAX", "500"))
+DEFAULT_TARGET_MS = float(os.getenv("MONDAY_PAGE_TARGET_MS", "2500"))
+DEFAULT_TARGET_BYTES = int(os.getenv("MONDAY_PAGE_TARGET_BYTES", str(4 * 1024 * 1024)))
+DEFAULT_TARGET_COMPLEXITY = int(os.getenv("MONDAY_PAGE_TARGET_COMPLEXITY", "500000"))
+
+
+class PageSizeTuner:
+    """
+    Remembers a page size per board and adjusts it from observed pages.
+
+    limit(board_id) is the size to request next; observe() folds in one
+    page's measurements. Sizes move halfway towards the ideal each time and
+    at most double per step, so one slow response cannot swing them wildly.
+    """
+
+    def __init__(
+        self,
+        min_size: int = DEFAULT_MIN_PAGE_SIZE,
+        max_size: int = DEFAULT_MAX_PAGE_SIZE,
+        target_ms: float = DEFAULT_TARGET_MS,
+        target_bytes: int = DEFAULT_TARGET_BYTES,
+        target_complexity: int = DEFAULT_TARGET_COMPLEXITY,
+        initial: Optional[int] = None,
+    ):
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.target_ms = target_ms
+        self.target_bytes = target_bytes
+        self.target_complexity = target_complexity
+        self.initial = self._clamp(initial or self.max_size)
+        self._lock = threading.Lock()
+        self._sizes = {}
+
+    def _clamp(self, size: float) -> int:
+        return int(max(self.min_size, min(self.max_size, size)))
+
+    # ── public API ───────────────────────────────
+
+    def limit(self, board_id: str) -> int:
+        """Page size to request next for this board."""
+        return self._sizes.get(str(board_id), self.initial)
+
+    def observe(
+        self,
+        board_id: str,
+        limit: int,
+        items: int,
+        seconds: float,
+        nbytes: int,
+        complexity: Optional[float] = None,
+    ) -> int:
+        """
+        Fold in one page fetched with `limit` that returned `items` items.
+        Only full pages are used — a short last page is dominated by fixed
+        per-request overhead. Returns the board's new page size.
+        """
+        board_id = str(board_id)
+        if items <= 0 or items < limit:
+            return self.limit(board_id)
+
+        ideal = [self.max_size]
+        if seconds > 0 and self.target_ms:
+            ideal.append(self.target_ms / (1000.0 * seconds / items))
+        if nbytes and self.target_bytes:
+            ideal.append(self.target_bytes / (nbytes / items))
+        if complexity and self.target_complexity:
+            # Monday.com charges by the requested limit, not the items returned
+            ideal.append(self.target_complexity / (complexity / limit))
+
+        with self._lock:
+            current = self._sizes.get(board_id, self.initial)
+            step = current + (min(ideal) - current) / 2
+            self._sizes[board_id] = self._clamp(min(step, current * 2))
+            return self._sizes[board_id]
+
+    def export(self) -> dict:
+        """board_id → tuned size, for persisting between runs."""
+        return dict(self._sizes)
+
+    def restore(self, sizes: dict):
+        """Seed tuned sizes saved by export()."""
+        with self._lock:
+            for board_id, size in (sizes or {}).items():
+                self._sizes[str(board_id)] = self._clamp(size)
@@ -0,0 +1,144 @@
+"""
+rate_limiter.py
+Complexity-budget token bucket for Monday.com GraphQL calls.
+Monday.com charges every query a complexity cost against a per-minute budget;
+this bucket paces requests so a refresh never runs the budget dry mid-pagination.
+The bucket state can live in a file so several worker processes share it.
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Optional
+
+try:
+    import fcntl  # POSIX only — without it the bucket is per-process
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+DEFAULT_BUDGET_PER_MINUTE = int(os.getenv("MONDAY_COMPLEXITY_BUDGET", "10000000"))
+DEFAULT_STATE_FILE = os.getenv("MONDAY_RATE_LIMIT_FILE", "")
+
+
+class ComplexityBudget:
+    """
+    Token bucket measured in complexity points.
+
+    acquire(cost) reserves points and returns how long the caller should
+    sleep before sending; observe() re-syncs the bucket with the authoritative
+    `complexity { after reset_in_x_seconds }` numbers Monday.com returns.
+    """
+
+    def __init__(
+        self,
+        budget_per_minute: int = DEFAULT_BUDGET_PER_MINUTE,
+        state_file: Optional[str] = DEFAULT_STATE_FILE or None,
+    ):
+        self.capacity = float(budget_per_minute)
+        self.refill_per_second = self.capacity / 60.0
+        self.state_file = state_file
+        self._lock = threading.Lock()
+        self._state = {"tokens": self.capacity, "updated": time.time(), "blocked_until": 0.0}
+        # query text → last observed cost; first use of a query is unpaced
+        self._cost_estimates = {}
+
+    # ── shared state ─────────────────────────────
+
+    def _locked(self, mutate):
+        """Run mutate(state) under the thread lock and, if configured, the file lock."""
+        with self._lock:
+            if not self.state_file or fcntl is None:
+                return mutate(self._state)
+            with open(self.state_file, "a+") as fh:
+                fcntl.flock(fh, fcntl.LOCK_EX)
+                try:
+                    fh.seek(0)
+                    raw = fh.read()
+                    state = json.loads(raw) if raw.strip() else dict(self._state)
+                    result = mutate(state)
+                    fh.seek(0)
+                    fh.truncate()
+                    json.dump(state, fh)
+                    self._state = state
+                    return result
+                finally:
+                    fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _refill(self, state: dict, now: float):
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(self.capacity, state["tokens"] + elapsed * self.refill_per_second)
+        state["updated"] = now
+
+    # ── public API ───────────────────────────────
+
+    def estimate(self, query: str) -> float:
+        """Expected cost of a query, from the last time it was seen."""
+        return self._cost_estimates.get(query, 0.0)
+
+    def acquire(self, cost: float, max_wait: float = None) -> float:
+        """
+        Reserve `cost` points. Returns seconds to wait before sending.
+        Reservations may drive the bucket negative so concurrent callers
+        queue up behind each other instead of all firing at once. When the
+        wait would exceed max_wait nothing is reserved (the caller is
+        expected to give up rather than send).
+        """
+        def _take(state):
+            now = time.time()
+            self._refill(state, now)
+            wait = max(0.0, state["blocked_until"] - now)
+            if state["tokens"] < cost:
+                wait = max(wait, (cost - state["tokens"]) / self.refill_per_second)
+            if max_wait is None or wait <= max_wait:
+                state["tokens"] -= cost
+            return wait
+
+        return self._locked(_take)
+
+    def observe(self, query: str, complexity: dict):
+        """
+        Update from a response's complexity block:
+        {query, before, after, reset_in_x_seconds}.
+        """
+        if not complexity:
+            return
+        cost = complexity.get("query")
+        if cost is not None:
+            self._cost_estimates[query] = float(cost)
+        after = complexity.get("after")
+        if after is None:
+            return
+
+        def _sync(state):
+            now = time.time()
+            self._refill(state, now)
+            # Server's remaining budget is authoritative, but keep in-flight
+            # reservations made by other callers since this request was sent.
+            state["tokens"] = min(state["tokens"], float(after))
+
+        self._locked(_sync)
+
+    def block_for(self, seconds: float):
+        """Budget exhausted: hold every caller until Monday.com's reset hint elapses."""
+        def _block(state):
+            now = time.time()
+            state["tokens"] = 0.0
+            state["updated"] = now
+            state["blocked_until"] = max(state["blocked_until"], now + seconds)
+
+        self._locked(_block)
+
+    def snapshot(self) -> dict:
+        """Current bucket level, for status/diagnostics."""
+        def _peek(state):
+            now = time.time()
+            self._refill(state, now)
+            return {
+                "capacity": int(self.capacity),
+                "available": int(state["tokens"]),
+                "blocked_for_s": round(max(0.0, state["blocked_until"] - now), 1),
+                "shared": bool(self.state_file and fcntl is not None),
+            }
+
+        return self._locked(_peek)
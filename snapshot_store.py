@@ -0,0 +1,99 @@
+"""
+snapshot_store.py
+On-disk snapshot of raw Monday.com board data for warm restarts.
+Stores the last schema, raw items and sync point of every board as gzip'd
+JSON, with items packed as rows under a shared key list so per-item keys
+are not repeated.
+"""
+
+import os
+import gzip
+import json
+import time
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_PATH = os.getenv("MONDAY_SNAPSHOT_PATH", ".cache/monday_snapshot.json.gz")
+
+
+def _pack_items(items) -> dict:
+    if isinstance(items, dict):
+        # Already columnar (column id → values): rows are a transpose away
+        return {"keys": list(items), "rows": [list(row) for row in zip(*items.values())]}
+    keys = []
+    seen = set()
+    for item in items:
+        for k in item:
+            if k not in seen:
+                seen.add(k)
+                keys.append(k)
+    rows = [[item.get(k, "") for k in keys] for item in items]
+    return {"keys": keys, "rows": rows}
+
+
+def _unpack_items(packed: dict) -> list:
+    keys = packed["keys"]
+    return [dict(zip(keys, row)) for row in packed["rows"]]
+
+
+def save_snapshot(boards: dict, path: str = DEFAULT_SNAPSHOT_PATH, meta: dict = None) -> int:
+    """
+    Write {board_id: {schema, items, since}} to `path` atomically.
+    items is a list of flat item dicts or a columnar dict of lists; meta is
+    any small JSON-able client state to restore alongside (e.g. page sizes).
+    Returns the size of the written file in bytes.
+    """
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "saved_at": time.time(),
+        "meta": meta or {},
+        "boards": {
+            board_id: {
+                "schema": board["schema"],
+                "since": board.get("since"),
+                "items": _pack_items(board["items"]),
+            }
+            for board_id, board in boards.items()
+        },
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=5) as fh:
+        json.dump(payload, fh, separators=(",", ":"))
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+
+def load_snapshot(path: str = DEFAULT_SNAPSHOT_PATH) -> Optional[dict]:
+    """
+    Read a snapshot written by save_snapshot.
+    Returns {"saved_at", "meta", "boards": {board_id: {schema, items, since}}} or
+    None if the file is missing, unreadable or from another format version.
+    """
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable snapshot {path}: {e}")
+        return None
+    if payload.get("version") != SNAPSHOT_VERSION:
+        return None
+    return {
+        "saved_at": payload.get("saved_at"),
+        "meta": payload.get("meta") or {},
+        "boards": {
+            board_id: {
+                "schema": board["schema"],
+                "since": board.get("since"),
+                "items": _unpack_items(board["items"]),
+            }
+            for board_id, board in payload.get("boards", {}).items()
+        },
+    }
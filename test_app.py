@@ -0,0 +1,40 @@
+"""
+test_app.py — FastAPI routes that work without a loaded agent.
+"""
+import asyncio
+
+import httpx
+
+import app as server
+
+
+def post_webhook(payload, secret=None):
+    async def send():
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            params = {"secret": secret} if secret is not None else {}
+            return await client.post("/webhooks/monday", json=payload, params=params)
+
+    return asyncio.run(send())
+
+
+def test_webhook_refused_without_configured_secret(monkeypatch):
+    monkeypatch.delenv("MONDAY_WEBHOOK_SECRET", raising=False)
+    assert post_webhook({"challenge": "abc"}).status_code == 403
+    assert post_webhook({"challenge": "abc"}, secret="").status_code == 403
+
+
+def test_webhook_checks_secret(monkeypatch):
+    monkeypatch.setenv("MONDAY_WEBHOOK_SECRET", "s3cret")
+    assert post_webhook({"challenge": "abc"}).status_code == 403
+    assert post_webhook({"challenge": "abc"}, secret="wrong").status_code == 403
+    response = post_webhook({"challenge": "abc"}, secret="s3cret")
+    assert response.status_code == 200
+    assert response.json() == {"challenge": "abc"}
+
+
+def test_webhook_rejects_non_object_json(monkeypatch):
+    monkeypatch.setenv("MONDAY_WEBHOOK_SECRET", "s3cret")
+    assert post_webhook([1, 2], secret="s3cret").status_code == 400
+    assert post_webhook("challenge", secret="s3cret").status_code == 400
+    assert post_webhook({"event": [1, 2]}, secret="s3cret").status_code == 400
@@ -0,0 +1,84 @@
+"""
+test_column_decoders.py — typed column decoders on malformed Monday.com
+values: they must clean to what the plain-text path gives.
+"""
+import asyncio
+
+import pytest
+
+from column_decoders import decode_date, decode_number, decoders_for
+from data_cleaner import DealsCleaner, normalize_date, normalize_revenue
+from mock_monday_server import synthetic_fixture
+from monday_client import AsyncMondayClient
+
+
+def text_path(text, value):
+    """What a cell held before typed decoding (see _cell_value)."""
+    return text or value or ""
+
+
+@pytest.mark.parametrize("text, value", [
+    ("12,500", '"12500"'),
+    ("", "null"),
+    ("", '""'),
+    ("abc", '"abc"'),
+    ("5", '{"x": 1}'),
+    ("7", "[7]"),
+    ("", '"NaN"'),
+    ("", '"inf"'),
+    ("", '"1e999"'),
+    ("x", "not json"),
+    ("", ""),
+    (None, None),
+])
+def test_malformed_numbers_clean_like_text(text, value):
+    decoded = decode_number(text, value)
+    assert normalize_revenue(decoded) == normalize_revenue(text_path(text, value))
+
+
+@pytest.mark.parametrize("text, value", [
+    ("2024-01-05", '{"date": "2024-01-05", "time": null}'),
+    ("5 Jan 2024", '{"date": null}'),
+    ("", '{"date": "2024-13-45"}'),
+    ("5 Jan 2024", '{"date": "2024-13-45"}'),
+    ("junk", "{bad"),
+    ("", "[]"),
+    ("", None),
+])
+def test_malformed_dates_clean_like_text(text, value):
+    decoded = decode_date(text, value)
+    assert normalize_date(decoded) == normalize_date(text_path(text, value))
+
+
+def test_only_number_and_date_types_are_decoded():
+    columns = {"a": {"type": "numbers"}, "b": {"type": "text"}, "c": {}, "d": {"type": "status"}, "e": {"type": "date"}}
+    assert decoders_for(columns) == {"a": decode_number, "e": decode_date}
+    # labels with an empty text keep falling back to their value
+    assert AsyncMondayClient._cell_value({"id": "d", "text": "", "value": '{"index": 1}'}, decoders_for(columns)) == '{"index": 1}'
+
+
+def test_malformed_cells_from_mock_clean_like_text(mock_monday):
+    fixture = synthetic_fixture(60, 0)
+    broken = [
+        {"deal_value": ("", '"NaN"'), "close_date": ("junk", "{bad")},
+        {"deal_value": ("abc", '{"x": 1}'), "close_date": ("", '{"date": null}')},
+        {"deal_value": ("", "null"), "close_date": ("5 Jan 2024", '{"date": "2024-13-45"}')},
+    ]
+    for item, cells in zip(fixture["boards"]["1001"]["items"], broken):
+        for cv in item["column_values"]:
+            if cv["id"] in cells:
+                cv["text"], cv["value"] = cells[cv["id"]]
+
+    client = AsyncMondayClient("mock")
+    mock_monday(client, fixture)
+    [(schema, items)] = asyncio.run(client.get_boards_data(["1001"]))
+    plain = [
+        {"_item_id": item["id"], "_item_name": item["name"],
+         **{cv["id"]: text_path(cv["text"], cv["value"]) for cv in item["column_values"]}}
+        for item in fixture["boards"]["1001"]["items"]
+    ]
+
+    decoded = DealsCleaner(schema).add_page(items).to_frame()
+    expected = DealsCleaner(schema).add_page(plain).to_frame()
+    for column in ("deal_value", "close_date"):
+        assert decoded[column].equals(expected[column])
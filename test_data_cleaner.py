@@ -0,0 +1,337 @@
+"""
+test_data_cleaner.py — the bulk normalizers agree with the per-value ones,
+and the columnar cleaners with a plain record-by-record reference.
+"""
+import math
+import random
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from analytics import (
+    cross_board_analysis,
+    generate_leadership_update,
+    operational_metrics,
+    pipeline_health,
+    revenue_analytics,
+)
+from column_decoders import decoders_for
+from data_cleaner import (
+    DATE_FORMATS,
+    DEAL_DTYPES,
+    DEAL_FIELD_KEYWORDS,
+    PROBABILITY_MAP,
+    WORKORDER_DTYPES,
+    DealsCleaner,
+    WorkOrdersCleaner,
+    clear_normalizer_caches,
+    column_plan,
+    compact_frame,
+    compute_caveats,
+    map_deal_status,
+    map_exec_status,
+    normalize_date,
+    normalize_date_series,
+    normalize_revenue,
+    normalize_revenue_series,
+    normalize_text,
+    normalizer_cache_stats,
+)
+from mock_monday_server import synthetic_fixture
+from monday_client import AsyncMondayClient
+
+# Currency words/symbols, Indian multipliers, exponents, stray whitespace and
+# separators, look-alike characters and values that are not strings at all
+REVENUE_PIECES = [
+    "İnr5", "ınr5", "RS.5", "Rſ5", "Rſ.5k", "r s5", "1\0 2", "\n5k", "5K", "5  k", "5\x1ck",
+    "INR\n1,000", "usd5eur", "eur.5", "rs..5", "5.L", "5.cR", "CR", "5e3K", "5E+3l", "-5Cr",
+    "+-5", "1e", '  {"value":"1k"}', '₹"5"', "₹{5}", "5 k", "١٢٣k", "5kL", "Rs", "rs.",
+    "5 rs. 3", "3,,4", "\t", "﻿5", "₹ 4.5 L", "$1,20,000", "£ 2.3Cr", "€900", "",
+]
+REVENUE_VALUES = [None, 0, 12500, -3, 2.5, float("nan"), float("inf"), -float("inf"), True]
+
+
+def same_float(a, b):
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    return a == b and math.copysign(1, a) == math.copysign(1, b)
+
+
+def test_revenue_series_matches_scalar():
+    rng = random.Random(7)
+    values = REVENUE_PIECES + REVENUE_VALUES + [
+        "".join(rng.choice(REVENUE_PIECES) for _ in range(rng.randint(1, 3))) for _ in range(3000)
+    ]
+    expected = [normalize_revenue(v) for v in values]
+    got = normalize_revenue_series(values).tolist()
+    mismatches = [(v, a, b) for v, a, b in zip(values, expected, got) if not same_float(a, b)]
+    assert mismatches == []
+
+
+def test_revenue_series_keeps_strings_apart_after_nul():
+    values = ["inf\0nan", "inf", "100\0abc", "100", "1,000\0", "1,000", "\0", ""]
+    assert normalize_revenue_series(values).tolist() == [normalize_revenue(v) for v in values]
+
+
+# Blanks, JSON cells, impossible dates, padding, ambiguous day/month order,
+# unpadded fields, extreme years and non-string values
+DATE_ODDITIES = [
+    "", None, float("nan"), "garbage", "2024-02-30", '{"date":"2025-01-02"}', '{"date":""}', "{bad",
+    " 2025-01-05 ", "2025-1-5", "01/02/2025", "13/02/2025", "02/13/2025", "5 Jan 2025",
+    "January 5, 2025", "5 January 2025", "2025/01/05", "05-01-2025", "31/12/2999", "0001-01-01",
+    5, 3.5, date(2025, 1, 1), "2025-01-05T00:00", "Jan 5 2025", "5 jan 2025", "5  Jan 2025", "2025-01-05\n",
+]
+
+
+def scalar_dates(values):
+    return pd.to_datetime(pd.Series([normalize_date(v) for v in values], dtype=object), errors="coerce")
+
+
+def assert_same_dates(values):
+    expected, got = scalar_dates(values), normalize_date_series(values)
+    assert got.dtype == expected.dtype
+    same = (expected.to_numpy() == got.to_numpy()) | (expected.isna().to_numpy() & got.isna().to_numpy())
+    assert [values[i] for i in np.flatnonzero(~same)] == []
+
+
+def random_dates(rng, n, fmt=None):
+    days = (date(2020, 1, 1) + timedelta(days=rng.randint(0, 3000)) for _ in range(n))
+    return [d.strftime(fmt or rng.choice(DATE_FORMATS)) for d in days]
+
+
+def test_date_series_matches_scalar():
+    rng = random.Random(3)
+    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y", None):
+        values = random_dates(rng, 2000, fmt) + [rng.choice(DATE_ODDITIES) for _ in range(300)]
+        rng.shuffle(values)
+        assert_same_dates(values)
+    assert_same_dates(DATE_ODDITIES)
+    assert normalize_date_series([]).empty
+
+
+def test_date_series_keeps_strings_apart_after_nul():
+    assert_same_dates(["2024-01-05", "2024-01-05\0", "2024-01-05\0x", "5 Jan 2024\0", "5 Jan 2024"])
+
+
+# ── cleaners vs a record-by-record reference ──
+
+def reference_deal(name, item_id, raw):
+    name = str(name).strip()
+    if not name or name.lower() == "deal name":
+        return None
+    value = normalize_revenue(raw["value"])
+    probability = PROBABILITY_MAP.get(normalize_text(raw["probability"]), 0.0)
+    return {
+        "deal_name": name,
+        "owner_code": str(raw["owner"]).strip(),
+        "client_code": str(raw["client"]).strip(),
+        "status": map_deal_status(raw["status"], raw["stage"]),
+        "stage": normalize_text(raw["stage"]),
+        "sector": normalize_text(raw["sector"]) or "unknown",
+        "deal_value": value,
+        "probability": probability,
+        "weighted_value": value * probability,
+        "close_date": normalize_date(raw["close_date"]) or normalize_date(raw["tentative_date"]),
+        "created_date": normalize_date(raw["created"]),
+        "product": str(raw["product"]).strip(),
+        "item_id": str(item_id),
+    }
+
+
+def reference_workorder(name, item_id, raw):
+    name = str(name).strip()
+    if not name:
+        return None
+    exec_status = map_exec_status(raw["exec_status"])
+    amount = normalize_revenue(raw["amount_excl"]) or normalize_revenue(raw["amount_incl"])
+    billed = normalize_revenue(raw["billed_excl"])
+    unbilled = amount - billed
+    return {
+        "wo_name": name,
+        "deal_name_linked": str(raw["deal_name"]).strip() if raw["deal_name"] else name,
+        "sector": normalize_text(raw["sector"]) or "unknown",
+        "exec_status": exec_status,
+        "is_active": exec_status in ("Ongoing", "Not Started", "Paused", "Partially Completed", "Pending"),
+        "amount_excl_gst": amount,
+        "billed_excl_gst": billed,
+        "unbilled_amount": unbilled if unbilled > 0.0 else 0.0,
+        "wo_status": normalize_text(raw["wo_status"]),
+        "nature_of_work": str(raw["nature"]).strip(),
+        "owner_code": str(raw["owner"]).strip(),
+        "start_date": normalize_date(raw["start_date"]),
+        "end_date": normalize_date(raw["end_date"]),
+        "item_id": str(item_id),
+    }
+
+
+REFERENCES = {
+    DealsCleaner: (reference_deal, ["close_date", "created_date"]),
+    WorkOrdersCleaner: (reference_workorder, ["start_date", "end_date"]),
+}
+
+
+def reference_frame(cleaner_cls, schema, items):
+    clean_record, date_columns = REFERENCES[cleaner_cls]
+    fields = {field: match["column_id"] for field, match in column_plan(schema, cleaner_cls.FIELD_KEYWORDS).items()}
+    records = []
+    for item in items:
+        raw = {field: item.get(col_id, "") if col_id else "" for field, col_id in fields.items()}
+        record = clean_record(item.get("_item_name", ""), item.get("_item_id", ""), raw)
+        if record is not None:
+            records.append(record)
+    df = pd.DataFrame(records)
+    for column in date_columns:
+        df[column] = pd.to_datetime(df[column], errors="coerce")
+    return df
+
+
+def board_items(board, messy):
+    """(schema, flat items) of a mock board, with hand-written messy items appended."""
+    schema = {"columns": {c["id"]: {"title": c["title"], "type": c["type"]} for c in board["columns"]}}
+    items = AsyncMondayClient._flatten_items(board["items"], decoders_for(schema["columns"]))
+    return schema, items + messy
+
+
+MESSY_DEALS = [
+    {"_item_id": "1", "_item_name": "Deal Name", "deal_value": "5"},  # header-like row
+    {"_item_id": "2", "_item_name": "  "},
+    {"_item_id": "3", "_item_name": " Padded ", "deal_value": "Rs. 4.5 L", "probability": " HIGH ",
+     "close_date": "", "tentative_close": "31/12/2025", "deal_status": "won"},
+    {"_item_id": "4", "_item_name": "Inf", "deal_value": "1e400", "probability": "", "created": "2025-02-30"},
+    {"_item_id": "5", "_item_name": "Text value", "deal_value": "about 5 cr", "sector": "  "},
+]
+MESSY_WORKORDERS = [
+    {"_item_id": "1", "_item_name": "Incl only", "amount_excl": "", "amount_incl": "₹1,18,000"},
+    {"_item_id": "2", "_item_name": "Over billed", "amount_excl": 1000.0, "billed_excl": 2500.0},
+    {"_item_id": "3", "_item_name": "Infinite", "amount_excl": "1e400", "billed_excl": "1e400"},
+    {"_item_id": "4", "_item_name": ""},
+]
+BOARDS = [
+    (DealsCleaner, "1001", MESSY_DEALS),
+    (WorkOrdersCleaner, "1002", MESSY_WORKORDERS),
+]
+
+
+def test_cleaners_match_reference_for_list_and_columnar_pages():
+    fixture = synthetic_fixture(700, 400)
+    for cleaner_cls, board_id, messy in BOARDS:
+        schema, items = board_items(fixture["boards"][board_id], messy)
+        expected = reference_frame(cleaner_cls, schema, items)
+
+        pages = [items[i:i + 150] for i in range(0, len(items), 150)]
+        from_lists = cleaner_cls(schema)
+        from_columns = cleaner_cls(schema)
+        for page in pages:
+            from_lists.add_page(page)
+            from_columns.add_page(AsyncMondayClient._columnar_items(
+                [{"id": i["_item_id"], "name": i["_item_name"],
+                  "column_values": [{"id": k, "text": v} for k, v in i.items() if not k.startswith("_")]}
+                 for i in page]
+            ))
+
+        pd.testing.assert_frame_equal(from_lists.to_frame(), expected)
+        pd.testing.assert_frame_equal(from_columns.to_frame(), expected)
+
+
+def test_out_of_range_close_date_does_not_fall_back():
+    # these parse, so normalize_date never falls back, but datetime64[ns] cannot hold them
+    fixture = synthetic_fixture(50, 0)
+    messy = [
+        {"_item_id": "6", "_item_name": "Ancient", "close_date": "0001-01-01", "tentative_close": "31/12/2025"},
+        {"_item_id": "7", "_item_name": "Far future", "close_date": "31/12/2999", "tentative_close": "2025-06-30"},
+        {"_item_id": "8", "_item_name": "Unparseable", "close_date": "soon", "tentative_close": "2025-06-30"},
+    ]
+    schema, items = board_items(fixture["boards"]["1001"], messy)
+    df = DealsCleaner(schema).add_page(items).to_frame()
+    pd.testing.assert_frame_equal(df, reference_frame(DealsCleaner, schema, items))
+    close = df.set_index("deal_name")["close_date"]
+    assert close[["Ancient", "Far future"]].isna().all()
+    assert close["Unparseable"] == pd.Timestamp("2025-06-30")
+
+
+def test_patch_frame_matches_reference():
+    fixture = synthetic_fixture(300, 200)
+    for cleaner_cls, board_id, messy in BOARDS:
+        schema, items = board_items(fixture["boards"][board_id], messy)
+        cleaner = cleaner_cls(schema)
+        df = cleaner_cls(schema).add_page(items).to_frame()
+
+        # update one item, add one, delete one, and blank out another's name
+        updated = {**items[10], "_item_name": "Renamed", "deal_value": "Rs 7 L", "amount_excl": "7k"}
+        added = {**items[20], "_item_id": "99999", "_item_name": "Added"}
+        blanked = {**items[30], "_item_name": ""}
+        df = cleaner.patch_frame(df, updated["_item_id"], updated)
+        df = cleaner.patch_frame(df, added["_item_id"], added)
+        df = cleaner.patch_frame(df, items[5]["_item_id"], None)
+        df = cleaner.patch_frame(df, blanked["_item_id"], blanked)
+
+        patched = {updated["_item_id"], items[5]["_item_id"], blanked["_item_id"]}
+        expected_items = [i for i in items if i["_item_id"] not in patched] + [updated, added]
+        pd.testing.assert_frame_equal(df.reset_index(drop=True), reference_frame(cleaner_cls, schema, expected_items))
+
+
+# ── compact (categorical) frames vs plain ones ──
+
+def test_analytics_on_compact_frames_match_plain_frames():
+    fixture = synthetic_fixture(800, 500)
+    deals_schema, deal_items = board_items(fixture["boards"]["1001"], MESSY_DEALS)
+    wo_schema, wo_items = board_items(fixture["boards"]["1002"], MESSY_WORKORDERS)
+    deals = DealsCleaner(deals_schema).add_page(deal_items).to_frame().assign(source_board="1001")
+    workorders = WorkOrdersCleaner(wo_schema).add_page(wo_items).to_frame().assign(source_board="1002")
+    compact_deals, report = compact_frame(deals, DEAL_DTYPES)
+    compact_workorders, _ = compact_frame(workorders, WORKORDER_DTYPES)
+    assert isinstance(compact_deals["status"].dtype, pd.CategoricalDtype)
+    assert report["bytes_after"] < report["bytes_before"]
+
+    for period in (None, "ytd", "this_quarter", "this_month"):
+        assert revenue_analytics(compact_deals, period) == revenue_analytics(deals, period)
+        assert pipeline_health(compact_deals, period) == pipeline_health(deals, period)
+    assert operational_metrics(compact_workorders) == operational_metrics(workorders)
+    assert cross_board_analysis(compact_deals, compact_workorders) == cross_board_analysis(deals, workorders)
+    caveats = compute_caveats(deals, workorders)
+    assert compute_caveats(compact_deals, compact_workorders) == caveats
+    assert (
+        generate_leadership_update(compact_deals, compact_workorders, caveats)
+        == generate_leadership_update(deals, workorders, caveats)
+    )
+
+
+# ── column plans and memoization ──
+
+def test_column_plan_is_compiled_once_per_fingerprint():
+    columns = {
+        "c1": {"title": "Deal Status", "type": "status"},
+        "c2": {"title": "Masked Deal value", "type": "numbers"},
+    }
+    schema = {"fingerprint": "abc", "columns": columns}
+    plan = column_plan(schema, DEAL_FIELD_KEYWORDS)
+    assert plan["value"] == {"column_id": "c2", "title": "Masked Deal value", "keyword": "value"}
+    assert plan["sector"]["column_id"] is None
+
+    # the same fingerprint hits the cache, whatever dict it arrives in
+    assert column_plan({"fingerprint": "abc", "columns": dict(columns)}, DEAL_FIELD_KEYWORDS) is plan
+    assert DealsCleaner(schema).plan is plan
+    # a new layout compiles a new plan; without a fingerprint, ids and titles are the key
+    moved = {"fingerprint": "def", "columns": {"c3": columns["c2"], "c1": columns["c1"]}}
+    assert column_plan(moved, DEAL_FIELD_KEYWORDS)["value"]["column_id"] == "c3"
+    unfingerprinted = column_plan({"columns": columns}, DEAL_FIELD_KEYWORDS)
+    assert column_plan({"columns": dict(columns)}, DEAL_FIELD_KEYWORDS) is unfingerprinted
+
+
+def test_normalizer_cache_counts_distinct_values():
+    clear_normalizer_caches()
+    for value in ["10k", "10k", "5 L", "10k", 10_000]:
+        normalize_revenue(value)
+    # int and str keys are kept apart
+    assert normalizer_cache_stats()["normalize_revenue"] == {"hits": 2, "misses": 3, "size": 3}
+
+    fixture = synthetic_fixture(500, 0)
+    schema, items = board_items(fixture["boards"]["1001"], [])
+    DealsCleaner(schema).add_page(items).to_frame()
+    stats = normalizer_cache_stats()["map_deal_status"]
+    assert stats["hits"] + stats["misses"] == 500
+    assert stats["misses"] == stats["size"] == len({(i["deal_status"], i["deal_stage"]) for i in items})
+
+    clear_normalizer_caches()
+    assert all(s == {"hits": 0, "misses": 0, "size": 0} for s in normalizer_cache_stats().values())
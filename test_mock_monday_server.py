@@ -0,0 +1,165 @@
+"""
+test_mock_monday_server.py — AsyncMondayClient fetch paths end to end
+against the in-process mock Monday.com API.
+"""
+import asyncio
+import threading
+import time
+from datetime import date
+
+import pytest
+import uvicorn
+
+import monday_client
+from mock_monday_server import create_app, synthetic_fixture
+from monday_client import AsyncMondayClient, MondayRateLimitError, MondayTransientError
+
+BOARDS = ["1001", "1002"]
+
+
+@pytest.fixture
+def mock_client(mock_monday):
+    """mock_client(fixture, **options) → (client, mock state) for an AsyncMondayClient talking to the mock."""
+    def _make(fixture, **options):
+        client = AsyncMondayClient("mock")
+        return client, mock_monday(client, fixture, **options)
+    return _make
+
+
+def test_boards_fitting_one_page_cost_one_batch_request(mock_client):
+    fixture = synthetic_fixture(300, 150)
+    client, mock = mock_client(fixture)
+
+    (deal_schema, deals), (wo_schema, work_orders) = asyncio.run(client.get_boards_data(BOARDS, limit=500))
+    assert mock.requests == 1
+    assert (deal_schema["board_name"], wo_schema["board_name"]) == ("Deals", "Work Orders")
+    assert set(deal_schema["columns"]) == {col["id"] for col in fixture["boards"]["1001"]["columns"]}
+    assert (len(deals), len(work_orders)) == (300, 150)
+
+
+def test_full_then_delta_sync(mock_client):
+    fixture = synthetic_fixture(600, 300)
+    client, mock = mock_client(fixture)
+
+    full = asyncio.run(client.sync_boards_data(BOARDS, full=True))
+    for board_id, (schema, items) in zip(BOARDS, full):
+        assert len(items) == len(fixture["boards"][board_id]["items"])
+        assert client.last_sync_changes[board_id]["mode"] == "full"
+    assert schema["board_name"] == "Work Orders"
+
+    # edit one deal, delete another, add a third
+    deals = fixture["boards"]["1001"]["items"]
+    edited, deleted = deals[0], deals.pop(1)
+    edited["name"], edited["updated_at"] = "Edited deal", date.today().isoformat()
+    deals.append({**deals[2], "id": "20000000", "name": "New deal", "updated_at": date.today().isoformat()})
+    requests_before = mock.requests
+
+    (_, deal_items), (_, wo_items) = asyncio.run(client.sync_boards_data(BOARDS))
+    changes = client.last_sync_changes["1001"]
+    assert changes["mode"] == "delta" and changes["deleted"] == 1 and changes["ids_scanned"]
+    assert changes["updated"] < len(deals) / 4
+    by_id = {item["_item_id"]: item for item in deal_items}
+    assert len(by_id) == len(deals)
+    assert by_id[edited["id"]]["_item_name"] == "Edited deal"
+    assert "20000000" in by_id and deleted["id"] not in by_id
+    assert len(wo_items) == 300
+    assert mock.requests - requests_before < 10
+
+
+def test_delta_sync_without_deletions_skips_ids_scan(mock_client):
+    fixture = synthetic_fixture(600, 300)
+    client, mock = mock_client(fixture)
+    asyncio.run(client.sync_boards_data(BOARDS, full=True))
+
+    deals = fixture["boards"]["1001"]["items"]
+    deals[0]["name"], deals[0]["updated_at"] = "Edited deal", date.today().isoformat()
+    deals.append({**deals[2], "id": "20000000", "name": "New deal", "updated_at": date.today().isoformat()})
+    requests_before = mock.requests
+
+    (_, deal_items), _ = asyncio.run(client.sync_boards_data(BOARDS))
+    assert len(deal_items) == 601
+    assert not client.last_sync_changes["1001"]["ids_scanned"]
+    assert not client.last_sync_changes["1002"]["ids_scanned"]
+    assert mock.requests - requests_before == 2  # one filtered page per board
+
+
+def test_prefetch_hides_page_fetches_behind_processing(mock_client):
+    client, _ = mock_client(synthetic_fixture(600, 0), latency_ms=40)
+
+    async def consume():
+        async for _ in client.aiter_board_item_pages("1001", limit=100):
+            await asyncio.sleep(0.05)  # per-page processing, longer than a fetch
+
+    asyncio.run(consume())
+    stats = client.pagination_stats()
+    assert (stats["pages"], stats["items"]) == (6, 600)
+    assert stats["process_s"] >= 0.25
+    assert stats["wait_s"] <= stats["fetch_s"]
+    # every page after the first arrived while the previous one was processed
+    assert stats["overlap_ratio"] > 0.5
+
+    client.reset_fetch_stats()
+    assert client.pagination_stats()["pages"] == 0
+
+
+def test_fetch_stats_match_what_the_mock_served(mock_client):
+    client, mock = mock_client(synthetic_fixture(1200, 600))
+    asyncio.run(client.get_boards_data(BOARDS, limit=200))
+
+    stats = client.fetch_stats()
+    assert stats["requests"] == mock.requests == 1 + 5 + 2  # batch, then follow-up pages
+    assert stats["items"] == 1800
+    assert stats["complexity_used"] == mock._budget_used
+    assert (stats["errors"], stats["retries"]) == (0, 0)
+    assert stats["bytes"] > 0 and 0 < stats["p50_ms"] <= stats["p95_ms"] <= stats["max_ms"]
+
+    client.reset_fetch_stats()
+    assert client.fetch_stats()["requests"] == 0
+
+
+def test_injected_503_is_retried_then_reported(mock_client):
+    client, mock = mock_client(synthetic_fixture(50, 20), error_rate=1.0)
+    outcomes = asyncio.run(client.get_boards_data(BOARDS))
+    assert all(isinstance(outcome, MondayTransientError) for outcome in outcomes)
+    assert mock.requests == 3  # first attempt + MONDAY_TRANSIENT_RETRIES
+    assert client.breaker.snapshot()["consecutive_failures"] == 3
+    stats = client.fetch_stats()
+    assert (stats["requests"], stats["retries"], stats["errors"]) == (1, 2, 1)
+
+
+def test_budget_exhaustion_fails_fast(mock_client, monkeypatch):
+    # the mock resets its budget per minute; a lower cap makes that hint too long to wait out
+    monkeypatch.setattr(monday_client, "MAX_RATE_LIMIT_WAIT_S", 10)
+    client, mock = mock_client(synthetic_fixture(50, 20), budget_per_minute=50)
+    started = time.perf_counter()
+    with pytest.raises(MondayRateLimitError):
+        asyncio.run(client.get_board_items("1001"))
+    assert mock.requests == 1
+    assert time.perf_counter() - started < 2
+    assert client.budget.snapshot()["blocked_for_s"] > 0
+
+
+def test_pooled_connections_are_reused(monkeypatch):
+    # Over real sockets: the ASGI transport opens no connections to count
+    app = create_app(synthetic_fixture(1200, 600))
+    server = uvicorn.Server(uvicorn.Config(app, port=0, ws="none", log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    monkeypatch.setattr(monday_client, "MONDAY_API_URL", f"http://127.0.0.1:{port}/v2")
+
+    async def scenario():
+        async with AsyncMondayClient("mock", pool_maxsize=2) as client:
+            await client.get_boards_data(BOARDS, limit=100)
+            return client.connection_stats()
+
+    try:
+        stats = asyncio.run(scenario())
+    finally:
+        server.should_exit = True
+        thread.join()
+    assert stats["requests"] == 1 + 11 + 5  # batch, then 11 + 5 follow-up pages
+    assert 1 <= stats["connections_opened"] <= 2
+    assert stats["connections_reused"] == stats["requests"] - stats["connections_opened"]
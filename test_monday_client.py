@@ -0,0 +1,158 @@
+"""
+test_monday_client.py — AsyncMondayClient request handling (circuit
+breaker, retries) against an in-memory httpx transport.
+"""
+import time
+import asyncio
+
+import httpx
+import pytest
+
+import rate_limiter
+from circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+from monday_client import AsyncMondayClient, MondayAPIError, MondayClient, MondayRateLimitError
+from page_tuner import PageSizeTuner
+from rate_limiter import ComplexityBudget
+
+ME_RESPONSE = {"data": {"me": {"id": "1", "name": "Mock User", "email": "mock@example.com"}}}
+
+
+def make_client(handler, **options):
+    """Client whose requests are answered by handler(request) (sync or async)."""
+    client = AsyncMondayClient("mock", **options)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler), headers=client.headers)
+    return client
+
+
+def half_open_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    return breaker
+
+
+def test_cancelled_probe_releases_half_open_slot():
+    async def hang(request):
+        await asyncio.sleep(60)
+
+    breaker = half_open_breaker()
+    client = make_client(hang, breaker=breaker)
+
+    async def scenario():
+        probe = asyncio.create_task(client.validate_connection())
+        await asyncio.sleep(0.05)
+        assert breaker.state == HALF_OPEN
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(scenario())
+    assert breaker.state == HALF_OPEN
+    # the next request may probe again, and closes the breaker
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=ME_RESPONSE)))
+    assert asyncio.run(client.validate_connection())["name"] == "Mock User"
+    assert breaker.state == CLOSED
+
+
+def test_unexpected_error_reopens_half_open_breaker():
+    def broken(request):
+        raise RuntimeError("transport bug")
+
+    breaker = half_open_breaker()
+    client = make_client(broken, breaker=breaker)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(client.validate_connection())
+    assert breaker.state == OPEN
+    assert not breaker._probe_in_flight
+
+
+def test_long_rate_limit_hint_fails_fast():
+    calls = []
+
+    def limited(request):
+        calls.append(request)
+        return httpx.Response(429, headers={"Retry-After": "120"})
+
+    client = make_client(limited)
+    started = time.perf_counter()
+    with pytest.raises(MondayRateLimitError):
+        asyncio.run(client.validate_connection())
+    assert len(calls) == 1
+    assert time.perf_counter() - started < 1
+    # the budget stays blocked, so the next query is refused without sending
+    with pytest.raises(MondayRateLimitError):
+        asyncio.run(client.validate_connection())
+    assert len(calls) == 1
+
+
+def test_short_rate_limit_hint_is_retried():
+    calls = []
+
+    def limited_once(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0.2"})
+        return httpx.Response(200, json=ME_RESPONSE)
+
+    client = make_client(limited_once)
+    assert asyncio.run(client.validate_connection())["id"] == "1"
+    assert len(calls) == 2
+
+
+def test_complexity_reset_is_waited_out(monkeypatch):
+    # Monday's complexity budget resets per minute: a 60 s hint is waited out, not raised
+    now = [1_000_000.0]
+    slept = []
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+        await real_sleep(0)
+
+    monkeypatch.setattr(rate_limiter.time, "time", lambda: now[0])
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    calls = []
+
+    def exhausted_once(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(200, json={"errors": [{
+                "message": "Complexity budget exhausted, query cost 30001 budget remaining 10 out of 10000000 reset in 60 seconds",
+                "extensions": {"code": "ComplexityException"},
+            }]})
+        return httpx.Response(200, json=ME_RESPONSE)
+
+    client = make_client(exhausted_once)
+    assert asyncio.run(client.validate_connection())["id"] == "1"
+    assert len(calls) == 2
+    assert sum(slept) == pytest.approx(60.0)
+
+
+@pytest.mark.parametrize("status, error", [(429, MondayRateLimitError), (400, MondayAPIError)])
+def test_non_transient_errors_leave_breaker_alone(status, error):
+    def rejected(request):
+        return httpx.Response(status, headers={"Retry-After": "120"})
+
+    # half-open: the probe slot is handed back, the breaker neither closes nor re-opens
+    breaker = half_open_breaker()
+    with pytest.raises(error):
+        asyncio.run(make_client(rejected, breaker=breaker).validate_connection())
+    assert breaker.state == HALF_OPEN
+    assert not breaker._probe_in_flight
+
+    # closed: earlier consecutive failures are not reset
+    breaker = CircuitBreaker(failure_threshold=3)
+    breaker.record_failure()
+    with pytest.raises(error):
+        asyncio.run(make_client(rejected, breaker=breaker).validate_connection())
+    assert breaker.state == CLOSED
+    assert breaker.consecutive_failures == 1
+
+
+def test_blocking_client_forwards_every_option():
+    budget, breaker, tuner = ComplexityBudget(), CircuitBreaker(), PageSizeTuner(initial=80)
+    with MondayClient("mock", pool_maxsize=3, budget=budget, breaker=breaker, page_tuner=tuner) as client:
+        assert client.budget is budget and client.breaker is breaker and client.page_tuner is tuner
+        assert client.page_tuner.limit("1001") == 80
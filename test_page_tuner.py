@@ -0,0 +1,60 @@
+"""
+test_page_tuner.py — PageSizeTuner sizing rules, and tuning against the
+in-process mock Monday.com API.
+"""
+import asyncio
+
+from mock_monday_server import synthetic_fixture
+from monday_client import AsyncMondayClient
+from page_tuner import PageSizeTuner
+
+
+def test_slow_pages_shrink_towards_target():
+    tuner = PageSizeTuner(min_size=50, max_size=500, target_ms=2500, target_bytes=0)
+    # 500 items in 10 s → 20 ms per item, so the ideal page is 125 items
+    assert tuner.observe("1", 500, 500, seconds=10.0, nbytes=0) == 312  # halfway there
+    for _ in range(10):
+        size = tuner.observe("1", tuner.limit("1"), tuner.limit("1"), seconds=tuner.limit("1") * 0.02, nbytes=0)
+    assert size == 125
+
+
+def test_fast_pages_grow_at_most_double_per_step():
+    tuner = PageSizeTuner(min_size=50, max_size=500, initial=60)
+    sizes = []
+    for _ in range(4):
+        limit = tuner.limit("1")
+        sizes.append(tuner.observe("1", limit, limit, seconds=0.01, nbytes=limit * 100))
+    assert sizes == [120, 240, 370, 435]
+
+
+def test_bytes_and_complexity_targets_cap_the_size():
+    tuner = PageSizeTuner(min_size=10, max_size=500, target_ms=0, target_bytes=100_000)
+    assert tuner.observe("wide", 500, 500, seconds=1.0, nbytes=1_000_000) == 275  # ideal 50
+    tuner = PageSizeTuner(min_size=10, max_size=500, target_ms=0, target_bytes=0, target_complexity=5_000)
+    assert tuner.observe("costly", 500, 20, seconds=1.0, nbytes=0) == 500  # short page: ignored
+    assert tuner.observe("costly", 500, 500, seconds=1.0, nbytes=0, complexity=50_000) == 275  # ideal 50
+
+
+def test_sizes_are_clamped_and_survive_export_restore():
+    tuner = PageSizeTuner(min_size=50, max_size=500, target_ms=2500)
+    for _ in range(10):
+        limit = tuner.limit("1")
+        tuner.observe("1", limit, limit, seconds=limit * 1.0, nbytes=0)
+    assert tuner.limit("1") == 50
+
+    restored = PageSizeTuner(min_size=50, max_size=500)
+    restored.restore({**tuner.export(), "2": 10_000})
+    assert restored.limit("1") == 50
+    assert restored.limit("2") == 500
+    assert restored.limit("3") == 500
+
+
+def test_wide_board_pages_shrink_against_mock(mock_monday):
+    tuner = PageSizeTuner(min_size=50, max_size=500, target_ms=0, target_bytes=100_000)
+    client = AsyncMondayClient("mock", page_tuner=tuner)
+    mock_monday(client, synthetic_fixture(3000, 100))
+
+    (_, deals), (_, work_orders) = asyncio.run(client.get_boards_data(["1001", "1002"]))
+    assert len(deals) == 3000 and len(work_orders) == 100
+    assert 50 <= tuner.limit("1001") < 500
+    assert tuner.limit("1002") == 500  # a single short page teaches nothing
@@ -0,0 +1,76 @@
+"""
+test_rate_limiter.py — ComplexityBudget token bucket: pacing, refill,
+reconciliation with Monday.com's complexity block, and the shared state file.
+"""
+import pytest
+
+import rate_limiter
+from rate_limiter import ComplexityBudget
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen time.time() for the bucket; advance with clock.now += seconds."""
+    class Clock:
+        now = 1_000_000.0
+
+    monkeypatch.setattr(rate_limiter.time, "time", lambda: Clock.now)
+    return Clock
+
+
+def test_acquire_reserves_then_waits_for_refill(clock):
+    budget = ComplexityBudget(budget_per_minute=600)  # 10 points per second
+    assert budget.acquire(600) == 0.0
+    assert budget.acquire(100) == pytest.approx(10.0)
+    # the reservation drove the bucket negative: the next caller queues behind it
+    assert budget.acquire(100) == pytest.approx(20.0)
+
+    clock.now += 30
+    assert budget.snapshot()["available"] == 100
+    assert budget.acquire(100) == 0.0
+
+
+def test_wait_over_max_wait_reserves_nothing(clock):
+    budget = ComplexityBudget(budget_per_minute=600)
+    budget.acquire(550)
+    assert budget.acquire(100, max_wait=1.0) == pytest.approx(5.0)
+    assert budget.snapshot()["available"] == 50
+    assert budget.acquire(50, max_wait=1.0) == 0.0
+
+
+def test_observe_clamps_to_server_after_and_learns_cost(clock):
+    budget = ComplexityBudget(budget_per_minute=10_000)
+    budget.observe("query A", {"query": 250, "before": 10_000, "after": 4_000, "reset_in_x_seconds": 40})
+    assert budget.estimate("query A") == 250.0
+    assert budget.snapshot()["available"] == 4_000
+
+    # a higher `after` never undoes reservations made since the request was sent
+    budget.acquire(1_000)
+    budget.observe("query A", {"query": 250, "after": 9_000})
+    assert budget.snapshot()["available"] == 3_000
+
+    budget.observe("query B", None)
+    assert budget.estimate("query B") == 0.0
+
+
+def test_block_for_holds_every_caller(clock):
+    budget = ComplexityBudget(budget_per_minute=600)
+    budget.block_for(15)
+    assert budget.snapshot()["blocked_for_s"] == 15.0
+    assert budget.acquire(0) == pytest.approx(15.0)
+    clock.now += 15
+    assert budget.acquire(0) == 0.0
+
+
+@pytest.mark.skipif(rate_limiter.fcntl is None, reason="shared state needs fcntl")
+def test_budgets_share_one_state_file(clock, tmp_path):
+    path = str(tmp_path / "budget.json")
+    first = ComplexityBudget(budget_per_minute=600, state_file=path)
+    second = ComplexityBudget(budget_per_minute=600, state_file=path)
+
+    assert first.acquire(500) == 0.0
+    assert second.snapshot() == {"capacity": 600, "available": 100, "blocked_for_s": 0.0, "shared": True}
+    assert second.acquire(200) == pytest.approx(10.0)
+
+    second.block_for(30)
+    assert first.snapshot()["blocked_for_s"] == 30.0
@@ -0,0 +1,274 @@
+"""
+test_refresh.py — SkylarkAgent.refresh_data against the in-process mock
+Monday.com API (mock_monday_server), no network or token needed.
+"""
+import asyncio
+
+import pandas as pd
+import pytest
+
+from agent import SkylarkAgent
+from data_cleaner import DEAL_DTYPES, DealsCleaner, compact_frame
+from mock_monday_server import synthetic_fixture
+from snapshot_store import load_snapshot
+
+
+@pytest.fixture
+def make_agent(monkeypatch, mock_monday):
+    """make_agent(fixture, deals="1001", **options) → (agent, mock state), the agent's client talking to the mock."""
+    def _make(fixture, deals="1001", **options):
+        monkeypatch.setenv("MONDAY_API_TOKEN", "mock")
+        monkeypatch.setenv("DEALS_BOARD_ID", deals)
+        monkeypatch.setenv("WORKORDERS_BOARD_ID", "1002")
+        monkeypatch.setenv("MONDAY_SNAPSHOT_PATH", "")
+        monkeypatch.setenv("GROQ_API_KEY", "")
+        bi = SkylarkAgent()
+        return bi, mock_monday(bi.monday, fixture, **options)
+    return _make
+
+
+def unknown_sector_share(df):
+    return (df["sector"].astype(str) == "unknown").mean()
+
+
+def move_column(board, old_id, new_id):
+    """Re-create a column under a new id (as when a Monday column is replaced)."""
+    for column in board["columns"]:
+        if column["id"] == old_id:
+            column["id"] = new_id
+    for item in board["items"]:
+        for cv in item["column_values"]:
+            if cv["id"] == old_id:
+                cv["id"] = new_id
+
+
+def add_extra_columns(board, n):
+    """Add n text columns no cleaner reads, filled on every item."""
+    for k in range(n):
+        board["columns"].append({"id": f"extra_{k}", "title": f"Notes {k}", "type": "text"})
+        for item in board["items"]:
+            item["column_values"].append({"id": f"extra_{k}", "text": f"note {k}", "value": f'"note {k}"'})
+
+
+def add_item(board, item_id):
+    """Append a copy of the first item as the most recently updated one, so the change probe moves."""
+    first = board["items"][0]
+    board["items"].append({
+        **first,
+        "id": item_id,
+        "updated_at": "2999-01-01",
+        "column_values": [dict(cv) for cv in first["column_values"]],
+    })
+
+
+def test_column_layout_change_refetches_with_new_allowlist(make_agent):
+    fixture = synthetic_fixture(400, 200)
+    bi, _ = make_agent(fixture)
+
+    async def scenario():
+        await bi.refresh_data(full=True)
+        before = unknown_sector_share(bi.deals_df)
+
+        deals = fixture["boards"]["1001"]
+        move_column(deals, "sector", "sector_v2")
+        add_item(deals, "19999999")
+        result = await bi.refresh_data()
+        return before, result
+
+    before, result = asyncio.run(scenario())
+    assert before < 0.2
+    assert abs(unknown_sector_share(bi.deals_df) - before) < 0.02
+    assert len(bi.deals_df) == 401
+    assert result["schema_changed"] == ["1001"]
+    assert result["sync"]["1001"]["mode"] == "full"
+    assert "sector_v2" in bi._column_allowlists["1001"]
+
+    # The next delta refresh keeps the new column
+    add_item(fixture["boards"]["1001"], "19999998")
+    result = asyncio.run(bi.refresh_data())
+    assert result["sync"]["1001"]["mode"] == "delta"
+    assert abs(unknown_sector_share(bi.deals_df) - before) < 0.02
+
+
+def test_column_layout_change_without_delta_sync(make_agent, monkeypatch):
+    monkeypatch.setenv("MONDAY_DELTA_SYNC", "false")
+    fixture = synthetic_fixture(300, 100)
+    bi, _ = make_agent(fixture)
+
+    asyncio.run(bi.refresh_data(full=True))
+    before = unknown_sector_share(bi.deals_df)
+    move_column(fixture["boards"]["1001"], "sector", "sector_v2")
+    add_item(fixture["boards"]["1001"], "19999999")
+    asyncio.run(bi.refresh_data())
+
+    assert abs(unknown_sector_share(bi.deals_df) - before) < 0.02
+
+
+@pytest.mark.parametrize("delta_sync", ["true", "false"])
+def test_snapshot_round_trip(make_agent, monkeypatch, tmp_path, delta_sync):
+    monkeypatch.setenv("MONDAY_DELTA_SYNC", delta_sync)
+    fixture = synthetic_fixture(300, 150)
+    path = str(tmp_path / "snapshot.json.gz")
+    bi, _ = make_agent(fixture)
+    bi.snapshot_path = path
+    asyncio.run(bi.refresh_data(full=True))
+
+    restored, mock = make_agent(fixture)
+    restored.snapshot_path = path
+    result = restored.load_snapshot()
+
+    assert mock.requests == 0
+    assert result["deals_loaded"] == len(bi.deals_df)
+    assert result["workorders_loaded"] == len(bi.workorders_df)
+    pd.testing.assert_frame_equal(restored.deals_df, bi.deals_df)
+    pd.testing.assert_frame_equal(restored.workorders_df, bi.workorders_df)
+    if delta_sync == "false":
+        # Only the columns the cleaners read are written
+        saved = load_snapshot(path)["boards"]["1001"]["items"][0]
+        assert set(saved) - {"_item_id", "_item_name"} <= set(bi._column_allowlists["1001"])
+
+
+@pytest.mark.parametrize("delta_sync", ["true", "false"])
+def test_snapshot_keeps_board_that_failed_to_refresh(make_agent, monkeypatch, tmp_path, delta_sync):
+    monkeypatch.setenv("MONDAY_DELTA_SYNC", delta_sync)
+    fixture = synthetic_fixture(300, 150)
+    path = str(tmp_path / "snapshot.json.gz")
+    bi, _ = make_agent(fixture)
+    bi.snapshot_path = path
+    asyncio.run(bi.refresh_data(full=True))
+    work_orders = bi.workorders_df
+
+    fixture["boards"].pop("1002")
+    result = asyncio.run(bi.refresh_data(full=True))
+    assert result["workorders_stale"] is True
+
+    restored, _ = make_agent(fixture)
+    restored.snapshot_path = path
+    loaded = restored.load_snapshot()
+    assert loaded["deals_loaded"] == 300
+    assert loaded["workorders_loaded"] == 150
+    pd.testing.assert_frame_equal(restored.workorders_df, work_orders)
+
+
+def test_overlapping_refreshes_run_one_after_the_other(make_agent):
+    bi, _ = make_agent(synthetic_fixture(200, 100))
+
+    async def scenario():
+        return await asyncio.gather(bi.refresh_data(), bi.refresh_data())
+
+    first, second = asyncio.run(scenario())
+    assert first["sync"]["1001"]["mode"] == "full"
+    assert second.get("unchanged") is True
+
+
+def test_webhook_drops_item_moved_to_another_board(make_agent):
+    fixture = synthetic_fixture(200, 100)
+    bi, _ = make_agent(fixture)
+    asyncio.run(bi.refresh_data(full=True))
+    before = len(bi.deals_df)
+
+    deals = fixture["boards"]["1001"]["items"]
+    moved = deals.pop(0)
+    fixture["boards"]["1002"]["items"].append(moved)
+    event = {"boardId": 1001, "pulseId": int(moved["id"]), "type": "move_pulse_into_board"}
+    result = asyncio.run(bi.apply_webhook_event(event))
+
+    assert result["action"] == "delete"
+    assert len(bi.deals_df) == before - 1
+    assert moved["id"] not in set(bi.deals_df["item_id"])
+
+
+def test_same_kind_boards_merge_with_source_board(make_agent):
+    fixture = synthetic_fixture(300, 100)
+    extra = synthetic_fixture(200, 0, seed=7)["boards"]["1001"]
+    for n, item in enumerate(extra["items"]):
+        item["id"] = str(30_000_000 + n)
+    move_column(extra, "sector", "sector_v2")  # its own layout, cleaned with its own schema
+    fixture["boards"]["1003"] = extra
+    bi, _ = make_agent(fixture, deals="1001,1003")
+
+    result = asyncio.run(bi.refresh_data(full=True))
+
+    assert result["deals_loaded"] == 500
+    assert bi.deals_df["source_board"].astype(str).value_counts().to_dict() == {"1001": 300, "1003": 200}
+    assert bi.deals_df["item_id"].is_unique
+    from_extra = bi.deals_df[bi.deals_df["source_board"] == "1003"]
+    assert unknown_sector_share(from_extra) < 0.2
+    assert set(bi.workorders_df["source_board"].astype(str)) == {"1002"}
+
+
+def test_unchanged_refresh_costs_one_request(make_agent):
+    fixture = synthetic_fixture(300, 100)
+    bi, mock = make_agent(fixture)
+    asyncio.run(bi.refresh_data(full=True))
+    deals = bi.deals_df
+
+    before = mock.requests
+    result = asyncio.run(bi.refresh_data())
+    assert result["unchanged"] is True
+    assert mock.requests - before == 1
+    assert bi.deals_df is deals
+
+    add_item(fixture["boards"]["1001"], "19999999")
+    result = asyncio.run(bi.refresh_data())
+    assert "unchanged" not in result
+    assert len(bi.deals_df) == 301
+
+
+def test_numbers_typed_code_columns_stay_text(make_agent):
+    fixture = synthetic_fixture(200, 50)
+    deals = fixture["boards"]["1001"]
+    for column in deals["columns"]:
+        if column["id"] in ("client", "owner"):
+            column["type"] = "numbers"
+    for n, item in enumerate(deals["items"]):
+        for cv in item["column_values"]:
+            if cv["id"] in ("client", "owner"):
+                code = str(1000 + n % 7)
+                cv["text"], cv["value"] = code, f'"{code}"'
+    bi, _ = make_agent(fixture)
+    asyncio.run(bi.refresh_data(full=True))
+
+    # What the cleaner built from display text before typed decoding
+    plain = [
+        {"_item_id": item["id"], "_item_name": item["name"],
+         **{cv["id"]: cv["text"] or cv["value"] or "" for cv in item["column_values"]}}
+        for item in deals["items"]
+    ]
+    expected = DealsCleaner(bi.monday.cached_schema("1001")).add_page(plain).to_frame()
+    expected, _ = compact_frame(expected.assign(source_board="1001"), DEAL_DTYPES, measure=False)
+    pd.testing.assert_frame_equal(bi.deals_df, expected)
+    assert set(bi.deals_df["client_code"].astype(str)) == {str(1000 + n) for n in range(7)}
+
+
+def test_cold_refresh_fetches_and_caches_only_allowlisted_columns(make_agent):
+    fixture = synthetic_fixture(3000, 100)
+    add_extra_columns(fixture["boards"]["1001"], 30)
+    bi, _ = make_agent(fixture)
+
+    cold = asyncio.run(bi.refresh_data())
+    keep = {"_item_id", "_item_name", *bi._column_allowlists["1001"]}
+    cached = bi.monday.export_sync_state()["1001"]["items"]
+    assert len(cached) == 3000
+    assert all(set(item) <= keep for item in cached)
+
+    # Only the batched first page is fetched before the allowlist is known
+    warm = asyncio.run(bi.refresh_data(full=True))
+    assert cold["fetch"]["bytes"] < 1.6 * warm["fetch"]["bytes"]
+
+
+def test_restored_wide_cache_shrinks_to_allowlist(make_agent):
+    fixture = synthetic_fixture(200, 50)
+    add_extra_columns(fixture["boards"]["1001"], 5)
+    bi, _ = make_agent(fixture)
+    wide = [
+        {"_item_id": item["id"], "_item_name": item["name"], **{cv["id"]: cv["text"] for cv in item["column_values"]}}
+        for item in fixture["boards"]["1001"]["items"]
+    ]
+    schema = asyncio.run(bi.monday.get_board_schema("1001"))
+    bi.monday.restore_sync_state({"1001": {"schema": schema, "items": wide, "since": "2000-01-01"}})
+
+    bi._learn_schema("deals", "1001", schema)
+    keep = {"_item_id", "_item_name", *bi._column_allowlists["1001"]}
+    assert len(keep) < len(wide[0])
+    assert all(set(item) <= keep for item in bi.monday.export_sync_state()["1001"]["items"])